@@ -1,3 +1,5 @@
+import importlib
+
 from .base import DOUBLE_PRECISION
 from .base import REAL
 from sqlalchemy.sql.sqltypes import BLOB
@@ -8,7 +10,6 @@ from sqlalchemy.sql.sqltypes import NVARCHAR
 from sqlalchemy.sql.sqltypes import VARCHAR
 
 from . import base  # noqa
-from . import pyodbc
 from .base import BFILE
 from .base import BINARY_DOUBLE
 from .base import BINARY_FLOAT
@@ -24,15 +25,6 @@ from .base import ROWID
 from .base import TIMESTAMP
 from .base import VARCHAR2
 
-# TODO: 비동기 프로그램밍 지원하기
-# Alias oracledb also as oracledb_async
-# oracledb_async = type(
-#     "oracledb_async", (ModuleType,), {"dialect": oracledb.dialect_async}
-# )
-
-
-base.dialect = dialect = pyodbc.TiberoDialect_pyodbc
-
 # TODO: 티베로에서 지원안되는 타입들이 있는지 확인해보기
 __all__ = (
     "VARCHAR",
@@ -62,15 +54,15 @@ __all__ = (
 
 __version__ = "2.0.0a15"
 
-# TODO: 내가 (전영배)가 알기로는 setup.py에 다음의 라인을 추가하면 자동으로 register되는 것으로 알고 있습니다.
-#         entry_points = {
-#             "sqlalchemy.dialects": [
-#                 "tibero.pyodbc = sqlalchemy_tibero.pyodbc:TiberoDialect_pyodbc",
-#             ]
-#         },
-#       하지만 자동으로 등록이 되지 않아 아래왜 같이 트릭을 썼습니다. 자세히 이유 분석 및 해결이 필요합니다.
-from sqlalchemy.dialects import registry as _registry
+# pyodbc 드라이버와 dialect 모듈은 dialect을 처음 사용할 때 import합니다.
+# create_engine()은 setup.cfg의 sqlalchemy.dialects entry point로 dialect을 찾기
+# 때문에 여기서 registry에 등록하지 않습니다.
+_lazy_submodules = ("aioodbc", "pyodbc", "dictionary")
 
-_registry.register(
-    "tibero", "sqlalchemy_tibero.pyodbc", "TiberoDialect_pyodbc"
-)
+
+def __getattr__(name):
+    if name == "dialect":
+        return base.dialect
+    elif name in _lazy_submodules:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
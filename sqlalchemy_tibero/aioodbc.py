@@ -0,0 +1,153 @@
+# tibero/aioodbc.py
+# Copyright (C) 2024-2024 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+r"""
+Support for the Tibero database in asyncio style, using the aioodbc driver
+which itself is a thread-wrapper around pyodbc.
+
+This dialect should normally be used only with the
+:func:`_asyncio.create_async_engine` engine creation function::
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(
+        "tibero+aioodbc://@Tibero7", max_workers=16
+    )
+
+``max_workers`` bounds the thread pool that runs the blocking pyodbc calls.
+Every connection of the engine shares that pool, so at most ``max_workers``
+driver calls are running at any given time.  :meth:`.AsyncEngine.dispose`
+shuts the thread pool down, and connections checked out after that use a
+new one; connections that are still checked out while the engine is
+disposed can no longer run statements.
+
+The ``statement_timeout`` argument and the ``tibero_timeout`` execution
+option are not supported, because the adapted cursor cannot be cancelled.
+
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import event, exc, util
+from sqlalchemy.connectors.aioodbc import (
+    AsyncAdapt_aioodbc_connection,
+    AsyncAdapt_aioodbc_dbapi,
+    aiodbcConnector,
+)
+from sqlalchemy.connectors.asyncio import AsyncAdaptFallback_dbapi_connection
+from sqlalchemy.util.concurrency import await_fallback, await_only
+
+from .pyodbc import TiberoDialect_pyodbc, TiberoExecutionContext_pyodbc
+
+
+class AsyncAdapt_tibero_aioodbc_connection(AsyncAdapt_aioodbc_connection):
+    __slots__ = ()
+
+    def setdecoding(self, *arg, **kw):
+        # aioodbc의 Connection은 setdecoding()을 감싸지 않기 때문에 내부의 pyodbc
+        # connection에 직접 호출합니다. 블로킹 호출이 아니라서 executor가 필요없습니다.
+        self._connection._conn.setdecoding(*arg, **kw)
+
+
+class AsyncAdaptFallback_tibero_aioodbc_connection(
+    AsyncAdaptFallback_dbapi_connection, AsyncAdapt_tibero_aioodbc_connection
+):
+    __slots__ = ()
+
+
+class AsyncAdapt_tibero_aioodbc_dbapi(AsyncAdapt_aioodbc_dbapi):
+    def _init_dbapi_attributes(self):
+        super()._init_dbapi_attributes()
+        # 티베로 타입들의 get_dbapi_type()은 pyodbc.SQL_TYPE_DATE와 같은 상수를
+        # 사용합니다. SQLAlchemy의 어댑터는 일부만 복사하므로 나머지도 복사합니다.
+        for name in dir(self.pyodbc):
+            if name.startswith("SQL_"):
+                setattr(self, name, getattr(self.pyodbc, name))
+
+    def connect(self, *arg, **kw):
+        async_fallback = kw.pop("async_fallback", False)
+        creator_fn = kw.pop("async_creator_fn", self.aioodbc.connect)
+
+        if util.asbool(async_fallback):
+            return AsyncAdaptFallback_tibero_aioodbc_connection(
+                self,
+                await_fallback(creator_fn(*arg, **kw)),
+            )
+        else:
+            return AsyncAdapt_tibero_aioodbc_connection(
+                self,
+                await_only(creator_fn(*arg, **kw)),
+            )
+
+
+class TiberoExecutionContext_aioodbc(TiberoExecutionContext_pyodbc):
+    def pre_exec(self):
+        super().pre_exec()
+        # aioodbc 어댑터의 cursor에는 cancel()이 없으므로 제한 시간을 넘은 문장을
+        # 취소할 수 없습니다.
+        if self._tibero_timeout:
+            raise exc.ArgumentError(
+                "tibero_timeout is not supported by the aioodbc dialect"
+            )
+
+    def create_server_side_cursor(self):
+        c = self._dbapi_connection.cursor(server_side=True)
+        c.arraysize = self._server_side_arraysize()
+        return c
+
+
+class TiberoDialectAsync_aioodbc(aiodbcConnector, TiberoDialect_pyodbc):
+    driver = "aioodbc"
+
+    supports_statement_cache = True
+
+    execution_ctx_cls = TiberoExecutionContext_aioodbc
+
+    def __init__(self, max_workers=None, **kwargs):
+        if kwargs.get("statement_timeout"):
+            raise exc.ArgumentError(
+                "statement_timeout is not supported by the aioodbc dialect"
+            )
+        super().__init__(**kwargs)
+        # None이면 ThreadPoolExecutor의 기본값인 min(32, cpu 개수 + 4)를 따릅니다.
+        self.max_workers = max_workers
+
+    @classmethod
+    def import_dbapi(cls):
+        return AsyncAdapt_tibero_aioodbc_dbapi(
+            __import__("aioodbc"), TiberoDialect_pyodbc.import_dbapi()
+        )
+
+    @util.memoized_property
+    def _executor(self):
+        # aioodbc는 executor를 지정하지 않으면 event loop의 기본 executor를 사용합니다.
+        # 다른 라이브러리와 공유되지 않도록 엔진마다 크기가 제한된 풀을 따로 둡니다.
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="sqlalchemy_tibero_aioodbc",
+        )
+
+    @classmethod
+    def engine_created(cls, engine):
+        super().engine_created(engine)
+        event.listen(
+            engine, "engine_disposed", engine.dialect._shutdown_executor
+        )
+
+    def _shutdown_executor(self, engine):
+        # 다음에 연결할 때 새 풀을 만듭니다. 실행 중인 호출은 기다리지 않습니다.
+        executor = self.__dict__.pop("_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def create_connect_args(self, url):
+        arg, kw = super().create_connect_args(url)
+        kw.setdefault("executor", self._executor)
+        return arg, kw
+
+
+dialect = TiberoDialectAsync_aioodbc
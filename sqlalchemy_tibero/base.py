@@ -4,10 +4,14 @@
 Support for the TmaxData Tibero database.
 """
 
+import collections
 from collections import defaultdict
 from functools import lru_cache
 from functools import wraps
+import importlib
 import re
+import threading
+import time
 
 from sqlalchemy import util
 from sqlalchemy import exc
@@ -15,8 +19,11 @@ from sqlalchemy import sql
 from sqlalchemy import schema as sa_schema
 
 from sqlalchemy import Computed
+from sqlalchemy import pool
 
+from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default
+from sqlalchemy.engine import interfaces
 from sqlalchemy.engine import reflection
 from sqlalchemy.engine import ObjectKind
 from sqlalchemy.engine import ObjectScope
@@ -39,7 +46,6 @@ from sqlalchemy.types import INTEGER
 from sqlalchemy.types import DOUBLE_PRECISION
 from sqlalchemy.types import REAL
 
-from . import dictionary
 from .types import _TiberoBoolean
 from .types import _TiberoDate
 from .types import BFILE
@@ -59,6 +65,34 @@ from .types import TIMESTAMP
 from .types import VARCHAR2  # noqa
 
 
+class _LazyModule:
+    """A module that is imported when one of its attributes is first used."""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, key):
+        module = importlib.import_module(self._name, __package__)
+        value = getattr(module, key)
+        setattr(self, key, value)
+        return value
+
+
+# dictionary 모듈은 import할 때 딕셔너리 뷰의 Table을 모두 만듭니다. reflection을
+# 하지 않는 애플리케이션은 필요없으므로 처음 사용할 때 import합니다.
+dictionary = _LazyModule(".dictionary")
+
+
+def __getattr__(name):
+    # 기본 드라이버인 pyodbc의 dialect입니다. pyodbc 모듈은 처음 사용할 때
+    # import합니다.
+    if name == "dialect":
+        from .pyodbc import TiberoDialect_pyodbc
+
+        return TiberoDialect_pyodbc
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # TODO: 여기 있는 모든 키워드가 티베로에서 지원되는지 확인하기
 #       지원안되는 게 몇 개 있더라도 뺴면 안됩니다. 나중에 지원될 수 있기 때문입니다.
 RESERVED_WORDS = set(
@@ -937,14 +971,144 @@ class TiberoIdentifierPreparer(compiler.IdentifierPreparer):
         return super().format_savepoint(savepoint, name)
 
 
+class _ResultCache:
+    """LRU cache of fetched rows with a time-to-live per entry.
+
+    Entries are keyed by the SQL string and bind values of a SELECT and
+    remember the names of the tables it reads so that they can be
+    invalidated per table.
+    """
+
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        # invalidate()가 호출될 때마다 증가합니다. 실행 전에 읽은 값과 다르면 실행
+        # 중에 다른 connection이 commit한 변경을 놓쳤을 수 있으므로 저장하지 않습니다.
+        self.generation = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, rows, description, tables, generation, ttl=None):
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (expires, rows, description, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tables=None):
+        with self._lock:
+            self.generation += 1
+            if not self._entries:
+                return
+            if tables is None:
+                self._entries.clear()
+                return
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if not entry[3].isdisjoint(tables)
+            ]:
+                del self._entries[key]
+
+
+def _table_names(tables):
+    # 대소문자, schema 포함 여부와 관계없이 비교할 수 있도록 두 이름을 모두 넣습니다.
+    names = set()
+    for table in tables:
+        if isinstance(table, str):
+            name, schema = table, None
+            if "." in table:
+                schema, name = table.rsplit(".", 1)
+        else:
+            name, schema = table.name, table.schema
+        names.add(name.lower())
+        if schema is not None:
+            names.add(f"{schema}.{name}".lower())
+    return names
+
+
+# connection record의 info에 현재 transaction에서 변경한 테이블 이름을 저장하는
+# key입니다. TiberoDialect._invalidate_pending_writes() 참조
+_PENDING_WRITES = "_tibero_pending_writes"
+# connection record의 info에 현재 transaction에서 미리 가져온 값을 사용한
+# sequence의 문장을 저장하는 key입니다. TiberoDialect.do_rollback() 참조
+_SEQUENCES_USED = "_tibero_sequences_used"
+
+
 class TiberoExecutionContext(default.DefaultExecutionContext):
+    _tibero_result_cache_key = None
+    _tibero_result_cache_generation = None
+    _tibero_cached_result = None
+
     def fire_sequence(self, seq, type_):
-        return self._execute_scalar(
+        stmt = (
             "SELECT "
             + self.identifier_preparer.format_sequence(seq)
-            + ".nextval FROM DUAL",
-            type_,
+            + ".nextval FROM DUAL"
+        )
+        size = self.dialect._sequence_prefetch_size(seq)
+        if size <= 1:
+            return self._execute_scalar(stmt, type_)
+
+        if "schema_translate_map" in self.execution_options:
+            stmt = self.identifier_preparer._render_schema_translates(
+                stmt, self.execution_options["schema_translate_map"]
+            )
+
+        # 미리 가져온 값은 engine의 모든 connection이 함께 사용합니다. deque의
+        # popleft()는 thread-safe하므로 lock이 필요없습니다.
+        cache = self.dialect._sequence_cache.setdefault(
+            stmt, collections.deque()
+        )
+        if (
+            self.dialect.sequence_prefetch_discard_on_rollback
+            and not self.root_connection._is_autocommit_isolation()
+        ):
+            self.root_connection.info.setdefault(_SEQUENCES_USED, set()).add(
+                stmt
+            )
+        try:
+            return cache.popleft()
+        except IndexError:
+            pass
+
+        values = self._fetch_sequence_values(stmt, size, type_)
+        cache.extend(values[1:])
+        return values[0]
+
+    def _fetch_sequence_values(self, stmt, size, type_):
+        # nextval은 CONNECT BY로 만든 행마다 한번씩 증가합니다.
+        stmt = f"{stmt} CONNECT BY LEVEL <= {int(size)}"
+        if self.dialect.positional:
+            parameters = self.dialect.execute_sequence_format()
+        else:
+            parameters = {}
+
+        self.root_connection._cursor_execute(
+            self.cursor, stmt, parameters, context=self
         )
+        values = [row[0] for row in self.cursor.fetchall()]
+        if type_ is not None:
+            proc = type_._cached_result_processor(
+                self.dialect, self.cursor.description[0][1]
+            )
+            if proc:
+                values = [proc(value) for value in values]
+        return values
 
     def pre_exec(self):
         if self.statement and "_tibero_dblink" in self.execution_options:
@@ -953,6 +1117,111 @@ class TiberoExecutionContext(default.DefaultExecutionContext):
                 self.execution_options["_tibero_dblink"],
             )
 
+        if self.dialect._result_cache is None:
+            return
+        if self.is_crud:
+            # 변경한 테이블의 결과는 transaction이 끝날 때 버립니다. 다른 connection은
+            # commit하기 전까지 변경된 데이터를 볼 수 없습니다.
+            table = getattr(self.compiled.statement, "table", None)
+            if table is not None:
+                self.root_connection.info.setdefault(
+                    _PENDING_WRITES, set()
+                ).update(_table_names([table]))
+        elif self._may_write():
+            # text(), exec_driver_sql() 등으로 실행한 문장은 변경하는 테이블을 알 수
+            # 없으므로 None을 저장합니다. transaction이 끝날 때 모든 결과를 버리고 그
+            # 전까지 이 connection의 결과는 저장하지 않습니다.
+            self.root_connection.info.setdefault(_PENDING_WRITES, set()).add(
+                None
+            )
+        elif self.execution_options.get("tibero_result_cache"):
+            self._lookup_result_cache()
+
+    def _may_write(self):
+        if self.isddl or not self.statement:
+            return False
+        if self.compiled is not None and getattr(
+            self.compiled.statement, "is_select", False
+        ):
+            return False
+        # 컴파일된 SELECT가 아닌 문장은 SELECT, WITH로 시작하는 것만 읽기로 봅니다.
+        words = self.statement.lstrip(" \t\r\n(").split(None, 1)
+        return not words or words[0].upper() not in ("SELECT", "WITH")
+
+    def _lookup_result_cache(self):
+        # tibero_result_cache 실행 옵션을 사용한 SELECT의 결과 행을 저장해두고 같은
+        # SQL과 bind 값으로 다시 실행하면 데이터베이스에 보내지 않고 저장된 행을
+        # 돌려줍니다. SQL 문자열은 compiled cache key로 만들어지므로 bind 값과 함께
+        # key로 사용합니다.
+        # commit하지 않은 변경이 있는 connection의 결과는 다른 connection에서 볼 수
+        # 없으므로 저장하지 않고, 저장된 결과에는 그 변경이 없으므로 사용하지 않습니다.
+        if (
+            self.compiled is None
+            or not getattr(self.compiled.statement, "is_select", False)
+            or self.execute_style is not interfaces.ExecuteStyle.EXECUTE
+            or self._is_server_side
+            or self.root_connection.info.get(_PENDING_WRITES)
+        ):
+            return
+
+        parameters = self.parameters[0]
+        if isinstance(parameters, dict):
+            parameters = tuple(sorted(parameters.items()))
+        else:
+            parameters = tuple(parameters)
+        key = (self.statement, parameters)
+        try:
+            hash(key)
+        except TypeError:
+            return
+
+        cache = self.dialect._result_cache
+        self._tibero_result_cache_key = key
+        self._tibero_result_cache_generation = cache.generation
+        self._tibero_cached_result = cache.get(key)
+
+    def post_exec(self):
+        key = self._tibero_result_cache_key
+        if key is None:
+            if self.dialect._result_cache is not None:
+                self._invalidate_committed_writes()
+            return
+
+        if self._tibero_cached_result is not None:
+            _, rows, description, _ = self._tibero_cached_result
+        else:
+            description = self.cursor.description
+            # DBAPI의 행 객체는 변경할 수 있으므로 tuple로 저장합니다.
+            rows = tuple(tuple(row) for row in self.cursor.fetchall())
+            ttl = self.execution_options["tibero_result_cache"]
+            self.dialect._result_cache.put(
+                key,
+                rows,
+                description,
+                _table_names(
+                    sql_util.find_tables(
+                        self.compiled.statement, include_crud=False
+                    )
+                ),
+                self._tibero_result_cache_generation,
+                ttl=None if ttl is True else ttl,
+            )
+
+        self.cursor_fetch_strategy = _cursor.FullyBufferedCursorFetchStrategy(
+            self.cursor, description, initial_buffer=rows
+        )
+
+    def _invalidate_committed_writes(self):
+        # DDL은 실행 전후에 commit되고, AUTOCOMMIT에서는 문장마다 commit됩니다.
+        # DDL이 변경한 테이블은 알 수 없으므로 모든 결과를 버립니다.
+        if self.isddl:
+            self.root_connection.info.pop(_PENDING_WRITES, None)
+            self.dialect.invalidate_result_cache()
+        elif self.root_connection._is_autocommit_isolation():
+            tables = self.root_connection.info.pop(_PENDING_WRITES, None)
+            if tables:
+                self.dialect._invalidate_tables(tables)
+
 
 class TiberoDialect(default.DefaultDialect):
     name = "oracle"
@@ -1025,9 +1294,39 @@ class TiberoDialect(default.DefaultDialect):
         use_nchar_for_unicode=False,
         exclude_tablespaces=("SYSTEM", "SYSSUB"),
         enable_offset_fetch=True,
+        sequence_prefetch_size=1,
+        sequence_prefetch_sizes=None,
+        sequence_prefetch_discard_on_rollback=False,
+        result_cache_size=0,
+        result_cache_ttl=60,
         **kwargs,
     ):
         default.DefaultDialect.__init__(self, **kwargs)
+        # INSERT에 필요한 sequence 값을 fire_sequence()에서 한번에 몇 개씩 가져올지
+        # 정합니다. 1이면 값이 필요할 때마다 하나씩 가져옵니다.
+        # sequence_prefetch_sizes는 sequence 이름(schema가 있으면 "schema.name")별로
+        # 다른 크기를 지정합니다. 예: {"order_id_seq": 100}
+        self.sequence_prefetch_size = sequence_prefetch_size
+        self.sequence_prefetch_sizes = sequence_prefetch_sizes or {}
+        # sequence 값은 rollback해도 되돌려지지 않으므로 미리 가져온 값을 계속 사용할
+        # 수 있습니다. 번호가 비는 것을 줄이려면 rollback할 때 버리도록 합니다.
+        # 버리는 것은 rollback된 transaction이 사용한 sequence의 값뿐입니다.
+        self.sequence_prefetch_discard_on_rollback = (
+            sequence_prefetch_discard_on_rollback
+        )
+        # TiberoExecutionContext.fire_sequence() 참조
+        self._sequence_cache = {}
+        # tibero_result_cache 실행 옵션으로 저장하는 결과의 최대 개수와 유효 시간(초)
+        # 입니다. 실행 옵션에 숫자를 주면 그 결과의 유효 시간으로 사용합니다.
+        # result_cache_size가 0(기본값)이면 사용하지 않으며, 실행 옵션은 무시되고
+        # 문장마다 cache를 확인하는 비용도 없습니다.
+        self.result_cache_size = result_cache_size
+        self.result_cache_ttl = result_cache_ttl
+        self._result_cache = (
+            _ResultCache(result_cache_size, result_cache_ttl)
+            if result_cache_size
+            else None
+        )
         self._use_nchar_for_unicode = use_nchar_for_unicode
         self.use_ansi = use_ansi
         self.optimize_limits = optimize_limits
@@ -1036,6 +1335,79 @@ class TiberoDialect(default.DefaultDialect):
             enable_offset_fetch
         )
 
+    def _sequence_prefetch_size(self, seq):
+        sizes = self.sequence_prefetch_sizes
+        if sizes:
+            if seq.schema is not None:
+                size = sizes.get(f"{seq.schema}.{seq.name}")
+                if size is not None:
+                    return size
+            size = sizes.get(seq.name)
+            if size is not None:
+                return size
+        return self.sequence_prefetch_size
+
+    def invalidate_result_cache(self, *tables):
+        """Discard results cached with the ``tibero_result_cache`` execution
+        option.
+
+        :param tables: :class:`.Table` objects or table names, optionally
+         schema-qualified as ``"schema.name"``.  Only results that read one
+         of these tables are discarded.  All results are discarded when no
+         table is given.
+        """
+        if self._result_cache is not None:
+            self._result_cache.invalidate(
+                _table_names(tables) if tables else None
+            )
+
+    def do_commit(self, dbapi_connection):
+        super().do_commit(dbapi_connection)
+        info = self._connection_info(dbapi_connection)
+        if info is not None:
+            info.pop(_SEQUENCES_USED, None)
+            self._invalidate_pending_writes(info)
+
+    def do_rollback(self, dbapi_connection):
+        info = self._connection_info(dbapi_connection)
+        # pool이 connection을 돌려받을 때 하는 rollback처럼 sequence를 사용하지
+        # 않은 transaction의 rollback은 다른 connection이 가져온 값을 버리지 않습니다.
+        stmts = info.pop(_SEQUENCES_USED, None) if info is not None else None
+        if stmts:
+            for stmt in stmts:
+                self._sequence_cache.pop(stmt, None)
+        super().do_rollback(dbapi_connection)
+        if info is not None:
+            self._invalidate_pending_writes(info)
+
+    def _connection_info(self, dbapi_connection):
+        # do_commit(), do_rollback()에는 pool의 connection proxy가 전달되며 info는
+        # connection record의 info입니다.
+        if not isinstance(dbapi_connection, pool.PoolProxiedConnection):
+            return None
+        try:
+            return dbapi_connection.info
+        except NotImplementedError:
+            # 첫 연결 때 전달되는 임시 proxy에는 info가 없고, 아직 실행한 문장도
+            # 없습니다.
+            return None
+
+    def _invalidate_pending_writes(self, info):
+        # transaction에서 변경한 테이블의 결과를 버립니다.
+        if self._result_cache is None:
+            return
+        tables = info.pop(_PENDING_WRITES, None)
+        if tables:
+            self._invalidate_tables(tables)
+
+    def _invalidate_tables(self, tables):
+        # None은 변경한 테이블을 알 수 없는 문장을 실행했다는 뜻입니다.
+        # TiberoExecutionContext.pre_exec() 참조
+        if None in tables:
+            self.invalidate_result_cache()
+        else:
+            self.invalidate_result_cache(*tables)
+
     def initialize(self, connection):
         super().initialize(connection)
 
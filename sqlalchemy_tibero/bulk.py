@@ -0,0 +1,135 @@
+# tibero/bulk.py
+# Copyright (C) 2024-2024 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+"""
+Insert rows from an iterable or generator without materializing them.
+
+::
+
+    from sqlalchemy_tibero.bulk import bulk_insert
+
+    def rows():
+        for line in open("data.csv"):
+            id_, name = line.rstrip("\\n").split(",")
+            yield {"id": int(id_), "name": name}
+
+    with engine.connect() as conn:
+        stats = bulk_insert(
+            conn,
+            my_table,
+            rows(),
+            batch_size=10000,
+            commit_every=100000,
+            progress=lambda stats: print(
+                f"{stats.rows} rows, {stats.rows_per_second:.0f} rows/s"
+            ),
+        )
+
+At most ``batch_size`` rows are held in memory at any time.  Each batch is
+sent with a single ``executemany()`` through
+:meth:`.TiberoDialect_pyodbc.do_executemany`, with ``fast_executemany``
+array binding enabled unless ``fast_executemany=False`` is passed; the
+dialect's ``fast_executemany_memory_limit`` still applies within a batch.
+
+"""
+
+import itertools
+import time
+
+from sqlalchemy import exc, sql
+
+
+class BulkInsertStats:
+    """Progress of a :func:`.bulk_insert` call."""
+
+    __slots__ = ("batches", "commits", "elapsed", "rows")
+
+    def __init__(self):
+        self.rows = 0
+        self.batches = 0
+        self.commits = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(rows={self.rows}, "
+            f"batches={self.batches}, commits={self.commits}, "
+            f"elapsed={self.elapsed:.3f})"
+        )
+
+
+def bulk_insert(
+    connection,
+    table,
+    rows,
+    batch_size=10000,
+    commit_every=None,
+    progress=None,
+    fast_executemany=True,
+):
+    """Insert the dictionaries produced by ``rows`` in batches.
+
+    :param connection: a :class:`.Connection`.
+    :param table: a :class:`.Table` or an :func:`.insert` construct.
+    :param rows: any iterable of parameter dictionaries.  It is consumed
+     lazily, ``batch_size`` rows at a time.
+    :param batch_size: number of rows sent per ``executemany()`` call.
+    :param commit_every: call :meth:`.Connection.commit` after at least this
+     many rows have been inserted since the last commit, and once more at
+     the end.  Rounded up to a whole number of batches.  When ``None``
+     (the default) the transaction is left to the caller.
+    :param progress: callable receiving the :class:`.BulkInsertStats` after
+     every batch.
+    :param fast_executemany: value of the ``tibero_fast_executemany``
+     execution option used for the inserts.
+
+    Returns the final :class:`.BulkInsertStats`.
+    """
+    if batch_size < 1:
+        raise exc.ArgumentError("batch_size must be a positive integer")
+
+    stmt = table if isinstance(table, sql.Insert) else sql.insert(table)
+    # Connection.execution_options()는 connection 자체를 변경하므로 execute()에
+    # 옵션을 전달합니다.
+    execution_options = {"tibero_fast_executemany": fast_executemany}
+
+    stats = BulkInsertStats()
+    uncommitted = 0
+    start = time.perf_counter()
+    rows = iter(rows)
+
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+
+        connection.execute(
+            stmt, batch, execution_options=execution_options
+        )
+        stats.rows += len(batch)
+        stats.batches += 1
+        uncommitted += len(batch)
+
+        if commit_every and uncommitted >= commit_every:
+            connection.commit()
+            stats.commits += 1
+            uncommitted = 0
+
+        stats.elapsed = time.perf_counter() - start
+        if progress is not None:
+            progress(stats)
+
+    if commit_every and uncommitted:
+        connection.commit()
+        stats.commits += 1
+
+    stats.elapsed = time.perf_counter() - start
+    return stats
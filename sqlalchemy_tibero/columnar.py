@@ -0,0 +1,272 @@
+# tibero/columnar.py
+# Copyright (C) 2024-2024 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+"""
+Fetch a result into column arrays instead of Python row objects.
+
+::
+
+    from sqlalchemy_tibero.columnar import fetch_columnar
+
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True).execute(stmt)
+        columns = fetch_columnar(result)  # {"name": numpy.ndarray, ...}
+        table = fetch_columnar(
+            conn.execute(stmt), use_arrow=True
+        )  # pyarrow.Table
+
+Rows are read from the DBAPI cursor with ``fetchmany()`` and copied into
+one preallocated array per column, without building :class:`.Row` objects
+or running SQLAlchemy result processors.  numpy is required; pyarrow is
+only required for ``use_arrow=True``.
+
+Column types are taken from ``cursor.description``:
+
+============================================  ==================  =========
+Tibero type                                   numpy               pyarrow
+============================================  ==================  =========
+NUMBER(p, 0), INTEGER and integer columns     int64               int64
+other NUMBER, BINARY_DOUBLE, BINARY_FLOAT     float64             float64
+DATE, TIMESTAMP                               datetime64[us]      timestamp
+columns fetched as ``datetime.date``          datetime64[D]       date32
+VARCHAR, CHAR, CLOB and anything else         object              inferred
+============================================  ==================  =========
+
+A NUMBER column is only treated as an integer column when its precision
+is known and its scale is 0.  If it turns out to hold a fraction anyway, as
+a computed NUMBER can, the whole column is returned as float64.  Integer
+columns holding a value outside the int64 range are returned as object
+arrays of ``int`` with numpy and as ``decimal128(38, 0)`` with pyarrow.
+Columns that contain NULL are returned as ``numpy.ma.MaskedArray`` with
+numpy, and as arrays with nulls with pyarrow.
+
+"""
+
+import datetime
+import decimal
+
+from sqlalchemy import exc
+
+_INT = "int"
+# int64 범위를 벗어나는 값이 있었던 정수 칼럼입니다. python int로 저장합니다.
+_BIGINT = "bigint"
+_FLOAT = "float"
+_DATETIME = "datetime"
+_DATE = "date"
+_OBJECT = "object"
+
+_numpy_dtypes = {
+    _INT: "int64",
+    _BIGINT: "object",
+    _FLOAT: "float64",
+    _DATETIME: "datetime64[us]",
+    _DATE: "datetime64[D]",
+    _OBJECT: "object",
+}
+
+
+def _import(name):
+    try:
+        return __import__(name)
+    except ImportError as err:
+        raise exc.InvalidRequestError(
+            f"fetch_columnar() requires the {name} package"
+        ) from err
+
+
+def _column_kind(description):
+    type_code = description[1]
+    precision, scale = description[4:6]
+    if type_code is int:
+        return _INT
+    elif type_code is decimal.Decimal:
+        # NUMBER(p, 0)과 INTEGER(NUMBER(38, 0))는 정수로 취급합니다. 계산식의
+        # 결과처럼 scale이 0으로 보고되어도 소수가 있을 수 있으므로
+        # _Column.extend()에서 값을 확인합니다.
+        if precision and scale == 0:
+            return _INT
+        return _FLOAT
+    elif type_code is float:
+        return _FLOAT
+    elif type_code is datetime.datetime:
+        return _DATETIME
+    elif type_code is datetime.date:
+        return _DATE
+    else:
+        return _OBJECT
+
+
+class _Column:
+    """Column array that grows by doubling, so each row is copied once
+    into its final place."""
+
+    def __init__(self, np, kind, capacity, exact=False):
+        self.np = np
+        self.kind = kind
+        # 드라이버가 Decimal을 반환하는 정수 칼럼은 값이 정수인지 확인합니다.
+        self.exact = exact
+        self.size = 0
+        self.data = np.empty(capacity, dtype=_numpy_dtypes[kind])
+        self.mask = None
+
+    def _reserve(self, count):
+        np = self.np
+        capacity = len(self.data)
+        if self.size + count <= capacity:
+            return
+        while self.size + count > capacity:
+            capacity *= 2
+        data = np.empty(capacity, dtype=self.data.dtype)
+        data[: self.size] = self.data[: self.size]
+        self.data = data
+        if self.mask is not None:
+            mask = np.zeros(capacity, dtype=bool)
+            mask[: self.size] = self.mask[: self.size]
+            self.mask = mask
+
+    def extend(self, values):
+        np = self.np
+        count = len(values)
+        self._reserve(count)
+        start, end = self.size, self.size + count
+
+        if None in values:
+            if self.mask is None:
+                self.mask = np.zeros(len(self.data), dtype=bool)
+            self.mask[start:end] = np.fromiter(
+                (value is None for value in values), dtype=bool, count=count
+            )
+            if self.kind in (_INT, _BIGINT, _FLOAT):
+                values = [0 if value is None else value for value in values]
+
+        if self.kind is _INT or self.kind is _BIGINT:
+            integers = [int(value) for value in values]
+            if self.exact and any(
+                i != value for i, value in zip(integers, values)
+            ):
+                # 소수가 있으면 칼럼 전체를 다른 NUMBER 칼럼처럼 float로 바꿉니다.
+                self.kind = _FLOAT
+                self.data = self.data.astype("float64")
+            else:
+                values = integers
+
+        if self.kind is _INT:
+            try:
+                self.data[start:end] = np.fromiter(
+                    values, dtype=self.data.dtype, count=count
+                )
+            except OverflowError:
+                # float로 바꾸면 정밀도를 잃기 때문에 이후의 값도 python int로
+                # 저장합니다.
+                self.kind = _BIGINT
+                self.data = self.data.astype(object)
+                self.data[start:end] = values
+        elif self.kind is _BIGINT:
+            self.data[start:end] = values
+        elif self.kind is _FLOAT or self.kind is _OBJECT:
+            self.data[start:end] = np.fromiter(
+                values, dtype=self.data.dtype, count=count
+            )
+        else:
+            # datetime64는 None을 NaT로 변환합니다.
+            self.data[start:end] = np.array(values, dtype=self.data.dtype)
+        self.size = end
+
+    def to_numpy(self):
+        data = self.data[: self.size]
+        if self.mask is None:
+            return data
+        return self.np.ma.masked_array(data, mask=self.mask[: self.size])
+
+    def to_arrow(self, pa):
+        data = self.data[: self.size]
+        mask = self.mask[: self.size] if self.mask is not None else None
+        if self.kind is _BIGINT:
+            # NUMBER의 최대 정밀도는 38자리입니다. NULL 자리의 값은 mask로
+            # 가려집니다.
+            return pa.array(
+                [decimal.Decimal(value or 0) for value in data.tolist()],
+                type=pa.decimal128(38, 0),
+                mask=mask,
+            )
+        elif self.kind is _OBJECT:
+            # 문자열 등의 타입은 pyarrow가 값으로 추론합니다.
+            return pa.array(data.tolist(), mask=mask)
+        return pa.array(data, type=_arrow_type(pa, self.kind), mask=mask)
+
+
+def fetch_columnar(result, chunk_size=None, use_arrow=False):
+    """Fetch the remaining rows of ``result`` into column arrays.
+
+    :param result: a :class:`.CursorResult` from which no rows have been
+     fetched yet.
+    :param chunk_size: number of rows requested per ``fetchmany()`` call.
+     Defaults to the cursor's ``arraysize``.
+    :param use_arrow: return a ``pyarrow.Table`` instead of a dictionary of
+     numpy arrays.
+
+    The result is closed afterwards.
+    """
+    np = _import("numpy")
+    pa = _import("pyarrow") if use_arrow else None
+
+    cursor = result.cursor
+    strategy = result.cursor_strategy
+    # tibero_result_cache에 저장된 결과처럼 fetch strategy가 행을 가지고 있으면
+    # cursor는 실행되지 않았으므로 strategy의 description을 사용합니다.
+    description = strategy.alternate_cursor_description or (
+        cursor.description if cursor is not None else None
+    )
+    if description is None:
+        raise exc.ResourceClosedError(
+            "This result object does not return rows."
+        )
+
+    names = list(result.keys())
+    if chunk_size is None and hasattr(strategy, "size_cursor"):
+        # arraysize를 결과 행의 크기로 정하는 fetch strategy입니다.
+        strategy.size_cursor(cursor)
+    chunk_size = chunk_size or cursor.arraysize or 1
+    columns = [
+        _Column(
+            np,
+            _column_kind(column),
+            chunk_size,
+            exact=column[1] is decimal.Decimal,
+        )
+        for column in description
+    ]
+
+    # result processor를 거치지 않은 DBAPI 행을 가져옵니다. stream_results 등으로
+    # 미리 가져온 행이 있으면 fetch strategy가 그 행부터 반환합니다.
+    try:
+        while True:
+            rows = strategy.fetchmany(result, cursor, chunk_size)
+            if not rows:
+                break
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+    finally:
+        result._soft_close()
+
+    if use_arrow:
+        return pa.table(
+            {name: column.to_arrow(pa) for name, column in zip(names, columns)}
+        )
+    else:
+        return {
+            name: column.to_numpy() for name, column in zip(names, columns)
+        }
+
+
+def _arrow_type(pa, kind):
+    return {
+        _INT: pa.int64(),
+        _FLOAT: pa.float64(),
+        _DATETIME: pa.timestamp("us"),
+        _DATE: pa.date32(),
+    }[kind]
@@ -0,0 +1,339 @@
+# tibero/lob.py
+# Copyright (C) 2024-2024 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+"""
+Read and write BLOB, CLOB and NCLOB values in chunks instead of all at once.
+
+::
+
+    from sqlalchemy_tibero.lob import execute_lob_streaming
+
+    with engine.connect() as conn:
+        stmt = select(documents.c.id, documents.c.scan)
+        for id_, scan in execute_lob_streaming(conn, stmt):
+            if isinstance(scan, bytes):
+                ...  # small value, fetched inline
+            else:
+                shutil.copyfileobj(scan, open(f"{id_}.pdf", "wb"))
+
+pyodbc reads a LOB column with repeated ``SQLGetData`` calls into a single
+Python object and does not expose the pieces, so streaming is done in SQL:
+:func:`.execute_lob_streaming` rewrites the SELECT so that each LOB column
+is fetched only when ``DBMS_LOB.GETLENGTH()`` is at most
+``inline_threshold``, and selects the ROWID and length of the row in
+addition.  Larger values are returned as :class:`.LOBReader` objects which
+read ``chunk_size`` bytes (BLOB) or characters (CLOB, NCLOB) per round trip
+with ``DBMS_LOB.SUBSTR()``.
+
+The readers run their queries on the same connection, so they must be used
+before the connection is closed or returned to the pool.  LOB columns must
+belong to a table (not a subquery) so that they can be addressed by ROWID.
+
+:func:`.write_lob` is the other direction: it sets the LOB of one row to an
+empty LOB and appends a file object, memoryview or chunk generator to it
+with ``DBMS_LOB.WRITEAPPEND()``, one chunk per round trip::
+
+    from sqlalchemy_tibero.lob import write_lob
+
+    with engine.begin() as conn:
+        conn.execute(documents.insert(), {"id": 1, "scan": None})
+        with open("scan.pdf", "rb") as f:
+            write_lob(conn, documents.c.scan, documents.c.id == 1, f)
+
+Ordinary bind values of BLOB, CLOB, NCLOB and LONG columns are sent by
+pyodbc in one piece, so they must be ``bytes`` or ``str``; use
+:func:`.write_lob` for values that should not be held in memory at once.
+
+"""
+
+import io
+
+from sqlalchemy import exc, sql
+from sqlalchemy.sql import sqltypes
+
+from . import types
+
+# DBMS_LOB.SUBSTR()를 SQL에서 호출하면 RAW 또는 VARCHAR로 반환되므로 한번에 읽을 수
+# 있는 크기가 제한됩니다. chunk_size가 더 크면 SUBSTR()을 여러 칼럼으로 나눠서 한번의
+# 통신으로 가져옵니다. CLOB은 UTF-8 기준 한 글자 최대 3바이트로 계산했습니다.
+_BLOB_PIECE_SIZE = 2000
+_CLOB_PIECE_SIZE = 8000
+
+# DBMS_LOB.WRITEAPPEND()에 전달하는 PL/SQL RAW, VARCHAR2 변수의 최대 크기는
+# 32767 바이트입니다.
+_BLOB_WRITE_SIZE = 32000
+_CLOB_WRITE_SIZE = 8000
+
+
+def _is_lob(type_):
+    return isinstance(
+        type_, (sqltypes.LargeBinary, sqltypes.Text)
+    ) and not isinstance(type_, types.LONG)
+
+
+def _is_binary(type_):
+    return isinstance(type_, sqltypes._Binary)
+
+
+def _rowid(table):
+    return sql.column("rowid", _selectable=table)
+
+
+def _iter_chunks(source, chunk_size):
+    """Yield pieces of at most ``chunk_size`` from ``source``, which is a
+    bytes-like or str value, a file object or an iterable of those."""
+    if isinstance(source, (bytes, bytearray, memoryview, str)):
+        sources = (source,)
+    elif hasattr(source, "read"):
+        sources = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        sources = source
+
+    for chunk in sources:
+        if isinstance(chunk, memoryview):
+            chunk = chunk.cast("B")
+        if len(chunk) <= chunk_size:
+            yield chunk.tobytes() if isinstance(chunk, memoryview) else chunk
+            continue
+        for start in range(0, len(chunk), chunk_size):
+            piece = chunk[start : start + chunk_size]
+            yield piece.tobytes() if isinstance(piece, memoryview) else piece
+
+
+class LOBReader(io.IOBase):
+    """Read-only file-like object over a single LOB value.
+
+    ``read()`` returns ``bytes`` for BLOB columns and ``str`` for CLOB and
+    NCLOB columns; sizes and positions are counted in the same unit.
+    """
+
+    def __init__(self, connection, column, rowid, length, chunk_size):
+        self.connection = connection
+        self.column = column
+        self.rowid = rowid
+        self.length = length
+        self.chunk_size = chunk_size
+        self.binary = _is_binary(column.type)
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.length + offset
+        else:
+            raise ValueError(f"invalid whence ({whence!r})")
+        if position < 0:
+            raise ValueError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def read(self, size=-1):
+        self._checkClosed()
+        remaining = self.length - self._position
+        if size is None or size < 0 or size > remaining:
+            size = max(remaining, 0)
+
+        pieces = []
+        while size > 0:
+            chunk = self._fetch(self._position, min(size, self.chunk_size))
+            if not chunk:
+                break
+            pieces.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+
+        return (b"" if self.binary else "").join(pieces)
+
+    def readinto(self, buffer):
+        if not self.binary:
+            raise io.UnsupportedOperation("readinto() of a CLOB reader")
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def _fetch(self, position, amount):
+        piece_size = _BLOB_PIECE_SIZE if self.binary else _CLOB_PIECE_SIZE
+        # DBMS_LOB의 offset은 1부터 시작합니다.
+        stmt = sql.select(
+            *[
+                sql.func.dbms_lob.substr(
+                    self.column,
+                    min(piece_size, amount - start),
+                    position + start + 1,
+                )
+                for start in range(0, amount, piece_size)
+            ]
+        ).where(
+            _rowid(self.column.table) == sql.func.chartorowid(self.rowid)
+        )
+        row = self.connection.execute(stmt).one()
+        return (b"" if self.binary else "").join(
+            piece for piece in row if piece is not None
+        )
+
+
+def execute_lob_streaming(
+    connection,
+    statement,
+    inline_threshold=1024 * 1024,
+    chunk_size=64 * 1024,
+):
+    """Execute a SELECT, returning large LOB values as :class:`.LOBReader`.
+
+    :param connection: a :class:`.Connection`.
+    :param statement: a :func:`.select` construct.  Selected BLOB, CLOB and
+     NCLOB table columns are streamed; other columns are returned as
+     usual.
+    :param inline_threshold: LOB values of at most this many bytes (BLOB) or
+     characters (CLOB, NCLOB) are fetched with the row and returned as
+     ``bytes`` or ``str``.
+    :param chunk_size: amount read per round trip by the readers.
+
+    Yields a tuple per row, in the order of ``statement.selected_columns``.
+    """
+    lob_columns = {
+        idx: col
+        for idx, col in enumerate(statement.selected_columns)
+        if _is_lob(col.type)
+    }
+    for col in lob_columns.values():
+        if getattr(col, "table", None) is None:
+            raise exc.ArgumentError(
+                f"LOB column {col} must be a table column to be streamed"
+            )
+
+    ncols = len(statement.selected_columns)
+    replacements = {}
+    extra = []
+    for idx, col in lob_columns.items():
+        length = sql.func.dbms_lob.getlength(col)
+        replacements[idx] = sql.case(
+            (length <= inline_threshold, col), else_=None
+        ).label(col.key)
+        extra.extend(
+            [sql.func.rowidtochar(_rowid(col.table)), length.label(None)]
+        )
+
+    stmt = statement.with_only_columns(
+        *[
+            replacements.get(idx, col)
+            for idx, col in enumerate(statement.selected_columns)
+        ],
+        *extra,
+    )
+
+    for row in connection.execute(stmt):
+        values = list(row[:ncols])
+        position = ncols
+        for idx, col in lob_columns.items():
+            rowid, length = row[position], row[position + 1]
+            position += 2
+            if length is not None and length > inline_threshold:
+                values[idx] = LOBReader(
+                    connection, col, rowid, length, chunk_size
+                )
+        yield tuple(values)
+
+
+def write_lob(connection, column, whereclause, source, chunk_size=None):
+    """Replace the LOB value of a single row, appending it piece by piece.
+
+    :param connection: a :class:`.Connection`, in a transaction.
+    :param column: the BLOB, CLOB or NCLOB table column to write.
+    :param whereclause: criteria selecting exactly one row of the column's
+     table.  The row is locked with ``SELECT ... FOR UPDATE``.
+    :param source: ``bytes``/``str``, a memoryview, a file object opened in
+     the mode matching the column, or an iterable of chunks.
+    :param chunk_size: bytes (BLOB) or characters (CLOB, NCLOB) sent per
+     round trip.  At most 32000 bytes can be sent at a time.
+
+    Returns the number of bytes or characters written.
+    """
+    if not _is_lob(column.type) or getattr(column, "table", None) is None:
+        raise exc.ArgumentError(
+            f"{column} is not a BLOB, CLOB or NCLOB table column"
+        )
+
+    table = column.table
+    binary = _is_binary(column.type)
+    if chunk_size is None:
+        chunk_size = _BLOB_WRITE_SIZE if binary else _CLOB_WRITE_SIZE
+
+    rowids = (
+        connection.execute(
+            sql.select(sql.func.rowidtochar(_rowid(table)))
+            .where(whereclause)
+            .with_for_update()
+        )
+        .scalars()
+        .all()
+    )
+    if len(rowids) != 1:
+        raise exc.InvalidRequestError(
+            f"write_lob() expects exactly one row; got {len(rowids)}"
+        )
+    rowid = sql.func.chartorowid(rowids[0])
+
+    connection.execute(
+        sql.update(table)
+        .where(_rowid(table) == rowid)
+        .values(
+            {
+                column: (
+                    sql.func.empty_blob() if binary else sql.func.empty_clob()
+                )
+            }
+        )
+    )
+
+    preparer = connection.dialect.identifier_preparer
+    append = sql.text(
+        f"""
+        DECLARE
+            lob_locator {column.type.compile(dialect=connection.dialect)};
+        BEGIN
+            SELECT {preparer.quote(column.name)} INTO lob_locator
+            FROM {preparer.format_table(table)}
+            WHERE ROWID = CHARTOROWID(:rowid) FOR UPDATE;
+            DBMS_LOB.WRITEAPPEND(lob_locator, :amount, :data);
+        END;
+        """
+    ).bindparams(
+        sql.bindparam(
+            "data",
+            type_=sqltypes.LargeBinary() if binary else sqltypes.UnicodeText(),
+        )
+    )
+
+    written = 0
+    for chunk in _iter_chunks(source, chunk_size):
+        if not chunk:
+            continue
+        connection.execute(
+            append, {"rowid": rowids[0], "amount": len(chunk), "data": chunk}
+        )
+        written += len(chunk)
+    return written
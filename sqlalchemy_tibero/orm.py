@@ -0,0 +1,102 @@
+# tibero/orm.py
+# Copyright (C) 2024-2024 the SQLAlchemy authors and contributors <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+# mypy: ignore-errors
+
+"""
+Send the statements of an ORM flush in as few round trips as possible.
+
+::
+
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy_tibero.orm import enable_flush_batching
+
+    Session = sessionmaker(engine)
+    enable_flush_batching(Session)
+
+While a flush runs, the ``tibero_batch_flush`` execution option is enabled
+on the session's connections.  INSERT, UPDATE and DELETE statements that
+need no RETURNING are then collected by
+:meth:`.TiberoDialect_pyodbc.do_execute` instead of being executed, and sent
+together as one anonymous ``BEGIN ... END;`` block when
+
+* a statement that cannot be collected is executed (a SELECT, an INSERT
+  fetching its primary key with RETURNING, an executemany, ...),
+* the flush ends, or
+* the transaction commits.
+
+Each batched UPDATE checks ``SQL%ROWCOUNT`` inside the block and fails the
+whole block when it did not match exactly one row, which is reported as a
+:class:`.DBAPIError` (ORA-20000) rather than :class:`.StaleDataError`.
+Batched DELETE statements report one matched row to the ORM, so the
+warning for DELETEs that matched no row is not emitted.
+
+"""
+
+from sqlalchemy import event
+
+
+def _state(session):
+    return session.info.setdefault(
+        "_tibero_flush_batching", {"flushing": False, "connections": []}
+    )
+
+
+def _set_batching(state, enabled):
+    state["flushing"] = enabled
+    for connection in state["connections"]:
+        if not connection.closed:
+            connection.execution_options(tibero_batch_flush=enabled)
+
+
+def _is_flush_transaction(transaction):
+    # Session.flush()는 실행할 문장이 있을 때만 부모 트랜잭션 안에 nested가 아닌
+    # subtransaction을 만듭니다.
+    return transaction.parent is not None and not transaction.nested
+
+
+def _after_transaction_create(session, transaction):
+    if _is_flush_transaction(transaction):
+        _set_batching(_state(session), True)
+
+
+def _after_begin(session, transaction, connection):
+    state = _state(session)
+    state["connections"].append(connection)
+    if state["flushing"]:
+        connection.execution_options(tibero_batch_flush=True)
+
+
+def _after_flush(session, flush_context):
+    state = _state(session)
+    for connection in state["connections"]:
+        execute_batch = getattr(connection.dialect, "execute_batch", None)
+        if execute_batch is not None:
+            execute_batch(connection)
+    _set_batching(state, False)
+
+
+def _after_transaction_end(session, transaction):
+    state = _state(session)
+    if transaction.parent is None:
+        state["flushing"] = False
+        state["connections"].clear()
+    elif _is_flush_transaction(transaction) and state["flushing"]:
+        # flush가 실패한 경우입니다. 모아둔 문장은 rollback에서 버려집니다.
+        _set_batching(state, False)
+
+
+def enable_flush_batching(session):
+    """Batch the flushes of ``session``.
+
+    ``session`` may be a :class:`.Session`, a :class:`.sessionmaker` or a
+    :class:`.Session` subclass; see :class:`.SessionEvents`.
+    """
+    event.listen(
+        session, "after_transaction_create", _after_transaction_create
+    )
+    event.listen(session, "after_begin", _after_begin)
+    event.listen(session, "after_flush", _after_flush)
+    event.listen(session, "after_transaction_end", _after_transaction_end)
@@ -204,6 +204,7 @@ def _tibero_temp_table_keyword_args(cfg, eng):
 def _tibero_set_default_schema_on_connection(
     cfg, dbapi_connection, schema_name
 ):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("ALTER SESSION SET CURRENT_SCHEMA=%s" % schema_name)
-    cursor.close()
+    # 이미 같은 schema로 설정된 connection이면 ALTER SESSION을 생략합니다.
+    cfg.db.dialect.alter_session(
+        dbapi_connection, {"CURRENT_SCHEMA": schema_name}
+    )
@@ -4,19 +4,27 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: http://www.opensource.org/licenses/mit-license.php
 
+import collections
+import contextlib
 import datetime
+import heapq
+import itertools
+import logging
 import os
 import decimal
-
-import pyodbc
+import re
+import threading
+import time
 
 from sqlalchemy import util
 from sqlalchemy import func
+from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import interfaces
 from sqlalchemy.engine import processors
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.engine.interfaces import IsolationLevel
 from sqlalchemy import exc
+from sqlalchemy import pool
 from sqlalchemy.connectors.pyodbc import PyODBCConnector
 from sqlalchemy.sql import sqltypes
 from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
@@ -24,13 +32,19 @@ from sqlalchemy.sql.compiler import InsertmanyvaluesSentinelOpts
 from . import types
 from .base import TiberoExecutionContext, TiberoDialect, TiberoCompiler
 
-# 1. SQLAlchemy는 자체적인 풀링 메커니즘을 가지고 있기 때문에, PyODBC의 풀링 기능을 비활성화하는
-#    것이 더 나은 경우가 많습니다. 이 동작은 PyODBC 모듈 수준에서 전역적으로 비활성화할 수 있으며,
-#    첫 번째 연결이 만들어지기 전에만 비활성화할 수 있습니다. 이 내용은
-#    lib/sqlalchemy/dialects/mssql/pyodbc.py에서 발견했습니다.
-# 2. 풀링 기능을 비활성화해야 test/test_suite.py::WeCanSetDefaultSchemaWEventsTest
-#    테스트가 성공가능합니다.
-pyodbc.pooling = False
+# ODBC 표준(sql.h, sqlext.h)의 SQL 타입 값이며 pyodbc 모듈의 같은 이름의 상수와
+# 같습니다. pyodbc는 dialect을 처음 사용할 때 import_dbapi()에서 import하므로 이
+# 모듈에서는 직접 정의한 값을 사용합니다.
+_SQL_CHAR = 1
+_SQL_NUMERIC = 2
+_SQL_DECIMAL = 3
+_SQL_WCHAR = -8
+_SQL_INTERVAL_DAY_TO_SECOND = 110
+
+# TiberoDialect_pyodbc._session_state() 참조
+_session_states = {}
+
+log = logging.getLogger(__name__)
 
 
 class _TiberoInteger(sqltypes.Integer):
@@ -40,6 +54,16 @@ class _TiberoInteger(sqltypes.Integer):
         return int
 
     def result_processor(self, dialect, coltype):
+        # coltype은 cursor.description에 있는 pyodbc의 python 타입입니다.
+        # 드라이버가 이미 int를 반환하는 칼럼이면 행마다 int()를 호출할 필요가 없습니다.
+        # number_mode가 native이면 NUMBER의 정수 값은 converter가 int로 반환합니다.
+        # float이면 2**53 이하의 정수만 float로 반환되므로 int()로 바꿔도 값이
+        # 바뀌지 않습니다. _convert_number_to_float() 참조
+        if coltype is int or (
+            coltype is decimal.Decimal and dialect.number_mode == "native"
+        ):
+            return None
+
         def process(value):
             if value is not None:
                 return int(value)
@@ -73,14 +97,23 @@ class _TiberoNumeric(sqltypes.Numeric):
             return processors.to_float
 
     def result_processor(self, dialect, coltype):
+        # coltype이 decimal.Decimal인 NUMBER 칼럼이더라도 number_mode가 float이면
+        # float, native이면 int 또는 float를 output converter가 반환합니다.
+        number_mode = (
+            dialect.number_mode if coltype is decimal.Decimal else None
+        )
+
         if self.asdecimal:
-            if coltype is float:
+            if coltype is float or number_mode in ("float", "native"):
                 return processors.to_decimal_processor_factory(
                     decimal.Decimal, self._effective_decimal_return_scale
                 )
             else:
                 # pyodbc에서 반환한 값의 타입이 decimal인 경우 데이터 변환없이 그대로 유저에게 전달
                 return None
+        elif coltype is float or number_mode == "float":
+            # BINARY_DOUBLE 등 드라이버가 이미 float를 반환하는 칼럼
+            return None
         else:
             return processors.to_float
 
@@ -120,6 +153,12 @@ class _PYODBCTiberoDate(types._TiberoDate):
         return None
 
     def result_processor(self, dialect, coltype):
+        # 티베로의 DATE 칼럼은 시간을 포함하기 때문에 보통 datetime으로 반환됩니다.
+        # 드라이버가 date를 반환하는 경우에만 변환을 생략합니다. datetime은 date의
+        # 하위 클래스이기 때문에 issubclass()가 아닌 is로 비교합니다.
+        if coltype is datetime.date:
+            return None
+
         def process(value):
             if value is not None:
                 return value.date()
@@ -144,6 +183,13 @@ class _PYODBCTiberoTIMESTAMP(
         return self._literal_processor_datetime(dialect)
 
     def bind_processor(self, dialect):
+        # datetime은 pyodbc에서 SQL_TYPE_TIMESTAMP로 직접 바인딩합니다. 문자열로
+        # 바인딩하면 클라이언트에서 포맷팅하고 서버에서 다시 파싱해야 하며 NLS 설정의
+        # 영향을 받습니다. 다만 pyodbc는 tzinfo를 바인딩하지 못하기 때문에
+        # TIMESTAMP WITH TIME ZONE은 이전처럼 문자열로 보냅니다.
+        if not self.timezone:
+            return None
+
         def process(value):
             if value is not None:
                 return str(value)
@@ -152,7 +198,12 @@ class _PYODBCTiberoTIMESTAMP(
         return process
 
     def get_dbapi_type(self, dbapi):
-        return dbapi.SQL_TYPE_TIMESTAMP
+        if self.timezone:
+            return dbapi.SQL_TYPE_TIMESTAMP
+        # pyodbc는 크기를 지정하지 않으면 datetime의 소수점 이하 초를 밀리초까지만
+        # 보낼 수 있습니다. python datetime의 정밀도인 마이크로초(6자리)를 유지하도록
+        # "YYYY-MM-DD HH:MM:SS.ffffff" 길이(26)와 소수점 자리수(6)를 지정합니다.
+        return (dbapi.SQL_TYPE_TIMESTAMP, 26, 6)
 
 
 class _LOBDataType:
@@ -237,10 +288,9 @@ class _TiberoBinary(_LOBDataType, sqltypes.LargeBinary):
     def get_dbapi_type(self, dbapi):
         return dbapi.SQL_LONGVARBINARY
 
-    def bind_processor(self, dialect):
-        # 위의 dbapi.SQL_BINARY 타입으로 인해 pyodbc 내부에서 binary로 변환해줍니다.
-        # 따라서 sqltypes.LargeBinary에 정의된 bind_processor()가 필요없습니다.
-        return None
+    # 위의 dbapi.SQL_BINARY 타입으로 인해 pyodbc 내부에서 binary로 변환해줍니다.
+    # 따라서 sqltypes.LargeBinary에 정의된 bind_processor()가 아닌
+    # _LOBDataType.bind_processor()를 사용합니다.
 
     def result_processor(self, dialect, coltype):
         # pyodbc에서 이미 bytes로 전송해주기 때문에 별도의 processor가 필요없습니다.
@@ -250,6 +300,163 @@ class _TiberoBinary(_LOBDataType, sqltypes.LargeBinary):
         return None
 
 
+# pyodbc output converter registry
+#
+# ODBC SQL 타입 -> (converter 함수, converter가 반환하는 python 타입)
+#
+# pyodbc는 connection에 등록된 output converter를 C 코드에서 바로 호출하기 때문에
+# SQLAlchemy의 result processor로 한번 더 변환하는 것보다 빠릅니다. 등록된 converter는
+# on_connect()에서 connection마다 한번씩 설치됩니다. converter가 최종 python 타입을
+# 반환하는 SQL 타입의 SQLAlchemy 타입은 result_processor()에서 None을 반환해야
+# 합니다.
+#
+# converter는 SQL 타입으로만 선택되기 때문에 같은 SQL 타입을 여러 SQLAlchemy 타입이
+# 공유하는 경우(예: NUMBER 칼럼은 Integer, Numeric, Boolean 모두 SQL_NUMERIC)에는
+# 등록하면 안됩니다.
+_output_converters = {}
+
+
+def _output_converter(sqltype, python_type):
+    def decorate(fn):
+        _output_converters[sqltype] = (fn, python_type)
+        return fn
+
+    return decorate
+
+
+@_output_converter(_SQL_INTERVAL_DAY_TO_SECOND, datetime.timedelta)
+def _convert_interval_day_to_second(dto: bytes):
+    interval_str = dto.decode()
+    days, time_str = interval_str.split()
+
+    days = int(days)
+    hours, minutes, rest = time_str.split(":")
+    hours = int(hours)
+    minutes = int(minutes)
+
+    seconds, _, fraction = rest.partition(".")
+    seconds = int(seconds)
+    # 소수 부분은 초 단위이므로 ".5"는 500000 마이크로초입니다. 자리수를 6자리로
+    # 맞춥니다.
+    microseconds = int(fraction[:6].ljust(6, "0")) if fraction else 0
+
+    # timedelta 객체 생성
+    return datetime.timedelta(
+        days=days,
+        hours=hours,
+        minutes=minutes,
+        seconds=seconds,
+        microseconds=microseconds,
+    )
+
+
+# number_mode별 NUMBER(SQL_NUMERIC, SQL_DECIMAL) 칼럼의 output converter입니다.
+#
+#   decimal: converter 없이 pyodbc가 decimal.Decimal로 변환합니다. (기본값)
+#   float: float로 변환합니다.
+#   native: 소수부가 없으면 int, 있으면 float로 변환합니다. oracledb의 기본 동작과
+#           같습니다.
+#
+# Integer, Numeric, Boolean 칼럼이 모두 같은 SQL 타입을 사용하기 때문에 각 타입의
+# result_processor()는 dialect.number_mode에 따라 필요한 변환만 합니다.
+# converter는 칼럼의 타입을 알 수 없으므로 Integer 칼럼의 값이 바뀌지 않도록 두
+# mode 모두 float로 정확히 표현할 수 없는 정수는 int로 반환합니다.
+
+# 절대값이 이보다 작은 정수는 float로 정확히 표현됩니다.
+_MAX_EXACT_FLOAT_INTEGER = float(2**53)
+
+
+def _integral_number(value):
+    # 지수 형식("1E+40")이나 긴 문자열을 정확히 읽어서 정수이면 int를 반환합니다.
+    number = decimal.Decimal(value.decode("ascii"))
+    if number == number.to_integral_value():
+        return int(number)
+    return None
+
+
+def _convert_number_to_float(value: bytes):
+    number = float(value)
+    if -_MAX_EXACT_FLOAT_INTEGER < number < _MAX_EXACT_FLOAT_INTEGER:
+        return number
+    exact = _integral_number(value)
+    return number if exact is None else exact
+
+
+def _convert_number_to_native(value: bytes):
+    number = float(value)
+    if not number.is_integer():
+        return number
+    elif b"." not in value and b"E" not in value and b"e" not in value:
+        return int(value)
+    # "1E+40"처럼 지수 형식이거나 float로 바꾸면서 소수부가 사라진 값입니다.
+    exact = _integral_number(value)
+    return number if exact is None else exact
+
+
+_number_converters = {
+    "decimal": None,
+    "float": (_convert_number_to_float, float),
+    "native": (_convert_number_to_native, None),
+}
+
+_number_sqltypes = (_SQL_NUMERIC, _SQL_DECIMAL)
+
+# create_default_cursor()에서 arraysize를 정하기 전에 사용하는 값입니다.
+_DEFAULT_ARRAYSIZE = 50
+
+# TiberoDialect_pyodbc._adaptive_arraysize()에서 결과 행 하나가 차지하는 메모리를
+# 추정할 때 사용하는 값(byte)입니다. 문자열과 바이너리는 칼럼 크기만큼 더합니다.
+# 칼럼 크기가 VARCHAR의 최대 크기보다 크거나 알 수 없으면 LOB 또는 LONG으로 보고
+# _LOB_COLUMN_SIZE를 사용합니다.
+_ROW_OVERHEAD = 56
+_COLUMN_OVERHEAD = 64
+_MAX_INLINE_SIZE = 65532
+_LOB_COLUMN_SIZE = 256 * 1024
+
+
+def _column_size(description):
+    type_code, internal_size = description[1], description[3]
+    if type_code not in (str, bytes, bytearray):
+        return _COLUMN_OVERHEAD
+    if not internal_size or internal_size > _MAX_INLINE_SIZE:
+        return _LOB_COLUMN_SIZE
+    return _COLUMN_OVERHEAD + internal_size
+
+
+class _AdaptiveArraysizeFetchStrategy(_cursor.CursorFetchStrategy):
+    """Fetch strategy that sets ``cursor.arraysize`` from the result row
+    width the first time ``fetchmany()`` is called without a size."""
+
+    __slots__ = ("dialect", "sized")
+
+    def __init__(self, dialect):
+        self.dialect = dialect
+        self.sized = False
+
+    def size_cursor(self, dbapi_cursor):
+        # fetchone(), fetchall(), 크기를 지정한 fetchmany()는 arraysize를 사용하지
+        # 않으므로 description을 읽지 않습니다.
+        if not self.sized:
+            dbapi_cursor.arraysize = self.dialect._adaptive_arraysize(
+                dbapi_cursor.description
+            )
+            self.sized = True
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            self.size_cursor(dbapi_cursor)
+        return super().fetchmany(result, dbapi_cursor, size)
+
+
+# TiberoCompiler_pyodbc._deliver_insertmanyvalues_batches() 참조
+_insertmanyvalues_forms = ("values", "insert_all", "union_all")
+
+# tibero_batch_flush로 하나의 PL/SQL 블록에 모으는 문장과 bind parameter의 최대
+# 개수입니다. 넘으면 그때까지 모은 문장을 실행합니다.
+_BATCH_MAX_STATEMENTS = 100
+_BATCH_MAX_PARAMETERS = 1000
+
+
 class _TiberoInterval(types.INTERVAL):
     def bind_processor(self, dialect):
         def process(value: datetime.timedelta) -> str:
@@ -271,33 +478,10 @@ class _TiberoInterval(types.INTERVAL):
     def bind_expression(self, bindparam):
         return func.TO_DSINTERVAL(bindparam)
 
-    @staticmethod
-    def _add_pyodbc_output_converter(conn):
-        def handler(dto: bytes):
-            interval_str = dto.decode()
-            days, time_str = interval_str.split()
-
-            days = int(days)
-            hours, minutes, rest = time_str.split(":")
-            hours = int(hours)
-            minutes = int(minutes)
-
-            if "." in rest:
-                seconds, microseconds = map(int, rest.split("."))
-            else:
-                seconds = int(rest)
-                microseconds = 0
-
-            # timedelta 객체 생성
-            return datetime.timedelta(
-                days=days,
-                hours=hours,
-                minutes=minutes,
-                seconds=seconds,
-                microseconds=microseconds,
-            )
-
-        conn.add_output_converter(pyodbc.SQL_INTERVAL_DAY_TO_SECOND, handler)
+    def result_processor(self, dialect, coltype):
+        # SQL_INTERVAL_DAY_TO_SECOND 값은 output converter에서 이미 timedelta로
+        # 변환되어 반환됩니다. _convert_interval_day_to_second() 참조
+        return None
 
     def get_dbapi_type(self, dbapi):
         return dbapi.SQL_INTERVAL_DAY_TO_SECOND
@@ -317,16 +501,566 @@ class _TiberoRowid(types.ROWID):
 
 
 class TiberoCompiler_pyodbc(TiberoCompiler):
-    pass
+    _tibero_compile_time = None
+
+    def __init__(self, dialect, *args, **kwargs):
+        # metrics_sink가 있을 때만 컴파일 시간을 잽니다. 캐시된 컴파일 결과를 다시
+        # 사용하는 실행에서는 보고하지 않습니다.
+        if getattr(dialect, "metrics_sink", None) is None:
+            super().__init__(dialect, *args, **kwargs)
+            return
+        start = time.perf_counter()
+        super().__init__(dialect, *args, **kwargs)
+        self._tibero_compile_time = time.perf_counter() - start
+
+    def _deliver_insertmanyvalues_batches(
+        self,
+        statement,
+        parameters,
+        compiled_parameters,
+        generic_setinputsizes,
+        batch_size,
+        sort_by_parameter_order,
+        schema_translate_map,
+    ):
+        single_values_expr = self._insertmanyvalues.single_values_expr
+        if schema_translate_map:
+            single_values_expr = self.preparer._render_schema_translates(
+                single_values_expr, schema_translate_map
+            )
+        values_expr = f"({single_values_expr})"
+
+        form = self.dialect.insertmanyvalues_form
+        head = self._insertmanyvalues_head(statement, values_expr, form)
+
+        # 문장 길이가 insertmanyvalues_max_sql_length를 넘지 않도록 한 batch의 행
+        # 수를 줄입니다. bind parameter 개수는 SQLAlchemy가
+        # insertmanyvalues_max_parameters로 제한합니다.
+        max_length = self.dialect.insertmanyvalues_max_sql_length
+        if max_length:
+            if head is None:
+                # "(...), " 만큼씩 늘어나고 마지막 행에는 ", "가 붙지 않습니다.
+                row_length = len(values_expr) + 2
+                base_length = len(statement) - row_length
+            else:
+                one, two = (
+                    len(
+                        self._render_insertmanyvalues_form(
+                            form, head, single_values_expr, count
+                        )
+                    )
+                    for count in (1, 2)
+                )
+                row_length = two - one
+                base_length = one - row_length
+            batch_size = max(
+                1, min(batch_size, (max_length - base_length) // row_length)
+            )
+
+        for batch in super()._deliver_insertmanyvalues_batches(
+            statement,
+            parameters,
+            compiled_parameters,
+            generic_setinputsizes,
+            batch_size,
+            sort_by_parameter_order,
+            schema_translate_map,
+        ):
+            if head is not None and batch.current_batch_size > 1:
+                batch = batch._replace(
+                    replaced_statement=self._render_insertmanyvalues_form(
+                        form,
+                        head,
+                        single_values_expr,
+                        batch.current_batch_size,
+                    )
+                )
+            yield batch
+
+    def _insertmanyvalues_head(self, statement, values_expr, form):
+        """Return ``INSERT INTO table (columns)`` when ``form`` can be used
+        for ``statement``, else None."""
+        if form == "values" or not self.positional or self._result_columns:
+            return None
+
+        head, _, tail = statement.partition(values_expr)
+        head = head.rstrip()
+        # RETURNING, DEFAULT, sequence의 nextval은 INSERT ALL과 SELECT ... FROM
+        # DUAL에서 사용할 수 없거나(ORA-02287) 모든 행에 같은 값을 넣게 됩니다.
+        if (
+            tail.strip()
+            or not head.startswith("INSERT INTO ")
+            or not head.endswith(" VALUES")
+            or re.search(
+                r"\bDEFAULT\b|\.nextval\b", values_expr, re.IGNORECASE
+            )
+        ):
+            return None
+        return head[: -len(" VALUES")]
+
+    def _render_insertmanyvalues_form(self, form, head, values, count):
+        if form == "insert_all":
+            into = f"{head[len('INSERT '):]} VALUES ({values})"
+            return f"INSERT ALL {' '.join([into] * count)} SELECT 1 FROM DUAL"
+        else:
+            select = f"SELECT {values} FROM DUAL"
+            return f"{head} {' UNION ALL '.join([select] * count)}"
+
+
+class StatementTimeoutError(exc.OperationalError):
+    """A statement ran longer than its ``tibero_timeout`` and was cancelled.
+
+    ``orig`` is the driver's error for the cancelled call, or a
+    :class:`TimeoutError` when the statement completed at the moment it was
+    cancelled; the outcome of such a statement is unknown.
+    """
+
+
+class _Watchdog:
+    """Call ``cursor.cancel()`` on statements that pass their deadline.
+
+    A single daemon thread, started on first use, serves all connections.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._counter = itertools.count()
+        self._thread = None
+
+    def watch(self, cursor, timeout, error=()):
+        # [deadline, 순번, cursor, 상태, DBAPI Error 클래스] 상태는 None(실행 중),
+        # "cancelling", "cancelled", "done"
+        entry = [
+            time.monotonic() + timeout,
+            next(self._counter),
+            cursor,
+            None,
+            error,
+        ]
+        with self._condition:
+            heapq.heappush(self._deadlines, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tibero-watchdog", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return entry
+
+    def unwatch(self, entry):
+        """Stop watching; returns True if the statement was cancelled."""
+        with self._condition:
+            # cancel()이 끝나기 전에 반환하면 statement cache가 cursor를 다음 문장에
+            # 재사용한 후에 취소될 수 있으므로 기다립니다.
+            while entry[3] == "cancelling":
+                self._condition.wait()
+            if entry[3] is None:
+                entry[3] = "done"
+                entry[2] = None
+        return entry[3] == "cancelled"
+
+    def _run(self):
+        with self._condition:
+            while True:
+                deadlines = self._deadlines
+                while deadlines and deadlines[0][3] is not None:
+                    heapq.heappop(deadlines)
+                if not deadlines:
+                    self._condition.wait()
+                    continue
+                delay = deadlines[0][0] - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                entry = heapq.heappop(deadlines)
+                entry[3] = "cancelling"
+                # SQLCancel()은 다른 thread에서 호출할 수 있습니다. 실행 중인 문장은
+                # HY008 오류로 끝납니다.
+                self._condition.release()
+                try:
+                    entry[2].cancel()
+                except entry[4] as err:
+                    cancelled = False
+                    util.warn(f"Could not cancel statement: {err}")
+                except Exception:
+                    # 드라이버 오류가 아닌 예외로 watchdog thread가 끝나면 이후의
+                    # 문장이 취소되지 않으므로 기록만 합니다.
+                    cancelled = False
+                    log.exception("Could not cancel statement")
+                else:
+                    cancelled = True
+                finally:
+                    self._condition.acquire()
+                # 취소하지 못했으면 문장의 원래 결과를 그대로 돌려줍니다.
+                entry[2], entry[3] = None, "cancelled" if cancelled else "done"
+                self._condition.notify_all()
+
+
+_watchdog = _Watchdog()
+
+
+class _CachedCursor:
+    """A DBAPI cursor kept in the statement cache of its connection.
+
+    SQLAlchemy closes the cursor once the result is consumed; ``close()``
+    returns it to the cache instead so that the next execution of the same
+    statement reuses the statement pyodbc has already prepared.
+    """
+
+    __slots__ = ("_cache", "_cursor", "_size", "_statement")
+
+    def __init__(self, cursor, cache, statement, size):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_cache", cache)
+        object.__setattr__(self, "_statement", statement)
+        object.__setattr__(self, "_size", size)
+
+    def __getattr__(self, key):
+        return getattr(self._cursor, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._cursor, key, value)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def close(self):
+        cache = self._cache
+        if self._statement in cache:
+            # 같은 문장이 동시에 여러 cursor에서 실행된 경우입니다.
+            self._cursor.close()
+            return
+
+        cache[self._statement] = self
+        while len(cache) > self._size:
+            _, evicted = cache.popitem(last=False)
+            evicted._cursor.close()
+
+
+class StatementMetrics:
+    """Timings and counts of one statement execution, passed to the
+    ``metrics_sink`` of :class:`.TiberoDialect_pyodbc`.
+
+    ``statement`` is the last SQL string passed to the cursor.  Times are
+    in seconds.  ``compile_time`` is None when the compiled form was taken
+    from the compiled cache and ``bind_time`` covers the setup of the
+    execution, including bind parameter processing.  ``result_time`` covers
+    setting up the :class:`.CursorResult`; type conversion of each row
+    happens while the application iterates the result and is not included.
+    ``round_trips`` counts the ``execute``, ``executemany`` and ``fetch*``
+    calls made on the DBAPI cursor, and ``bytes`` is an estimate of the
+    fetched data: the length of string and binary values and 8 for any
+    other non-NULL value.
+    """
+
+    __slots__ = (
+        "_closed",
+        "_in_setup",
+        "_sink",
+        "bind_time",
+        "bytes",
+        "cache_hit",
+        "compile_time",
+        "execute_time",
+        "executemany",
+        "fetch_time",
+        "result_time",
+        "round_trips",
+        "rows",
+        "statement",
+    )
+
+    def __init__(self, sink, statement, executemany, cache_hit, compile_time):
+        self.statement = statement
+        self.executemany = executemany
+        self.cache_hit = cache_hit
+        self.compile_time = compile_time
+        self.bind_time = 0.0
+        self.execute_time = 0.0
+        self.fetch_time = 0.0
+        self.result_time = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.round_trips = 0
+        self._sink = sink
+        self._closed = False
+        self._in_setup = False
+
+    def _emit(self):
+        self._sink(self)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(rows={self.rows}, "
+            f"bytes={self.bytes}, round_trips={self.round_trips}, "
+            f"execute_time={self.execute_time:.6f}, "
+            f"fetch_time={self.fetch_time:.6f})"
+        )
+
+
+def _row_bytes(row):
+    size = 0
+    for value in row:
+        if value is None:
+            continue
+        elif isinstance(value, (str, bytes, bytearray)):
+            size += len(value)
+        else:
+            size += 8
+    return size
+
+
+class _MetricsCursor:
+    """A DBAPI cursor that records :class:`.StatementMetrics`.
+
+    Only used when the dialect has a ``metrics_sink``; the metrics are
+    passed to the sink when the cursor is closed.
+    """
+
+    __slots__ = ("_cursor", "_metrics")
+
+    def __init__(self, cursor, metrics):
+        object.__setattr__(self, "_cursor", cursor)
+        object.__setattr__(self, "_metrics", metrics)
+
+    def __getattr__(self, key):
+        return getattr(self._cursor, key)
+
+    def __setattr__(self, key, value):
+        setattr(self._cursor, key, value)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def execute(self, statement, *args):
+        metrics = self._metrics
+        metrics.statement = statement
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(statement, *args)
+        finally:
+            metrics.execute_time += time.perf_counter() - start
+            metrics.round_trips += 1
+
+    def executemany(self, statement, *args):
+        metrics = self._metrics
+        metrics.statement = statement
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(statement, *args)
+        finally:
+            metrics.execute_time += time.perf_counter() - start
+            metrics.round_trips += 1
+
+    def _fetched(self, start, rows):
+        metrics = self._metrics
+        metrics.fetch_time += time.perf_counter() - start
+        metrics.round_trips += 1
+        metrics.rows += len(rows)
+        for row in rows:
+            metrics.bytes += _row_bytes(row)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(start, () if row is None else (row,))
+        return row
+
+    def fetchmany(self, *args):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(*args)
+        self._fetched(start, rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(start, rows)
+        return rows
+
+    def close(self):
+        self._cursor.close()
+        metrics = self._metrics
+        if metrics._closed:
+            return
+        metrics._closed = True
+        # DML은 _setup_result_proxy() 안에서 cursor가 닫힙니다. 이 경우 결과 처리
+        # 시간까지 잰 후에 보고합니다.
+        if not metrics._in_setup:
+            metrics._emit()
 
 
 class TiberoExecutionContext_pyodbc(TiberoExecutionContext):
+    _tibero_fast_executemany = False
+    _tibero_input_sizes = None
+    _tibero_batch_flush = False
+    _tibero_batchable = False
+    _tibero_timeout = None
+    _tibero_metrics = None
+    _tibero_returning_rows = None
+    _tibero_returning_description = None
+
+    @classmethod
+    def _init_compiled(cls, dialect, *args, **kwargs):
+        if dialect.metrics_sink is None:
+            return super()._init_compiled(dialect, *args, **kwargs)
+        start = time.perf_counter()
+        self = super()._init_compiled(dialect, *args, **kwargs)
+        # bind parameter 처리와 cursor 생성을 포함한 실행 준비 시간입니다.
+        self._tibero_metrics.bind_time = time.perf_counter() - start
+        return self
+
+    def pre_exec(self):
+        super().pre_exec()
+
+        # 실행 시간(초)이 tibero_timeout을 넘으면 cursor.cancel()을 호출합니다.
+        # TiberoDialect_pyodbc._statement_timeout() 참조
+        self._tibero_timeout = self.execution_options.get(
+            "tibero_timeout", self.dialect.statement_timeout
+        )
+
+        # tibero_fast_executemany 실행 옵션이 dialect의 fast_executemany 설정보다
+        # 우선합니다. insertmanyvalues로 처리되는 INSERT는 executemany()를 사용하지
+        # 않기 때문에 대상이 아닙니다.
+        if self.execute_style is interfaces.ExecuteStyle.EXECUTEMANY:
+            self._tibero_fast_executemany = self.execution_options.get(
+                "tibero_fast_executemany", self.dialect.fast_executemany
+            )
+            # RETURNING이 있는 UPDATE, DELETE는 parameter set마다 반환된 행을
+            # 모아야 하므로 TiberoDialect_pyodbc._executemany_returning()에서
+            # 하나의 PL/SQL 블록으로 실행합니다.
+            if (
+                self.isupdate or self.isdelete
+            ) and self.compiled.effective_returning:
+                self._tibero_returning_rows = []
+
+        # tibero_batch_flush 실행 옵션이 켜져 있으면 RETURNING이 없는 INSERT, UPDATE,
+        # DELETE는 바로 실행하지 않고 모아서 하나의 PL/SQL 블록으로 실행합니다.
+        # TiberoDialect_pyodbc.do_execute() 참조
+        self._tibero_batch_flush = self.execution_options.get(
+            "tibero_batch_flush", False
+        )
+        if self._tibero_batch_flush:
+            self._tibero_batchable = (
+                self.is_crud
+                and self.execute_style is interfaces.ExecuteStyle.EXECUTE
+                and not self.compiled.effective_returning
+            )
+
+    def post_exec(self):
+        super().post_exec()
+
+        if self._tibero_returning_rows is not None:
+            # executemany()로 실행한 모든 parameter set의 RETURNING 행을 하나의
+            # 결과로 돌려줍니다.
+            self.cursor_fetch_strategy = (
+                _cursor.FullyBufferedCursorFetchStrategy(
+                    self.cursor,
+                    self._tibero_returning_description,
+                    initial_buffer=self._tibero_returning_rows,
+                )
+            )
+            return
+
+        # arraysize를 지정하지 않았다면 결과 행의 크기를 보고 fetchmany()가 한번에
+        # 가져올 행 수를 arraysize_memory_limit에 맞춥니다. 크기는 fetchmany()가
+        # arraysize를 처음 사용할 때 계산합니다.
+        if (
+            self.dialect.arraysize is None
+            and self.dialect.arraysize_memory_limit
+            and "tibero_arraysize" not in self.execution_options
+            and not self._is_server_side
+            and self._tibero_result_cache_key is None
+            and self.cursor.description is not None
+        ):
+            self.cursor_fetch_strategy = _AdaptiveArraysizeFetchStrategy(
+                self.dialect
+            )
+
     def create_cursor(self):
+        cursor = super().create_cursor()
+        sink = self.dialect.metrics_sink
+        if sink is None:
+            return cursor
+
+        cache_hit = self.cache_hit is interfaces.CacheStats.CACHE_HIT
+        self._tibero_metrics = StatementMetrics(
+            sink,
+            getattr(self, "unicode_statement", None),
+            self.execute_style is interfaces.ExecuteStyle.EXECUTEMANY,
+            cache_hit,
+            (
+                None
+                if cache_hit
+                else getattr(self.compiled, "_tibero_compile_time", None)
+            ),
+        )
+        return _MetricsCursor(cursor, self._tibero_metrics)
+
+    def _setup_result_proxy(self):
+        metrics = self._tibero_metrics
+        if metrics is None:
+            return super()._setup_result_proxy()
+
+        metrics._in_setup = True
+        fetch_time = metrics.fetch_time
+        start = time.perf_counter()
+        try:
+            return super()._setup_result_proxy()
+        finally:
+            # 결과를 미리 가져오는 fetch strategy의 fetch 시간은 제외합니다.
+            metrics.result_time = (
+                time.perf_counter() - start - (metrics.fetch_time - fetch_time)
+            )
+            metrics._in_setup = False
+            if metrics._closed:
+                metrics._emit()
+
+    # create_cursor()는 DefaultExecutionContext가 stream_results에 따라 server
+    # side cursor를 고르는 로직을 그대로 사용하고 metrics_sink가 있을 때만 cursor를
+    # 감쌉니다. 기본 cursor를 만드는 로직은 create_default_cursor()에서 바꿉니다.
+    def create_default_cursor(self):
+        cache_size = self.execution_options.get(
+            "tibero_statement_cache_size", self.dialect.statement_cache_size
+        )
+        # cursor는 self.statement가 정해지기 전에 만들어집니다. IN 목록 등이
+        # 펼쳐지기 전의 문장을 key로 사용합니다.
+        statement = getattr(self, "unicode_statement", None)
+        if cache_size and statement:
+            c = self.dialect._checkout_cursor(
+                self._dbapi_connection.dbapi_connection,
+                statement,
+                cache_size,
+            )
+        else:
+            c = self._dbapi_connection.cursor()
+        c.arraysize = (
+            self.execution_options.get("tibero_arraysize")
+            or self.dialect.arraysize
+            or _DEFAULT_ARRAYSIZE
+        )
+        return c
+
+    def create_server_side_cursor(self):
+        # pyodbc는 fetchmany()가 요청한 행만 SQLFetch로 가져오고 결과 전체를 미리
+        # 읽어두지 않습니다. 따라서 일반 cursor를 그대로 쓰되 stream_results일 때
+        # SQLAlchemy가 사용하는 BufferedRowCursorFetchStrategy가 max_row_buffer 이하의
+        # chunk로 fetchmany()를 호출하므로 메모리 사용량이 제한됩니다.
         c = self._dbapi_connection.cursor()
-        if self.dialect.arraysize:
-            c.arraysize = self.dialect.arraysize
+        c.arraysize = self._server_side_arraysize()
         return c
 
+    def _server_side_arraysize(self):
+        # yield_per를 사용하면 max_row_buffer도 같은 값으로 설정됩니다.
+        return (
+            self.execution_options.get("max_row_buffer")
+            or self.execution_options.get("tibero_arraysize")
+            or self.dialect.arraysize
+            or _DEFAULT_ARRAYSIZE
+        )
+
 
 class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
     # 아래 속성들을 보면 DefaultDialect에서 이미 같은 값으로 설정이 되어있기 때문에 생략해도 문제없는 코드가 있습니다. 하지만
@@ -339,6 +1073,10 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
     execution_ctx_cls = TiberoExecutionContext_pyodbc
     statement_compiler = TiberoCompiler_pyodbc
 
+    # stream_results, yield_per 실행 옵션을 사용하면
+    # TiberoExecutionContext_pyodbc.create_server_side_cursor()를 사용합니다.
+    supports_server_side_cursors = True
+
     # Tibero pyodbc에서는 pyodbc execute()는 select, insert, update,
     # delete문ㅇ에 대해 cursor.rowcount가 정상적으로 작동하는 것을 확인했습니다.
     supports_sane_rowcount = True
@@ -353,11 +1091,12 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
     #       을 통해 작동한다는 것을 알았습니다. 그리고
     #       insert_executemany_returning_sort_by_parameter_order은
     #       ReturningTest::test_insert_w_floats을 통해 작동한다는 것을 알았습니다.
-    #       하지만 나머지 2개는 아직 확인을 못했기 때문에 False로 두었습니다.
+    #       UPDATE, DELETE는 TiberoDialect_pyodbc._executemany_returning()에서
+    #       처리합니다.
     insert_executemany_returning = True
     insert_executemany_returning_sort_by_parameter_order = True
-    update_executemany_returning = False
-    delete_executemany_returning = False
+    update_executemany_returning = True
+    delete_executemany_returning = True
 
     bind_typing = interfaces.BindTyping.SETINPUTSIZES
 
@@ -426,11 +1165,36 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
     #### End Of  New Section ####
     #############################
 
+    @classmethod
+    def import_dbapi(cls):
+        pyodbc = super().import_dbapi()
+        # 1. SQLAlchemy는 자체적인 풀링 메커니즘을 가지고 있기 때문에, PyODBC의 풀링
+        #    기능을 비활성화하는 것이 더 나은 경우가 많습니다. 이 동작은 PyODBC 모듈
+        #    수준에서 전역적으로 비활성화할 수 있으며, 첫 번째 연결이 만들어지기 전에만
+        #    비활성화할 수 있습니다. 이 내용은 lib/sqlalchemy/dialects/mssql/pyodbc.py
+        #    에서 발견했습니다.
+        # 2. 풀링 기능을 비활성화해야 test/test_suite.py::
+        #    WeCanSetDefaultSchemaWEventsTest 테스트가 성공가능합니다.
+        pyodbc.pooling = False
+        return pyodbc
+
     def __init__(
         self,
-        arraysize=50,
+        arraysize=None,
+        arraysize_memory_limit=1024 * 1024,
         char_encoding="UTF-8",
         wchar_encoding="UTF-8",
+        fast_executemany=False,
+        fast_executemany_memory_limit=16 * 1024 * 1024,
+        nls_parameters=None,
+        statement_cache_size=0,
+        number_mode="decimal",
+        statement_timeout=None,
+        metrics_sink=None,
+        use_insertmanyvalues_wo_returning=False,
+        insertmanyvalues_form="values",
+        insertmanyvalues_max_sql_length=64 * 1024,
+        insertmanyvalues_max_parameters=None,
         **kwargs,
     ):
         self.char_encoding = char_encoding
@@ -446,16 +1210,454 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
 
         TiberoDialect.__init__(self, **kwargs)
         # arraysize는 원래 oracle driver의 cursor.var를 통해 구현되었으나
-        # pyodbc에서 cursor.arraysize를 통해 비슷하게 구현했습니다.
+        # pyodbc에서 cursor.arraysize를 통해 비슷하게 구현했습니다. None이면
+        # 실행 후 cursor.description으로 행 하나의 크기를 추정해서 fetchmany()가
+        # arraysize_memory_limit(byte) 정도를 가져오도록 정합니다.
+        # tibero_arraysize 실행 옵션으로 실행마다 지정할 수 있습니다.
         self.arraysize = arraysize
+        self.arraysize_memory_limit = arraysize_memory_limit
+        # fast_executemany는 모든 parameter set을 하나의 배열 버퍼에 바인딩한 후
+        # 한번의 통신으로 보냅니다. 버퍼 크기가 제한없이 커지지 않도록
+        # fast_executemany_memory_limit(byte) 단위로 나눠서 보냅니다.
+        self.fast_executemany = fast_executemany
+        self.fast_executemany_memory_limit = fast_executemany_memory_limit
+        # 연결할 때 ALTER SESSION으로 설정할 NLS 파라미터들입니다.
+        # 예: {"NLS_DATE_FORMAT": "YYYY-MM-DD HH24:MI:SS"}
+        self.nls_parameters = nls_parameters or {}
+        # connection마다 최근에 실행한 문장의 cursor를 최대 statement_cache_size개
+        # 열어둡니다. pyodbc는 cursor에서 마지막으로 실행한 문장과 같은 문장을 실행하면
+        # SQLPrepare를 다시 호출하지 않습니다. 0이면 사용하지 않습니다.
+        # tibero_statement_cache_size 실행 옵션으로 바꿀 수 있습니다.
+        self.statement_cache_size = statement_cache_size
+        # dialect 설정에 따라 converter를 추가할 수 있도록 복사해서 사용합니다.
+        self._output_converters = dict(_output_converters)
+        # NUMBER 칼럼을 어떤 python 타입으로 가져올지 정합니다. "decimal", "float",
+        # "native" 중 하나입니다. _number_converters 참조
+        if number_mode not in _number_converters:
+            raise exc.ArgumentError(
+                f"number_mode must be one of {sorted(_number_converters)}; "
+                f"got {number_mode!r}"
+            )
+        self.number_mode = number_mode
+        # 문장 하나의 최대 실행 시간(초)입니다. None이면 제한하지 않습니다.
+        # tibero_timeout 실행 옵션으로 바꿀 수 있고, 시간을 넘으면
+        # StatementTimeoutError가 발생합니다.
+        self.statement_timeout = statement_timeout
+        # 문장을 실행할 때마다 StatementMetrics를 받는 callable입니다. cursor가
+        # 닫힐 때 호출됩니다. None이면 시간을 재지 않습니다.
+        self.metrics_sink = metrics_sink
+        if _number_converters[number_mode] is not None:
+            for sqltype in _number_sqltypes:
+                self._output_converters[sqltype] = _number_converters[
+                    number_mode
+                ]
+        # True이면 RETURNING이 없는 INSERT도 executemany() 대신 insertmanyvalues로
+        # 실행합니다. 이 경우 INSERT에는 fast_executemany가 사용되지 않습니다.
+        self.use_insertmanyvalues_wo_returning = (
+            use_insertmanyvalues_wo_returning
+        )
+        # insertmanyvalues로 여러 행을 INSERT하는 문장의 형태입니다.
+        #   values: INSERT INTO t (a, b) VALUES (?, ?), (?, ?)
+        #   insert_all: INSERT ALL INTO t (a, b) VALUES (?, ?) INTO t ...
+        #               SELECT 1 FROM DUAL
+        #   union_all: INSERT INTO t (a, b) SELECT ?, ? FROM DUAL UNION ALL ...
+        # RETURNING, DEFAULT, sequence가 포함된 문장은 항상 values를 사용합니다.
+        # test/perf/insertmanyvalues.py로 비교할 수 있습니다.
+        if insertmanyvalues_form not in _insertmanyvalues_forms:
+            raise exc.ArgumentError(
+                "insertmanyvalues_form must be one of "
+                f"{list(_insertmanyvalues_forms)}; "
+                f"got {insertmanyvalues_form!r}"
+            )
+        self.insertmanyvalues_form = insertmanyvalues_form
+        # insertmanyvalues 문장 하나의 최대 길이(문자 수)입니다. 칼럼이 많은 테이블은
+        # insertmanyvalues_page_size보다 적은 행으로 나눠서 보냅니다. 0이면 제한하지
+        # 않습니다.
+        self.insertmanyvalues_max_sql_length = insertmanyvalues_max_sql_length
+        if insertmanyvalues_max_parameters is not None:
+            self.insertmanyvalues_max_parameters = (
+                insertmanyvalues_max_parameters
+            )
         if self._use_nchar_for_unicode:
             self.colspecs = self.colspecs.copy()
             self.colspecs[sqltypes.Unicode] = _TiberoUnicodeStringNCHAR
             self.colspecs[sqltypes.UnicodeText] = _TiberoUnicodeTextNCLOB
 
+    def do_set_input_sizes(self, cursor, list_of_tuples, context):
+        # PyODBCConnector는 fast_executemany를 사용할 때 setinputsizes()를 생략합니다.
+        # 그러면 pyodbc가 parameter마다 SQLDescribeParam을 호출해서 버퍼 크기를
+        # 정하게 됩니다. 여기서는 get_dbapi_type()이 반환한 ODBC 타입에 SQLAlchemy 타입의
+        # 길이, precision, scale을 붙여서 그대로 사용합니다.
+        if context._tibero_fast_executemany:
+            inputsizes = [
+                self._fast_executemany_input_size(dbtype, sqltype)
+                for key, dbtype, sqltype in list_of_tuples
+            ]
+        else:
+            inputsizes = [
+                (
+                    (dbtype, None, None)
+                    if not isinstance(dbtype, tuple)
+                    else dbtype
+                )
+                for key, dbtype, sqltype in list_of_tuples
+            ]
+        context._tibero_input_sizes = inputsizes
+        cursor.setinputsizes(inputsizes)
+
+    def _adaptive_arraysize(self, description):
+        # pyodbc는 arraysize와 관계없이 SQLFetch로 한 행씩 가져옵니다. arraysize는
+        # fetchmany()가 한번에 python 객체로 만드는 행 수를 정합니다.
+        row_size = _ROW_OVERHEAD + sum(
+            _column_size(column) for column in description
+        )
+        return max(1, self.arraysize_memory_limit // row_size)
+
+    def _fast_executemany_input_size(self, dbtype, sqltype):
+        if dbtype is None or isinstance(dbtype, tuple):
+            return dbtype if dbtype is not None else (None, None, None)
+
+        length = getattr(sqltype, "length", None)
+        if length:
+            return (dbtype, length, 0)
+
+        precision = getattr(sqltype, "precision", None)
+        if precision is not None:
+            return (dbtype, precision, getattr(sqltype, "scale", None) or 0)
+
+        return (dbtype, None, None)
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        if context is not None and context._tibero_cached_result is not None:
+            # tibero_result_cache에 저장된 결과를 post_exec()에서 돌려줍니다.
+            return
+        if context is not None and context._tibero_batch_flush:
+            dbapi_connection = context._dbapi_connection.dbapi_connection
+            # fire_sequence() 등 같은 context로 실행되는 다른 문장은 모으지 않습니다.
+            if context._tibero_batchable and statement is context.statement:
+                self._add_to_batch(
+                    dbapi_connection, statement, parameters, context
+                )
+                # 실행하지 않은 cursor의 rowcount는 -1이므로 ORM의 rowcount 검사를
+                # 위해 1을 설정합니다. UPDATE는 블록 안에서 SQL%ROWCOUNT로 검사합니다.
+                context._rowcount = 1
+                return
+            # 모아둔 문장의 결과를 읽을 수 있도록 먼저 실행합니다.
+            self._execute_batch(dbapi_connection)
+        with self._statement_timeout(cursor, statement, parameters, context):
+            cursor.execute(statement, parameters)
+
+    def do_execute_no_params(self, cursor, statement, context=None):
+        # no_parameters 실행 옵션이나 exec_driver_sql()로 파라미터 없이 실행하는
+        # 문장입니다. 모아둔 문장보다 먼저 실행되지 않도록 모아둔 문장부터 실행합니다.
+        if context is not None and context._tibero_batch_flush:
+            self._execute_batch(context._dbapi_connection.dbapi_connection)
+        with self._statement_timeout(cursor, statement, (), context):
+            cursor.execute(statement)
+
+    def do_executemany(self, cursor, statement, parameters, context=None):
+        if context is not None and context._tibero_batch_flush:
+            self._execute_batch(context._dbapi_connection.dbapi_connection)
+
+        with self._statement_timeout(cursor, statement, parameters, context):
+            self._do_executemany(cursor, statement, parameters, context)
+
+    @contextlib.contextmanager
+    def _statement_timeout(self, cursor, statement, parameters, context):
+        # ODBC의 SQL_ATTR_QUERY_TIMEOUT은 pyodbc에서 cursor를 만들 때
+        # connection.timeout으로만 설정되므로 statement cache로 재사용하는 cursor에
+        # 적용할 수 없고 초 단위입니다. 대신 _watchdog이 cursor.cancel()을 호출합니다.
+        # fetch는 제한하지 않습니다.
+        timeout = context._tibero_timeout if context is not None else None
+        if not timeout:
+            yield
+            return
+
+        entry = _watchdog.watch(cursor, timeout, self.loaded_dbapi.Error)
+        try:
+            yield
+        except self.loaded_dbapi.Error as err:
+            if _watchdog.unwatch(entry):
+                raise self._timeout_error(
+                    statement, parameters, context, err
+                ) from err
+            raise
+        except BaseException:
+            _watchdog.unwatch(entry)
+            raise
+        if _watchdog.unwatch(entry):
+            raise self._timeout_error(
+                statement,
+                parameters,
+                context,
+                TimeoutError(f"statement cancelled after {timeout}s"),
+            )
+
+    def _timeout_error(self, statement, parameters, context, orig):
+        return StatementTimeoutError(
+            statement,
+            parameters,
+            orig,
+            hide_parameters=context.root_connection.engine.hide_parameters,
+            ismulti=context.executemany,
+        )
+
+    def _do_executemany(self, cursor, statement, parameters, context):
+        if context is not None and context._tibero_returning_rows is not None:
+            self._executemany_returning(cursor, statement, parameters, context)
+            return
+
+        if context is None or not context._tibero_fast_executemany:
+            cursor.executemany(statement, parameters)
+            return
+
+        cursor.fast_executemany = True
+        batch_size = self._fast_executemany_batch_size(parameters, context)
+        for start in range(0, len(parameters), batch_size):
+            cursor.executemany(
+                statement, parameters[start : start + batch_size]
+            )
+
+    def _executemany_returning(self, cursor, statement, parameters, context):
+        # pyodbc는 out parameter를 지원하지 않지만 Tibero ODBC 드라이버는
+        # RETURNING ... INTO의 값을 결과 집합으로 돌려줍니다. executemany()는 이
+        # 결과 집합을 버리므로 parameter set마다 문장을 하나씩 넣은 PL/SQL 블록을
+        # 실행하고 문장마다 돌려주는 결과 집합을 nextset()으로 차례대로 읽습니다.
+        # 따라서 행은 parameter set의 순서대로 모입니다. 블록의 크기는
+        # tibero_batch_flush의 블록과 같이 제한합니다.
+        rows = context._tibero_returning_rows
+        inputsizes = context._tibero_input_sizes
+        per_block = max(
+            1,
+            min(
+                _BATCH_MAX_STATEMENTS,
+                _BATCH_MAX_PARAMETERS // max(len(parameters[0]), 1),
+            ),
+        )
+        for start in range(0, len(parameters), per_block):
+            chunk = parameters[start : start + per_block]
+            block = "\n".join(
+                ["BEGIN", *(f"{statement};" for _ in chunk), "END;"]
+            )
+            if inputsizes:
+                cursor.setinputsizes(inputsizes * len(chunk))
+            cursor.execute(
+                block, [value for params in chunk for value in params]
+            )
+            for _ in chunk:
+                if cursor.description is not None:
+                    if context._tibero_returning_description is None:
+                        context._tibero_returning_description = (
+                            cursor.description
+                        )
+                    rows.extend(cursor.fetchall())
+                cursor.nextset()
+        # 반환된 행마다 하나의 행이 변경되었습니다.
+        context._rowcount = len(rows)
+
+    def _fast_executemany_batch_size(self, parameters, context):
+        if not parameters:
+            return 1
+
+        # pyodbc는 칼럼마다 (칼럼 크기 * 문자 크기 + indicator) 만큼의 버퍼를
+        # 행 개수만큼 할당합니다. 칼럼 크기를 알 수 없는 경우에는 첫번째 행의 값으로
+        # 추정합니다.
+        inputsizes = context._tibero_input_sizes or ()
+        row_size = 0
+        for idx, value in enumerate(parameters[0]):
+            size = None
+            if idx < len(inputsizes):
+                size = inputsizes[idx][1]
+            if size is None:
+                if isinstance(value, (str, bytes, bytearray)):
+                    size = len(value)
+                else:
+                    size = 8
+            # UCS2로 바인딩되는 문자열을 고려해 2배로 계산합니다.
+            row_size += size * 2 + 8
+
+        return max(1, self.fast_executemany_memory_limit // max(row_size, 1))
+
+    def _add_to_batch(self, dbapi_connection, statement, parameters, context):
+        batch = self._session_state(dbapi_connection).setdefault("batch", [])
+        batch.append(
+            (
+                statement,
+                parameters,
+                context._tibero_input_sizes,
+                context.isupdate,
+            )
+        )
+        if (
+            len(batch) >= _BATCH_MAX_STATEMENTS
+            or sum(len(params) for _, params, _, _ in batch)
+            >= _BATCH_MAX_PARAMETERS
+        ):
+            self._execute_batch(dbapi_connection)
+
+    def _build_batch(self, batch):
+        lines = ["BEGIN"]
+        parameters = []
+        inputsizes = []
+        for statement, params, sizes, check_rowcount in batch:
+            lines.append(f"{statement};")
+            if check_rowcount:
+                # ORM은 UPDATE마다 rowcount가 1인지 검사합니다. 실제 rowcount를 돌려줄
+                # 수 없으므로 블록 안에서 검사하고 실패하면 블록 전체를 취소합니다.
+                lines.append(
+                    "IF SQL%ROWCOUNT <> 1 THEN RAISE_APPLICATION_ERROR("
+                    "-20000, 'batched UPDATE matched ' || SQL%ROWCOUNT || "
+                    "' row(s); expected 1'); END IF;"
+                )
+            parameters.extend(params)
+            inputsizes.extend(sizes or [(None, None, None)] * len(params))
+        lines.append("END;")
+        return "\n".join(lines), parameters, inputsizes
+
+    def _execute_batch(self, dbapi_connection):
+        state = self._session_state(dbapi_connection, create=False)
+        batch = state.pop("batch", None) if state else None
+        if not batch:
+            return None
+
+        block, parameters, inputsizes = self._build_batch(batch)
+        cursor = dbapi_connection.cursor()
+        try:
+            if parameters:
+                cursor.setinputsizes(inputsizes)
+            cursor.execute(block, parameters)
+        except self.loaded_dbapi.Error as err:
+            raise exc.DBAPIError.instance(
+                block, parameters, err, self.loaded_dbapi.Error, dialect=self
+            ) from err
+        finally:
+            cursor.close()
+        return len(batch)
+
+    def execute_batch(self, connection):
+        """Execute the statements collected while the ``tibero_batch_flush``
+        execution option was enabled on ``connection``.
+
+        Collected statements are also executed before any other statement,
+        and before a commit.  Returns the number of statements executed.
+        """
+        return self._execute_batch(connection.connection.dbapi_connection)
+
+    def do_commit(self, dbapi_connection):
+        self._execute_batch(dbapi_connection)
+        super().do_commit(dbapi_connection)
+
+    def do_rollback(self, dbapi_connection):
+        state = self._session_state(dbapi_connection, create=False)
+        if state:
+            state.pop("batch", None)
+        super().do_rollback(dbapi_connection)
+
+    def _session_state(self, dbapi_connection, create=True):
+        # pyodbc connection 객체에는 속성을 추가할 수 없고 weakref도 만들 수 없기
+        # 때문에 id()를 키로 사용해 connection마다 세션 상태를 저장합니다. 항목에
+        # connection 객체를 함께 저장하므로 항목이 있는 동안에는 같은 id가 다른
+        # connection에 재사용되지 않고, 항목은 pool이 connection을 닫을 때
+        # do_close()와 do_terminate()에서 지웁니다. 엔진(dialect 객체)이 달라도 같은
+        # 상태를 보도록 모듈 변수에 저장합니다.
+        #
+        # do_commit(), do_rollback()에는 pool의 connection proxy가 전달되므로
+        # DBAPI connection으로 바꿔서 찾습니다.
+        #
+        # 저장하는 상태는 다음과 같습니다.
+        #   autocommit: dbapi_connection.autocommit 값
+        #   parameters: ALTER SESSION으로 설정된 파라미터 (ISOLATION_LEVEL,
+        #               CURRENT_SCHEMA, NLS_* 등)
+        #   cursors: 문장별로 열어둔 _CachedCursor (LRU 순서)
+        #   batch: tibero_batch_flush로 모아둔 (문장, 파라미터, input size,
+        #          rowcount 검사 여부) 목록
+        if isinstance(dbapi_connection, pool.PoolProxiedConnection):
+            dbapi_connection = dbapi_connection.dbapi_connection
+        entry = _session_states.get(id(dbapi_connection))
+        if entry is not None and entry[0] is dbapi_connection:
+            return entry[1]
+        if not create:
+            return None
+        state = {"parameters": {}}
+        _session_states[id(dbapi_connection)] = (dbapi_connection, state)
+        return state
+
+    def _discard_session_state(self, dbapi_connection):
+        entry = _session_states.get(id(dbapi_connection))
+        if entry is not None and entry[0] is dbapi_connection:
+            del _session_states[id(dbapi_connection)]
+
+    def _checkout_cursor(self, dbapi_connection, statement, cache_size):
+        cache = self._session_state(dbapi_connection).setdefault(
+            "cursors", collections.OrderedDict()
+        )
+        cursor = cache.pop(statement, None)
+        if cursor is None:
+            return _CachedCursor(
+                dbapi_connection.cursor(), cache, statement, cache_size
+            )
+
+        # 이전 실행에서 설정된 값이 남아있지 않도록 초기화합니다. arraysize는
+        # create_default_cursor()에서 다시 설정합니다.
+        object.__setattr__(cursor, "_size", cache_size)
+        if getattr(cursor, "fast_executemany", False):
+            cursor.fast_executemany = False
+        cursor.setinputsizes(None)
+        return cursor
+
+    def alter_session(self, dbapi_connection, parameters):
+        """Run ``ALTER SESSION SET name=value`` for each of the given
+        parameters whose value differs from the one already set on
+        this connection.
+
+        Values are rendered into the statement as given, so string literals
+        must include their quotes.  Returns True if a statement was run.
+
+        Parameters changed by running ``ALTER SESSION`` directly are not
+        tracked.
+        """
+        current = self._session_state(dbapi_connection)["parameters"]
+        changed = [
+            (name.upper(), value)
+            for name, value in parameters.items()
+            if current.get(name.upper()) != value
+        ]
+        if not changed:
+            return False
+
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in changed:
+                cursor.execute(f"ALTER SESSION SET {name}={value}")
+                current[name] = value
+        finally:
+            cursor.close()
+        return True
+
+    def _set_autocommit(self, dbapi_connection, value):
+        state = self._session_state(dbapi_connection)
+        if state.get("autocommit") is not value:
+            dbapi_connection.autocommit = value
+            state["autocommit"] = value
+
     def get_isolation_level(
         self, dbapi_connection: DBAPIConnection
     ) -> IsolationLevel:
+        # set_isolation_level()로 설정했거나 이전에 조회한 적이 있다면 통신 없이
+        # 저장된 값을 반환합니다.
+        state = self._session_state(dbapi_connection)
+        if state.get("autocommit"):
+            return "AUTOCOMMIT"
+
+        parameters = state["parameters"]
+        level = parameters.get("ISOLATION_LEVEL")
+        if level is None:
+            level = parameters["ISOLATION_LEVEL"] = (
+                self._query_isolation_level(dbapi_connection)
+            )
+        return level
+
+    def _query_isolation_level(self, dbapi_connection):
         # general idea of transaction id, have to start one, etc.
         # https://stackoverflow.com/questions/10711204/how-to-check-isoloation-level
 
@@ -471,40 +1673,34 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
         # means transaction has to be started.
         cursor = dbapi_connection.cursor()
         try:
-            # 임시 함수 get_trans_id_34218484 생성 / 34218484는 임의의 숫자입니다.
-            # oracle은 out parameter를 지원하지만 pyodbc에서는 불가능한 것 같습니다.
-            # 이로 인해 편법으로 임시 함수를 만들고 select function() from dual 형식으로
-            # 사용 했습니다.
+            # 예전에는 out parameter를 사용할 수 없어서 임시 함수를 생성(DDL)하고 삭제했습니다.
+            # 이 방식은 연결할 때마다 통신이 4번 필요하고 여러 연결이 동시에 같은 함수 이름을
+            # 사용해 충돌할 수 있었습니다. 트랜잭션 시작은 익명 블록으로 하고 트랜잭션 ID는
+            # 인자 없이 local_transaction_id를 호출해 SELECT문 안에서 바로 비교합니다.
 
             # 티베로에는 local_transaction_id 함수가 존재하나 문서가 없습니다. 언제든 스펙이
             # 바뀔 수 있다는 문제가 있습니다.
             cursor.execute("""
-                CREATE FUNCTION get_trans_id_34218484 RETURN VARCHAR IS
+                DECLARE
                     trans_id VARCHAR(100);
                 BEGIN
                     trans_id := dbms_transaction.local_transaction_id(TRUE);
-                    RETURN trans_id;
                 END;
             """)
 
-            cursor.execute("SELECT get_trans_id_34218484 FROM dual")
-            trans_id = cursor.fetchone()[0]
-            xidusn, xidslot, xidsqn = trans_id.split(".", 2)
             # 티베로의 여러 view를 보면 (xidusn, xidslot, xidsqn) 또는 (usn, slot, wrap)
             # 칼럼명을 씁니다. 이를 보아 티베로 테이블 칼럼 이름의 통일성이 없는 문제가 있습니다.
             # flag의 내용이 oracle이랑 많이 다릅니다. 다른 연구원에게 물어서 대략적으로 transaction
             # level을 찾는 것을 알아냈지만 확실하지 않습니다. 문서도 없어서 아래의 코드는 언젠가 깨질 수도
             # 있습니다.
-            cursor.execute(
-                """
+            cursor.execute("""
                 SELECT CASE flag
                 WHEN 0 THEN 'SERIALIZABLE'
                 ELSE 'READ COMMITTED' END AS isolation_level
                 FROM v$transaction WHERE
-                usn = ? AND slot = ? AND wrap = ?
-                """,
-                (xidusn, xidslot, xidsqn),
-            )
+                usn || '.' || slot || '.' || wrap =
+                dbms_transaction.local_transaction_id
+            """)
             row = cursor.fetchone()
             if row is None:
                 raise exc.InvalidRequestError(
@@ -512,7 +1708,6 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
                 )
             result = row[0]
         finally:
-            cursor.execute("DROP FUNCTION GET_TRANS_ID_34218484")
             cursor.close()
 
         return result
@@ -522,8 +1717,10 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
         dbapi_connection: interfaces.DBAPIConnection,
         level: IsolationLevel,
     ) -> None:
+        # 커넥션 풀에서 꺼낼 때마다 같은 격리 수준을 다시 설정하는 경우가 많습니다.
+        # 세션에 이미 설정된 값과 같다면 ALTER SESSION과 commit()을 생략합니다.
         if level == "AUTOCOMMIT":
-            dbapi_connection.autocommit = True
+            self._set_autocommit(dbapi_connection, True)
         else:
             supported_levels = self.get_isolation_level_values(
                 dbapi_connection
@@ -532,10 +1729,22 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
                 level in supported_levels
             ), f"{level} is an unsupported isolation level"
 
-            dbapi_connection.autocommit = False
-            cursor = dbapi_connection.cursor()
-            cursor.execute(f"ALTER SESSION SET ISOLATION_LEVEL={level}")
-            cursor.commit()
+            self._set_autocommit(dbapi_connection, False)
+            if self.alter_session(
+                dbapi_connection, {"ISOLATION_LEVEL": level}
+            ):
+                # pyodbc의 cursor.commit()은 connection.commit()과 같습니다.
+                # aioodbc 어댑터의 cursor에는 commit()이 없기 때문에 connection에서
+                # 호출합니다.
+                dbapi_connection.commit()
+
+    def do_close(self, dbapi_connection):
+        self._discard_session_state(dbapi_connection)
+        super().do_close(dbapi_connection)
+
+    def do_terminate(self, dbapi_connection):
+        self._discard_session_state(dbapi_connection)
+        super().do_terminate(dbapi_connection)
 
     def on_connect(self):
         super_ = super().on_connect()
@@ -544,12 +1753,25 @@ class TiberoDialect_pyodbc(PyODBCConnector, TiberoDialect):
             if super_ is not None:
                 super_(conn)
 
-            _TiberoInterval._add_pyodbc_output_converter(conn)
+            self._discard_session_state(conn)
+            self._session_state(conn)["autocommit"] = conn.autocommit
+
+            for sqltype, (converter, _) in self._output_converters.items():
+                conn.add_output_converter(sqltype, converter)
 
             # declare Unicode encoding for pyodbc as per
             #   https://github.com/mkleehammer/pyodbc/wiki/Unicode
-            conn.setdecoding(pyodbc.SQL_CHAR, encoding=self.char_encoding)
-            conn.setdecoding(pyodbc.SQL_WCHAR, encoding=self.wchar_encoding)
+            conn.setdecoding(_SQL_CHAR, encoding=self.char_encoding)
+            conn.setdecoding(_SQL_WCHAR, encoding=self.wchar_encoding)
+
+            if self.nls_parameters:
+                self.alter_session(
+                    conn,
+                    {
+                        name: "'{}'".format(str(value).replace("'", "''"))
+                        for name, value in self.nls_parameters.items()
+                    },
+                )
 
         return on_connect
 
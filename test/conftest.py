@@ -1,9 +1,13 @@
 from sqlalchemy.dialects import registry
 import pytest
 
+registry.register("tibero", "sqlalchemy_tibero.pyodbc", "TiberoDialect_pyodbc")
 registry.register(
     "tibero.pyodbc", "sqlalchemy_tibero.pyodbc", "TiberoDialect_pyodbc"
 )
+registry.register(
+    "tibero.aioodbc", "sqlalchemy_tibero.aioodbc", "TiberoDialectAsync_aioodbc"
+)
 
 pytest.register_assert_rewrite("sqlalchemy.testing.assertions")
 
@@ -0,0 +1,1246 @@
+"""A pyodbc stand-in that runs the dialect's SQL on SQLite.
+
+It lets :class:`.TiberoDialect_pyodbc` be used end to end without a Tibero
+server or an ODBC DSN, and counts the round trips a real driver would
+make, optionally sleeping for a fixed latency on each one::
+
+    from test import fakeodbc
+
+    engine = fakeodbc.create_engine(latency=0.001)
+    with engine.begin() as conn:
+        conn.execute(table.insert(), rows)
+    print(engine.dialect.dbapi.round_trips)
+
+Keyword arguments other than those of :class:`.FakeODBC` are passed to
+:func:`sqlalchemy.create_engine`.  All connections of one
+:class:`.FakeODBC` share an in-memory database.
+
+What is emulated:
+
+* ``DUAL``, sequences (``CREATE SEQUENCE``, ``seq.nextval``,
+  ``CONNECT BY LEVEL <= n``), ``RETURNING ... INTO``, ``OFFSET ... ROWS
+  FETCH FIRST ... ROWS ONLY``, ``ALTER SESSION`` and the anonymous
+  blocks built by ``tibero_batch_flush`` and by ``executemany()`` with
+  ``RETURNING``, whose statements each return a result set read with
+  ``nextset()``;
+* the dictionary views of ``sqlalchemy_tibero/dictionary.py``, filled
+  from the SQLite catalog, enough for ``has_table()``, table names,
+  columns, primary keys, foreign keys, indexes and sequences;
+* NUMBER, DATE, TIMESTAMP and INTERVAL DAY TO SECOND values, including
+  the connection's output converters;
+* Oracle-style transactions: DDL commits, and ``autocommit`` works as in
+  pyodbc.
+
+One round trip is counted for each ``connect()``, ``execute()``,
+``commit()``, ``rollback()`` and autocommit change, for each parameter set
+of ``executemany()`` unless ``fast_executemany`` is set, and for each
+block of ``prefetch_rows`` rows fetched.  Anything else, such as
+PL/SQL, ``CONNECT BY`` queries other than the one above and most Tibero
+functions, raises ``ProgrammingError``.  Timings measured with this module
+say how many round trips a feature saves; they say nothing about server
+side cost.
+
+"""
+
+import collections
+import datetime
+import decimal
+import itertools
+import re
+import sqlite3
+import threading
+import time
+
+import sqlalchemy
+from sqlalchemy.dialects import registry
+
+from sqlalchemy_tibero import dictionary
+
+# 설치하지 않은 소스 트리에서도 사용할 수 있도록 test/conftest.py처럼 등록합니다.
+registry.register(
+    "tibero.pyodbc", "sqlalchemy_tibero.pyodbc", "TiberoDialect_pyodbc"
+)
+
+apilevel = "2.0"
+threadsafety = 1
+paramstyle = "qmark"
+
+# ODBC 표준 값이며 pyodbc의 상수와 같습니다.
+SQL_CHAR = 1
+SQL_NUMERIC = 2
+SQL_DECIMAL = 3
+SQL_INTEGER = 4
+SQL_SMALLINT = 5
+SQL_FLOAT = 6
+SQL_REAL = 7
+SQL_DOUBLE = 8
+SQL_VARCHAR = 12
+SQL_TYPE_DATE = 91
+SQL_TYPE_TIME = 92
+SQL_TYPE_TIMESTAMP = 93
+SQL_INTERVAL_DAY_TO_SECOND = 110
+SQL_LONGVARCHAR = -1
+SQL_BINARY = -2
+SQL_VARBINARY = -3
+SQL_LONGVARBINARY = -4
+SQL_BIGINT = -5
+SQL_WCHAR = -8
+SQL_WVARCHAR = -9
+SQL_WLONGVARCHAR = -10
+
+# connection.getinfo()
+SQL_DRIVER_NAME = 6
+SQL_DBMS_VER = 18
+
+# pyodbc처럼 DBAPI type object로 Python 타입을 사용합니다.
+STRING = str
+BINARY = bytearray
+NUMBER = float
+DATETIME = datetime.datetime
+ROWID = int
+Date = datetime.date
+Time = datetime.time
+Timestamp = datetime.datetime
+Binary = bytearray
+
+
+_type_objects = {
+    "STRING",
+    "BINARY",
+    "NUMBER",
+    "DATETIME",
+    "ROWID",
+    "Date",
+    "Time",
+    "Timestamp",
+    "Binary",
+}
+
+
+class Warning(Exception):
+    pass
+
+
+class Error(Exception):
+    pass
+
+
+class InterfaceError(Error):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class DataError(DatabaseError):
+    pass
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class InternalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class NotSupportedError(DatabaseError):
+    pass
+
+
+def _dbapi_error(err):
+    """Translate a sqlite3 error into the error pyodbc would raise."""
+    message = str(err)
+    if isinstance(err, sqlite3.IntegrityError):
+        return IntegrityError("23000", message)
+    elif "interrupted" in message:
+        return OperationalError("HY008", "Operation canceled")
+    elif isinstance(err, (sqlite3.OperationalError, sqlite3.ProgrammingError)):
+        return ProgrammingError("42000", message)
+    else:
+        return DatabaseError("HY000", message)
+
+
+class _Raw(tuple):
+    """A value of a Tibero type as the driver receives it: (ODBC SQL type,
+    bytes).  Converted by the connection's output converters."""
+
+    __slots__ = ()
+
+
+# CREATE TABLE에서 티베로 타입을 아래 SQLite 타입 이름으로 바꿉니다. SQLite는
+# PARSE_DECLTYPES로 이 이름의 converter를 호출하므로 값을 읽을 때 원래 타입을 알 수
+# 있습니다. 이름이 다른 코드와 겹치지 않도록 FAKEODBC_ 접두사를 붙였습니다.
+_DECLTYPES = {
+    "FAKEODBC_NUMBER": SQL_NUMERIC,
+    "FAKEODBC_DATE": SQL_TYPE_TIMESTAMP,
+    "FAKEODBC_TIMESTAMP": SQL_TYPE_TIMESTAMP,
+    "FAKEODBC_TIMESTAMPTZ": SQL_TYPE_TIMESTAMP,
+    "FAKEODBC_INTERVAL": SQL_INTERVAL_DAY_TO_SECOND,
+}
+for _name, _sqltype in _DECLTYPES.items():
+    sqlite3.register_converter(
+        _name, lambda value, sqltype=_sqltype: _Raw((sqltype, value))
+    )
+
+_description_types = {
+    SQL_NUMERIC: decimal.Decimal,
+    SQL_TYPE_TIMESTAMP: datetime.datetime,
+    SQL_INTERVAL_DAY_TO_SECOND: datetime.timedelta,
+}
+
+
+def _parse_interval(text):
+    days, _, clock = text.strip().partition(" ")
+    hours, minutes, seconds = clock.split(":")
+    return datetime.timedelta(
+        days=int(days),
+        hours=int(hours),
+        minutes=int(minutes),
+        seconds=float(seconds),
+    )
+
+
+def _default_conversion(sqltype, value):
+    text = value.decode()
+    if sqltype == SQL_NUMERIC:
+        return decimal.Decimal(text)
+    elif sqltype == SQL_TYPE_TIMESTAMP:
+        return datetime.datetime.fromisoformat(text)
+    else:
+        return _parse_interval(text)
+
+
+def _to_dsinterval(value):
+    # 티베로처럼 소수점 이하를 초 단위 분수로 읽고 6자리로 돌려줍니다.
+    if value is None:
+        return None
+    interval = _parse_interval(value)
+    hours, rest = divmod(interval.seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return (
+        f"{interval.days} {hours:02}:{minutes:02}:{seconds:02}"
+        f".{interval.microseconds:06}"
+    )
+
+
+def _regexp_like(value, pattern):
+    if value is None or pattern is None:
+        return None
+    return re.search(pattern, value) is not None
+
+
+def _bind_value(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(" ")
+    elif isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, decimal.Decimal):
+        return str(value)
+    elif isinstance(value, (bytearray, memoryview)):
+        return bytes(value)
+    return value
+
+
+# 문자열 literal 안의 ?는 bind parameter가 아닙니다.
+_literal_re = re.compile(r"'(?:[^']|'')*'")
+
+
+def _count_parameters(statement):
+    return _literal_re.sub("", statement).count("?")
+
+
+_identifier = r'(?:"[^"]+"|[A-Za-z_][\w$#]*)'
+
+_ddl_rewrites = [
+    (re.compile(r"\bNUMBER\b", re.IGNORECASE), "FAKEODBC_NUMBER"),
+    (re.compile(r"\bDATE\b", re.IGNORECASE), "FAKEODBC_DATE"),
+    (
+        re.compile(
+            r"\bTIMESTAMP\b(\s*\(\d+\))?(\s+WITH(\s+LOCAL)?\s+TIME\s+ZONE)?",
+            re.IGNORECASE,
+        ),
+        lambda m: (
+            "FAKEODBC_TIMESTAMP"
+            + ("TZ" if m.group(2) and not m.group(3) else "")
+            + (m.group(1) or "")
+        ),
+    ),
+    (
+        re.compile(
+            r"\bINTERVAL\s+DAY(\s*\(\d+\))?\s+TO\s+SECOND(\s*\(\d+\))?",
+            re.IGNORECASE,
+        ),
+        "FAKEODBC_INTERVAL",
+    ),
+    (
+        re.compile(
+            r"\s+GENERATED\s+(ALWAYS|BY\s+DEFAULT(\s+ON\s+NULL)?)\s+AS\s+"
+            r"IDENTITY(\s*\([^)]*\))?",
+            re.IGNORECASE,
+        ),
+        "",
+    ),
+    (re.compile(r"(\d+)\s+(CHAR|BYTE)\)", re.IGNORECASE), r"\1)"),
+]
+
+_statement_rewrites = [
+    (
+        re.compile(
+            rf"({_identifier}(?:\.{_identifier})?)\.(nextval|currval)\b",
+            re.IGNORECASE,
+        ),
+        lambda m: f"{m.group(2).lower()}('{m.group(1)}')",
+    ),
+    (
+        re.compile(
+            r"\bFROM\s+DUAL\s+CONNECT\s+BY\s+LEVEL\s*<=\s*(\d+)", re.IGNORECASE
+        ),
+        lambda m: (
+            'FROM (WITH RECURSIVE "level"(n) AS (SELECT 1 UNION ALL '
+            f'SELECT n + 1 FROM "level" WHERE n < {m.group(1)}) '
+            'SELECT n FROM "level")'
+        ),
+    ),
+    (
+        re.compile(
+            r"\bOFFSET\s+(\S+)\s+ROWS\s+FETCH\s+(?:FIRST|NEXT)\s+(\S+)\s+"
+            r"ROWS?\s+ONLY",
+            re.IGNORECASE,
+        ),
+        r"LIMIT \1, \2",
+    ),
+    (
+        re.compile(
+            r"\bFETCH\s+(?:FIRST|NEXT)\s+(\S+)\s+ROWS?\s+ONLY", re.IGNORECASE
+        ),
+        r"LIMIT \1",
+    ),
+    (
+        re.compile(r"\bOFFSET\s+(\S+)\s+ROWS\b", re.IGNORECASE),
+        r"LIMIT -1 OFFSET \1",
+    ),
+    (
+        re.compile(
+            r"\s+FOR\s+UPDATE(\s+OF\s+.*?)?(\s+NOWAIT|\s+WAIT\s+\d+|"
+            r"\s+SKIP\s+LOCKED)?\s*$",
+            re.IGNORECASE | re.DOTALL,
+        ),
+        "",
+    ),
+    # SQLite에는 EXCEPT ALL이 없습니다. 딕셔너리 조회에서는 중복이 없습니다.
+    (re.compile(r"\bEXCEPT\s+ALL\b", re.IGNORECASE), "EXCEPT"),
+    (re.compile(r"\bdbms_lob\.(\w+)\(", re.IGNORECASE), r"dbms_lob_\1("),
+    (
+        re.compile(
+            r"\bdbms_transaction\.local_transaction_id\b", re.IGNORECASE
+        ),
+        "'1.1.1'",
+    ),
+]
+
+_returning_into_re = re.compile(
+    r"\s+INTO\s+\?(?:\s*,\s*\?)*\s*$", re.IGNORECASE
+)
+_sequence_re = re.compile(
+    rf"^\s*(CREATE|DROP)\s+SEQUENCE\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?"
+    rf"({_identifier}(?:\.{_identifier})?)(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_alter_session_re = re.compile(
+    r"^\s*ALTER\s+SESSION\s+SET\s+(\w+)\s*=\s*(.*?)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_isolation_block_re = re.compile(
+    r"^\s*DECLARE\b.*\blocal_transaction_id\b.*\bEND;\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_rowcount_check_re = re.compile(
+    r"^IF\s+SQL%ROWCOUNT\s*<>\s*1\s+THEN\b", re.IGNORECASE
+)
+_dictionary_re = re.compile(r"\ball_\w+", re.IGNORECASE)
+_ddl_words = {"CREATE", "DROP", "ALTER", "TRUNCATE", "COMMENT", "GRANT"}
+_dml_words = {"INSERT", "UPDATE", "DELETE", "MERGE", "SAVEPOINT"}
+
+
+def _sequence_name(name):
+    name = name.rsplit(".", 1)[-1]
+    if name.startswith('"'):
+        return name[1:-1]
+    return name.upper()
+
+
+def _dictionary_name(name):
+    # 따옴표 없이 만든 소문자 이름은 티베로에서 대문자로 저장됩니다.
+    return name.upper() if name == name.lower() else name
+
+
+class _Sequence:
+    def __init__(self, start, increment):
+        self.increment = increment
+        self.next = start
+        self.current = None
+
+
+class _Database:
+    """The in-memory database shared by all connections of a
+    :class:`.FakeODBC`."""
+
+    _counter = itertools.count()
+
+    def __init__(self, user):
+        self.user = user
+        self.uri = (
+            f"file:fakeodbc{next(self._counter)}?mode=memory&cache=shared"
+        )
+        self.lock = threading.Lock()
+        self.sequences = {}
+        self.dictionary_stale = True
+        # 공유 메모리 DB는 마지막 연결이 닫히면 사라지므로 하나를 열어둡니다.
+        self.anchor = sqlite3.connect(
+            self.uri, uri=True, isolation_level=None, check_same_thread=False
+        )
+        self.anchor.execute("CREATE TABLE dual (dummy VARCHAR(1))")
+        self.anchor.execute("INSERT INTO dual VALUES ('X')")
+        for table in dictionary.dictionary_meta.tables.values():
+            name = table.name.replace(dictionary.DB_LINK_PLACEHOLDER, "")
+            columns = ", ".join(f'"{c.name}"' for c in table.c)
+            self.anchor.execute(f"CREATE TABLE {name} ({columns})")
+
+    def nextval(self, name):
+        with self.lock:
+            sequence = self._sequence(name)
+            sequence.current = sequence.next
+            sequence.next += sequence.increment
+            return sequence.current
+
+    def currval(self, name):
+        with self.lock:
+            return self._sequence(name).current
+
+    def _sequence(self, name):
+        try:
+            return self.sequences[_sequence_name(name)]
+        except KeyError:
+            raise ValueError(f"sequence {name} does not exist") from None
+
+    def sequence_ddl(self, match):
+        verb, name, options = match.groups()
+        name = _sequence_name(name)
+        with self.lock:
+            if verb.upper() == "DROP":
+                if self.sequences.pop(name, None) is None:
+                    raise ProgrammingError(
+                        "42000", f"sequence {name} does not exist"
+                    )
+            else:
+                if name in self.sequences:
+                    raise ProgrammingError(
+                        "42000", f"sequence {name} already exists"
+                    )
+                start = re.search(
+                    r"START\s+WITH\s+(-?\d+)", options, re.IGNORECASE
+                )
+                increment = re.search(
+                    r"INCREMENT\s+BY\s+(-?\d+)", options, re.IGNORECASE
+                )
+                self.sequences[name] = _Sequence(
+                    int(start.group(1)) if start else 1,
+                    int(increment.group(1)) if increment else 1,
+                )
+            self.dictionary_stale = True
+
+    def refresh_dictionary(self, conn):
+        """Fill the dictionary tables from the SQLite catalog."""
+        rows = collections.defaultdict(list)
+        owner = self.user
+        objects = conn.execute(
+            "SELECT type, name, tbl_name, sql FROM sqlite_master "
+            "WHERE name NOT LIKE 'sqlite_%' ORDER BY rowid"
+        ).fetchall()
+        dictionary_tables = {
+            t.name.replace(dictionary.DB_LINK_PLACEHOLDER, "")
+            for t in dictionary.dictionary_meta.tables.values()
+        } | {"dual"}
+        object_ids = itertools.count(1)
+
+        for type_, name, table_name, sql in objects:
+            if table_name in dictionary_tables:
+                continue
+            object_name = _dictionary_name(name)
+            if type_ in ("table", "view"):
+                rows["all_objects"].append(
+                    {
+                        "owner": owner,
+                        "object_name": object_name,
+                        "object_id": next(object_ids),
+                        "object_type": type_.upper(),
+                        "status": "VALID",
+                        "temporary": "N",
+                    }
+                )
+            if type_ == "table":
+                self._table_rows(conn, rows, owner, name)
+            elif type_ == "view":
+                rows["all_views"].append(
+                    {
+                        "owner": owner,
+                        "view_name": object_name,
+                        "text": re.split(r"\bAS\b", sql, 1, re.IGNORECASE)[
+                            -1
+                        ].strip(),
+                    }
+                )
+
+        for name, sequence in self.sequences.items():
+            rows["all_objects"].append(
+                {
+                    "owner": owner,
+                    "object_name": name,
+                    "object_id": next(object_ids),
+                    "object_type": "SEQUENCE",
+                    "status": "VALID",
+                    "temporary": "N",
+                }
+            )
+            rows["all_sequences"].append(
+                {
+                    "sequence_owner": owner,
+                    "sequence_name": name,
+                    "increment_by": sequence.increment,
+                    "cache_size": 0,
+                    "last_number": sequence.next,
+                }
+            )
+        rows["all_users"].append(
+            {"username": owner, "user_id": 1, "created": "2024-01-01"}
+        )
+
+        for name in (
+            "all_objects",
+            "all_tables",
+            "all_views",
+            "all_tab_cols",
+            "all_constraints",
+            "all_cons_columns",
+            "all_indexes",
+            "all_ind_columns",
+            "all_sequences",
+            "all_users",
+        ):
+            conn.execute(f"DELETE FROM {name}")
+            for row in rows[name]:
+                conn.execute(
+                    f"INSERT INTO {name} "
+                    f"({', '.join(f'{chr(34)}{c}{chr(34)}' for c in row)}) "
+                    f"VALUES ({', '.join('?' * len(row))})",
+                    list(row.values()),
+                )
+
+    def _table_rows(self, conn, rows, owner, name):
+        table_name = _dictionary_name(name)
+        rows["all_tables"].append(
+            {
+                "owner": owner,
+                "table_name": table_name,
+                "tablespace_name": "USR",
+                "temporary": "N",
+                "compression": "DISABLED",
+                "partitioned": "NO",
+            }
+        )
+
+        columns = conn.execute(
+            'SELECT cid, name, type, "notnull", dflt_value, pk '
+            "FROM pragma_table_info(?)",
+            (name,),
+        ).fetchall()
+        primary_key = []
+        for cid, column, type_, notnull, default, pk in columns:
+            data_type, length, precision, scale = _dictionary_type(type_)
+            rows["all_tab_cols"].append(
+                {
+                    "owner": owner,
+                    "table_name": table_name,
+                    "column_name": _dictionary_name(column),
+                    "data_type": data_type,
+                    "data_length": length,
+                    "data_precision": precision,
+                    "data_scale": scale,
+                    "nullable": "N" if notnull or pk else "Y",
+                    "column_id": cid + 1,
+                    "data_default": default,
+                    "char_length": length if "CHAR" in data_type else 0,
+                    "char_used": "C" if "CHAR" in data_type else None,
+                    "hidden_column": "N",
+                    "virtual_column": "NO",
+                    "internal_column_id": cid + 1,
+                }
+            )
+            if pk:
+                primary_key.append((pk, column))
+
+        if primary_key:
+            constraint = f"{table_name}_PK"
+            self._constraint_rows(
+                rows,
+                owner,
+                table_name,
+                constraint,
+                "P",
+                [column for _, column in sorted(primary_key)],
+            )
+
+        foreign_keys = collections.defaultdict(list)
+        for id_, seq, target, column, target_column in conn.execute(
+            'SELECT id, seq, "table", "from", "to" '
+            "FROM pragma_foreign_key_list(?)",
+            (name,),
+        ):
+            foreign_keys[id_].append((seq, target, column, target_column))
+        for id_, references in sorted(foreign_keys.items()):
+            references.sort()
+            target = _dictionary_name(references[0][1])
+            constraint = f"{table_name}_FK{id_ + 1}"
+            self._constraint_rows(
+                rows,
+                owner,
+                table_name,
+                constraint,
+                "R",
+                [column for _, _, column, _ in references],
+                r_owner=owner,
+                r_constraint_name=f"{target}_PK",
+            )
+
+        for _, index, unique, origin, _ in conn.execute(
+            'SELECT seq, name, "unique", origin, partial '
+            "FROM pragma_index_list(?)",
+            (name,),
+        ):
+            if origin == "pk":
+                continue
+            index_columns = [
+                column
+                for _, column in sorted(
+                    conn.execute(
+                        "SELECT seqno, name FROM pragma_index_info(?)",
+                        (index,),
+                    )
+                )
+            ]
+            if origin == "u":
+                index = f"{table_name}_UK{len(rows['all_constraints'])}"
+                self._constraint_rows(
+                    rows, owner, table_name, index, "U", index_columns
+                )
+            index_name = _dictionary_name(index)
+            rows["all_indexes"].append(
+                {
+                    "owner": owner,
+                    "index_name": index_name,
+                    "index_type": "NORMAL",
+                    "table_owner": owner,
+                    "table_name": table_name,
+                    "table_type": "TABLE",
+                    "uniqueness": "UNIQUE" if unique else "NONUNIQUE",
+                    "compression": "DISABLED",
+                    "status": "VALID",
+                    "generated_by_system": "N" if origin == "c" else "Y",
+                }
+            )
+            for position, column in enumerate(index_columns, 1):
+                rows["all_ind_columns"].append(
+                    {
+                        "index_owner": owner,
+                        "index_name": index_name,
+                        "table_owner": owner,
+                        "table_name": table_name,
+                        "column_name": _dictionary_name(column),
+                        "column_position": position,
+                        "column_length": 0,
+                        "descend": "ASC",
+                    }
+                )
+
+    def _constraint_rows(
+        self, rows, owner, table_name, constraint, type_, columns, **kw
+    ):
+        rows["all_constraints"].append(
+            {
+                "owner": owner,
+                "constraint_name": constraint,
+                "constraint_type": type_,
+                "table_name": table_name,
+                "status": "ENABLED",
+                "deferrable": "NOT DEFERRABLE",
+                "deferred": "IMMEDIATE",
+                "delete_rule": "NO ACTION" if type_ == "R" else None,
+                **kw,
+            }
+        )
+        for position, column in enumerate(columns, 1):
+            rows["all_cons_columns"].append(
+                {
+                    "owner": owner,
+                    "constraint_name": constraint,
+                    "table_name": table_name,
+                    "column_name": _dictionary_name(column),
+                    "position": position,
+                }
+            )
+
+
+# SQLite의 선언 타입 이름을 티베로 딕셔너리의 data_type으로 바꿉니다.
+_dictionary_types = {
+    "FAKEODBC_NUMBER": "NUMBER",
+    "NUMERIC": "NUMBER",
+    "DECIMAL": "NUMBER",
+    "FAKEODBC_DATE": "DATE",
+    "VARCHAR2": "VARCHAR",
+    "NVARCHAR2": "NVARCHAR",
+}
+
+
+def _dictionary_type(decltype):
+    """Return (data_type, data_length, data_precision, data_scale) of the
+    original Tibero type of a column."""
+    match = re.match(
+        r"\s*(\w+)\s*(?:\(\s*(\d+)\s*(?:,\s*(-?\d+))?\s*\))?", decltype
+    )
+    if match is None:
+        return "VARCHAR", 4000, None, None
+    name, first, second = match.groups()
+    name = _dictionary_types.get(name.upper(), name.upper())
+    first = int(first) if first is not None else None
+    second = int(second) if second is not None else None
+    if name == "NUMBER":
+        return name, 22, first, second
+    elif name in ("INTEGER", "SMALLINT", "BIGINT"):
+        # 티베로는 INTEGER를 NUMBER(38, 0)으로 저장합니다.
+        return "NUMBER", 22, 38, 0
+    elif name == "DATE":
+        return name, 7, None, None
+    elif name.startswith("FAKEODBC_TIMESTAMP"):
+        scale = 6 if first is None else first
+        suffix = " WITH TIME ZONE" if name.endswith("TZ") else ""
+        return f"TIMESTAMP({scale}){suffix}", 11, None, scale
+    elif name == "FAKEODBC_INTERVAL":
+        return "INTERVAL DAY(2) TO SECOND(6)", 11, 2, 6
+    else:
+        return name, first or 0, None, None
+
+
+class Cursor:
+    """pyodbc.Cursor over a SQLite cursor; see :class:`.Connection`."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 1
+        self.fast_executemany = False
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+        self._position = 0
+        self._sent = 0
+        self._result_sets = []
+        self._closed = False
+
+    def _check_open(self):
+        if self._closed or self.connection.closed:
+            raise ProgrammingError("HY010", "Attempt to use a closed cursor.")
+
+    def setinputsizes(self, sizes):
+        pass
+
+    def cancel(self):
+        self.connection._sqlite.interrupt()
+
+    def close(self):
+        self._closed = True
+        self._rows = []
+
+    def execute(self, statement, *parameters):
+        self._check_open()
+        if len(parameters) == 1 and isinstance(parameters[0], (list, tuple)):
+            parameters = parameters[0]
+        self.connection._dbapi._round_trip()
+        self._set_result(self.connection._execute(statement, list(parameters)))
+        return self
+
+    def executemany(self, statement, seq_of_parameters):
+        self._check_open()
+        seq_of_parameters = [list(p) for p in seq_of_parameters]
+        if self.fast_executemany:
+            self.connection._dbapi._round_trip()
+        rowcount = 0
+        for parameters in seq_of_parameters:
+            if not self.fast_executemany:
+                self.connection._dbapi._round_trip()
+            _, _, count = self.connection._execute(statement, parameters)
+            rowcount += max(count, 0)
+        self._set_result((None, [], rowcount))
+
+    def _set_result(self, result):
+        # 블록의 RETURNING 결과처럼 결과 집합이 여러 개이면 나머지는 nextset()이
+        # 차례대로 돌려줍니다.
+        self.description, self._rows, self.rowcount = result[:3]
+        self._result_sets = list(result[3:])
+        self._position = 0
+        self._sent = 0
+
+    def _take(self, count):
+        self._check_open()
+        if self.description is None:
+            raise ProgrammingError(
+                "24000", "No results.  Previous SQL was not a query."
+            )
+        dbapi = self.connection._dbapi
+        end = min(self._position + count, len(self._rows))
+        while self._sent < end:
+            dbapi._round_trip()
+            self._sent += dbapi.prefetch_rows
+        if end == self._position and self._sent <= len(self._rows):
+            # 마지막 block이 가득 찼다면 끝을 확인하는 fetch가 한번 더 필요합니다.
+            dbapi._round_trip()
+            self._sent = len(self._rows) + 1
+        rows = self._rows[self._position : end]
+        self._position = end
+        return rows
+
+    def fetchone(self):
+        rows = self._take(1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size=None):
+        return self._take(self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._take(len(self._rows) - self._position)
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def nextset(self):
+        self._check_open()
+        if not self._result_sets:
+            self.description, self._rows = None, []
+            return False
+        self._set_result(self._result_sets[0] + tuple(self._result_sets[1:]))
+        return True
+
+
+class Connection:
+    """pyodbc.Connection over a SQLite connection.
+
+    Tibero-specific SQL is rewritten for SQLite before execution; see the
+    module docstring for what is supported.
+    """
+
+    def __init__(self, dbapi, autocommit):
+        self._dbapi = dbapi
+        self._database = dbapi._database
+        self._sqlite = sqlite3.connect(
+            self._database.uri,
+            uri=True,
+            isolation_level=None,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        self._autocommit = autocommit
+        self._converters = {}
+        self.session_parameters = {}
+        self.closed = False
+
+        database = self._database
+        functions = [
+            ("nextval", 1, database.nextval),
+            ("currval", 1, database.currval),
+            ("sys_context", 2, self._sys_context),
+            ("to_dsinterval", 1, _to_dsinterval),
+            ("to_date", -1, lambda value, *fmt: value),
+            ("to_timestamp", -1, lambda value, *fmt: value),
+            (
+                "nvl",
+                2,
+                lambda value, default: default if value is None else value,
+            ),
+            ("regexp_like", 2, _regexp_like),
+            ("rowidtochar", 1, str),
+            ("chartorowid", 1, int),
+            ("dbms_lob_getlength", 1, lambda v: None if v is None else len(v)),
+            (
+                "dbms_lob_substr",
+                3,
+                lambda v, amount, offset: (
+                    None if v is None else v[offset - 1 : offset - 1 + amount]
+                ),
+            ),
+            ("isolation_flag", 0, self._isolation_flag),
+        ]
+        for name, nargs, fn in functions:
+            self._sqlite.create_function(name, nargs, fn)
+        # _query_isolation_level()이 조회하는 view입니다.
+        self._sqlite.execute(
+            'CREATE TEMP VIEW "v$transaction" AS '
+            "SELECT 1 AS usn, 1 AS slot, 1 AS wrap, isolation_flag() AS flag"
+        )
+
+    def _sys_context(self, namespace, parameter):
+        if parameter.lower() in (
+            "current_schema",
+            "current_user",
+            "session_user",
+        ):
+            return self._database.user
+        return None
+
+    def _isolation_flag(self):
+        level = self.session_parameters.get("ISOLATION_LEVEL", "")
+        return 0 if "SERIALIZABLE" in level.upper() else 1
+
+    @property
+    def autocommit(self):
+        return self._autocommit
+
+    @autocommit.setter
+    def autocommit(self, value):
+        # SQL_ATTR_AUTOCOMMIT을 켜면 진행 중인 트랜잭션이 commit됩니다.
+        self._check_open()
+        self._dbapi._round_trip()
+        if value and self._sqlite.in_transaction:
+            self._sqlite.execute("COMMIT")
+        self._autocommit = bool(value)
+
+    def _check_open(self):
+        if self.closed:
+            raise ProgrammingError(
+                "08003", "Attempt to use a closed connection."
+            )
+
+    def cursor(self):
+        self._check_open()
+        return Cursor(self)
+
+    def commit(self):
+        self._check_open()
+        self._dbapi._round_trip()
+        if self._sqlite.in_transaction:
+            self._sqlite.execute("COMMIT")
+
+    def rollback(self):
+        self._check_open()
+        self._dbapi._round_trip()
+        if self._sqlite.in_transaction:
+            self._sqlite.execute("ROLLBACK")
+
+    def close(self):
+        if not self.closed:
+            if self._sqlite.in_transaction:
+                self._sqlite.execute("ROLLBACK")
+            self._sqlite.close()
+            self.closed = True
+
+    def add_output_converter(self, sqltype, func):
+        if func is None:
+            self._converters.pop(sqltype, None)
+        else:
+            self._converters[sqltype] = func
+
+    def remove_output_converter(self, sqltype):
+        self._converters.pop(sqltype, None)
+
+    def clear_output_converters(self):
+        self._converters.clear()
+
+    def setdecoding(self, sqltype, encoding=None, ctype=None):
+        pass
+
+    def setencoding(self, encoding=None, ctype=None):
+        pass
+
+    def getinfo(self, info_type):
+        if info_type == SQL_DBMS_VER:
+            return self._dbapi.server_version
+        elif info_type == SQL_DRIVER_NAME:
+            return "fakeodbc"
+        raise ProgrammingError("HY096", f"unsupported info type {info_type}")
+
+    def _execute(self, statement, parameters):
+        """Run one statement; returns (description, rows, rowcount)."""
+        self._check_open()
+        try:
+            return self._execute_statement(statement, parameters)
+        except sqlite3.Error as err:
+            raise _dbapi_error(err) from err
+        except ValueError as err:
+            # 사용자 정의 함수에서 발생한 오류입니다.
+            raise ProgrammingError("42000", str(err)) from err
+
+    def _execute_statement(self, statement, parameters):
+        first_word = statement.lstrip().split(None, 1)[0].upper()
+
+        match = _alter_session_re.match(statement)
+        if match:
+            name, value = match.groups()
+            self.session_parameters[name.upper()] = value.strip("'")
+            return None, [], 0
+
+        if first_word in ("BEGIN", "DECLARE"):
+            return self._execute_block(statement, parameters)
+
+        match = _sequence_re.match(statement)
+        if match:
+            self._end_transaction()
+            self._database.sequence_ddl(match)
+            return None, [], 0
+
+        if first_word in _ddl_words:
+            self._end_transaction()
+            if first_word in ("COMMENT", "GRANT"):
+                return None, [], 0
+            if first_word == "TRUNCATE":
+                statement = re.sub(
+                    r"^\s*TRUNCATE\s+TABLE",
+                    "DELETE FROM",
+                    statement,
+                    flags=re.IGNORECASE,
+                )
+            for pattern, replacement in _ddl_rewrites:
+                statement = pattern.sub(replacement, statement)
+            self._sqlite.execute(statement, parameters)
+            self._database.dictionary_stale = True
+            return None, [], 0
+
+        return self._execute_dml(statement, parameters, first_word)
+
+    def _end_transaction(self):
+        # 티베로는 DDL 전에 진행 중인 트랜잭션을 commit합니다.
+        if self._sqlite.in_transaction:
+            self._sqlite.execute("COMMIT")
+
+    def _execute_dml(self, statement, parameters, first_word):
+        if "RETURNING" in statement.upper():
+            match = _returning_into_re.search(statement)
+            if match:
+                count = match.group(0).count("?")
+                statement = statement[: match.start()]
+                parameters = parameters[: len(parameters) - count]
+        for pattern, replacement in _statement_rewrites:
+            statement = pattern.sub(replacement, statement)
+
+        if self._database.dictionary_stale and _dictionary_re.search(
+            statement
+        ):
+            with self._database.lock:
+                self._database.refresh_dictionary(self._sqlite)
+                self._database.dictionary_stale = False
+
+        if (
+            first_word in _dml_words
+            and not self._autocommit
+            and not self._sqlite.in_transaction
+        ):
+            self._sqlite.execute("BEGIN")
+
+        cursor = self._sqlite.execute(
+            statement, [_bind_value(value) for value in parameters]
+        )
+        if cursor.description is None:
+            return None, [], cursor.rowcount
+
+        rows = cursor.fetchall()
+        description = self._description(cursor.description, rows)
+        rows = [self._convert(row) for row in rows]
+        rowcount = -1 if first_word in ("SELECT", "WITH") else cursor.rowcount
+        return description, rows, rowcount
+
+    def _convert(self, row):
+        values = list(row)
+        for idx, value in enumerate(values):
+            if type(value) is _Raw:
+                sqltype, raw = value
+                converter = self._converters.get(sqltype)
+                if converter is not None:
+                    values[idx] = converter(raw)
+                else:
+                    values[idx] = _default_conversion(sqltype, raw)
+        return tuple(values)
+
+    def _description(self, sqlite_description, rows):
+        description = []
+        for idx, column in enumerate(sqlite_description):
+            name = column[0]
+            # 따옴표 없는 이름은 티베로가 대문자로 돌려줍니다.
+            if re.fullmatch(r"[a-z_][a-z0-9_$#]*", name):
+                name = name.upper()
+            description.append(
+                (
+                    name,
+                    self._column_type(idx, rows),
+                    None,
+                    None,
+                    None,
+                    None,
+                    True,
+                )
+            )
+        return description
+
+    def _column_type(self, idx, rows):
+        # pyodbc처럼 type_code로 Python 타입을 사용합니다. SQLite는 NULL의
+        # 타입을 알려주지 않으므로 NULL뿐인 칼럼은 str입니다.
+        for row in rows:
+            value = row[idx]
+            if type(value) is _Raw:
+                return _description_types[value[0]]
+            elif value is not None:
+                return type(value)
+        return str
+
+    def _execute_block(self, statement, parameters):
+        if _isolation_block_re.match(statement):
+            # _query_isolation_level()이 트랜잭션을 시작하는 블록입니다.
+            if not self._autocommit and not self._sqlite.in_transaction:
+                self._sqlite.execute("BEGIN")
+            return None, [], -1
+
+        body = statement.strip()
+        if not (
+            body.upper().startswith("BEGIN") and body.upper().endswith("END;")
+        ):
+            raise ProgrammingError("42000", "unsupported PL/SQL block")
+        pieces = [
+            piece.strip()
+            for piece in body[len("BEGIN") : -len("END;")].split(";\n")
+        ]
+        pieces = [piece.rstrip(";") for piece in pieces if piece.strip()]
+
+        if not self._autocommit and not self._sqlite.in_transaction:
+            self._sqlite.execute("BEGIN")
+        self._sqlite.execute("SAVEPOINT fakeodbc_block")
+        results = []
+        try:
+            rowcount = 0
+            for piece in pieces:
+                if _rowcount_check_re.match(piece):
+                    if rowcount != 1:
+                        raise DatabaseError(
+                            "HY000",
+                            "TBR-20000: batched UPDATE matched "
+                            f"{rowcount} row(s); expected 1",
+                        )
+                    continue
+                count = _count_parameters(piece)
+                piece_parameters = parameters[:count]
+                parameters = parameters[count:]
+                first_word = piece.split(None, 1)[0].upper()
+                if first_word not in _dml_words:
+                    raise ProgrammingError(
+                        "42000",
+                        f"unsupported statement in PL/SQL block: {piece}",
+                    )
+                result = self._execute_dml(piece, piece_parameters, first_word)
+                rowcount = result[2]
+                if _returning_into_re.search(piece):
+                    # RETURNING ... INTO는 문장마다 결과 집합을 돌려줍니다.
+                    results.append(result)
+        except BaseException:
+            self._sqlite.execute("ROLLBACK TO fakeodbc_block")
+            self._sqlite.execute("RELEASE fakeodbc_block")
+            raise
+        self._sqlite.execute("RELEASE fakeodbc_block")
+        if results:
+            return tuple(results[0]) + tuple(results[1:])
+        return None, [], -1
+
+
+class FakeODBC:
+    """The DBAPI module; pass it as ``module`` to
+    :func:`sqlalchemy.create_engine`.
+
+    :param latency: seconds to sleep on every round trip.
+    :param prefetch_rows: rows the driver transfers per fetch round trip.
+    :param server_version: returned for ``SQL_DBMS_VER``.
+    :param user: the current schema, and the owner of every object.
+    """
+
+    apilevel = apilevel
+    threadsafety = threadsafety
+    paramstyle = paramstyle
+    version = "5.1.0"
+    pooling = False
+
+    Warning = Warning
+    Error = Error
+    InterfaceError = InterfaceError
+    DatabaseError = DatabaseError
+    DataError = DataError
+    OperationalError = OperationalError
+    IntegrityError = IntegrityError
+    InternalError = InternalError
+    ProgrammingError = ProgrammingError
+    NotSupportedError = NotSupportedError
+
+    def __init__(
+        self,
+        latency=0.0,
+        prefetch_rows=100,
+        server_version="7.2.1",
+        user="TIBERO",
+    ):
+        self.latency = latency
+        self.prefetch_rows = prefetch_rows
+        self.server_version = server_version
+        self.round_trips = 0
+        self._lock = threading.Lock()
+        self._database = _Database(user)
+
+    def __getattr__(self, key):
+        # SQL_* 상수와 type object는 모듈 변수를 사용합니다.
+        if key.startswith("SQL_") or key in _type_objects:
+            try:
+                return globals()[key]
+            except KeyError:
+                pass
+        raise AttributeError(key)
+
+    def _round_trip(self):
+        with self._lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def connect(self, connection_string="", autocommit=False, **kwargs):
+        self._round_trip()
+        return Connection(self, autocommit)
+
+    def reset(self):
+        """Set :attr:`round_trips` back to zero."""
+        with self._lock:
+            self.round_trips = 0
+
+
+def create_engine(
+    latency=0.0,
+    prefetch_rows=100,
+    server_version="7.2.1",
+    user="TIBERO",
+    **kwargs,
+):
+    """Return an :class:`.Engine` for ``tibero+pyodbc://`` on a new
+    :class:`.FakeODBC`, available as ``engine.dialect.dbapi``."""
+    return sqlalchemy.create_engine(
+        "tibero+pyodbc://",
+        module=FakeODBC(latency, prefetch_rows, server_version, user),
+        **kwargs,
+    )
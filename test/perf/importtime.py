@@ -0,0 +1,98 @@
+"""Measure how long ``import sqlalchemy_tibero`` takes on top of
+``import sqlalchemy``, and check that it stays within a budget.
+
+No database is needed; each run is a fresh interpreter started with
+``python -X importtime``::
+
+    python -m test.perf.importtime
+    python -m test.perf.importtime --budget 40 --verbose
+
+Exits with status 1 when the best of ``--repeat`` runs takes longer than
+``--budget`` milliseconds, or when the import loads a module that should
+only be loaded when the dialect is first used (the DBAPI drivers, the
+dialect modules and the dictionary views).
+
+"""
+
+import argparse
+import subprocess
+import sys
+
+PACKAGE = "sqlalchemy_tibero"
+
+# create_engine()이나 reflection을 처음 사용할 때까지 import하지 않는 모듈입니다.
+DEFERRED_MODULES = (
+    "pyodbc",
+    "aioodbc",
+    "sqlalchemy_tibero.pyodbc",
+    "sqlalchemy_tibero.aioodbc",
+    "sqlalchemy_tibero.dictionary",
+)
+
+
+def measure():
+    """Return {module: (self us, cumulative us)} of the modules imported by
+    ``import sqlalchemy_tibero`` in a fresh interpreter."""
+    # sqlalchemy를 먼저 import해서 이 패키지가 추가하는 시간만 측정합니다.
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sqlalchemy; import {PACKAGE}",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    # 모듈은 import가 끝난 순서로 출력되므로 sqlalchemy 다음 줄부터가 이 패키지가
+    # import한 모듈입니다.
+    modules = None
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            # 머리글 줄입니다.
+            continue
+        if modules is not None:
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        elif name.strip() == "sqlalchemy":
+            modules = {}
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=50.0, help="ms")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--verbose", action="store_true")
+    options = parser.parse_args()
+
+    runs = [measure() for _ in range(options.repeat)]
+    best = min(runs, key=lambda modules: modules[PACKAGE][1])
+    total = best[PACKAGE][1] / 1000
+
+    if options.verbose:
+        for name, (self_us, _) in sorted(
+            best.items(), key=lambda item: -item[1][0]
+        ):
+            print(f"{name:<48} {self_us / 1000:>8.2f} ms")
+    print(f"import {PACKAGE}: {total:.2f} ms (budget {options.budget:g} ms)")
+
+    failed = False
+    loaded = [name for name in DEFERRED_MODULES if name in best]
+    if loaded:
+        print("imported before the dialect was used: " + ", ".join(loaded))
+        failed = True
+    if total > options.budget:
+        print(f"over budget by {total - options.budget:.2f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Compare the statement forms used to INSERT many rows at once, on a
+narrow and on a wide table.
+
+Requires a Tibero database::
+
+    python -m test.perf.insertmanyvalues \
+        --dburi tibero+pyodbc://@Tibero7 --rows 20000 --columns 5 100
+
+"""
+
+import argparse
+import time
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine
+
+# (이름, create_engine() 인자, 실행 옵션)
+STRATEGIES = [
+    ("executemany", {}, {"tibero_fast_executemany": False}),
+    ("fast_executemany", {}, {"tibero_fast_executemany": True}),
+    (
+        "values",
+        {
+            "use_insertmanyvalues_wo_returning": True,
+            "insertmanyvalues_form": "values",
+        },
+        {},
+    ),
+    (
+        "insert_all",
+        {
+            "use_insertmanyvalues_wo_returning": True,
+            "insertmanyvalues_form": "insert_all",
+        },
+        {},
+    ),
+    (
+        "union_all",
+        {
+            "use_insertmanyvalues_wo_returning": True,
+            "insertmanyvalues_form": "union_all",
+        },
+        {},
+    ),
+]
+
+
+def _table(columns):
+    return Table(
+        "perf_insertmanyvalues",
+        MetaData(),
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        *[Column(f"c{i}", String(20)) for i in range(columns - 1)],
+    )
+
+
+def _run(dburi, engine_kw, execution_options, table, rows):
+    engine = create_engine(dburi, **engine_kw)
+    params = [
+        {"id": i, **{f"c{c}": f"value {i}" for c in range(len(table.c) - 1)}}
+        for i in range(rows)
+    ]
+
+    table.metadata.drop_all(engine)
+    table.metadata.create_all(engine)
+    try:
+        with engine.begin() as conn:
+            now = time.perf_counter()
+            conn.execute(
+                table.insert(), params, execution_options=execution_options
+            )
+            return time.perf_counter() - now
+    finally:
+        table.metadata.drop_all(engine)
+        engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dburi", default="tibero+pyodbc://@Tibero7")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--columns", type=int, nargs="+", default=[5, 100])
+    options = parser.parse_args()
+
+    for columns in options.columns:
+        table = _table(columns)
+        for name, engine_kw, execution_options in STRATEGIES:
+            elapsed = _run(
+                options.dburi,
+                engine_kw,
+                execution_options,
+                table,
+                options.rows,
+            )
+            print(
+                f"columns={columns:<4} {name:<17} "
+                f"{options.rows} rows in {elapsed:.3f}s "
+                f"({options.rows / elapsed:,.0f} rows/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
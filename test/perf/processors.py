@@ -0,0 +1,282 @@
+"""Measure the per-value cost of the pyodbc dialect's bind and result
+processors and of its pyodbc output converters.
+
+No database is needed; the processors are called directly on generated
+values.  Results are compared with test/perf/processors_baseline.json::
+
+    python -m test.perf.processors
+    python -m test.perf.processors --check
+    python -m test.perf.processors --save
+
+Absolute times depend on the machine, so only the cost relative to a
+calibration loop is kept in the baseline (``relative``).  The calibration
+loop calls a Python function that returns its argument over the same
+values and is timed right before every run of each case; the median of
+those ratios is used, so a slower or busier machine slows both down.
+``--check`` compares that ratio with the baseline and exits with status 1
+when a case got slower by more than ``--tolerance``.  Run ``--save`` when
+a change makes a case faster or adds a case, and commit the baseline with
+the change.
+
+"""
+
+import argparse
+import datetime
+import decimal
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+from sqlalchemy_tibero import pyodbc
+
+BASELINE = os.path.join(os.path.dirname(__file__), "processors_baseline.json")
+
+# 값의 약 5%는 NULL입니다.
+NULL_RATIO = 0.05
+
+
+def _with_nulls(rng, values):
+    return [None if rng.random() < NULL_RATIO else v for v in values]
+
+
+def _integers(rng, count):
+    # 작은 ID부터 NUMBER(18) 범위까지 자리수를 고르게 섞습니다.
+    return [rng.randrange(10 ** rng.randint(1, 18)) for _ in range(count)]
+
+
+def _decimals(rng, count):
+    return [
+        decimal.Decimal(rng.randrange(10**9)).scaleb(-rng.randint(0, 6))
+        for _ in range(count)
+    ]
+
+
+def _datetimes(rng, count):
+    start = datetime.datetime(2000, 1, 1)
+    return [
+        start
+        + datetime.timedelta(
+            seconds=rng.randrange(30 * 365 * 86400),
+            microseconds=rng.choice((0, rng.randrange(10**6))),
+        )
+        for _ in range(count)
+    ]
+
+
+def _timedeltas(rng, count):
+    return [
+        datetime.timedelta(
+            days=rng.randrange(1000),
+            seconds=rng.randrange(86400),
+            microseconds=rng.choice((0, rng.randrange(10**6))),
+        )
+        for _ in range(count)
+    ]
+
+
+def _interval_bytes(value):
+    # Tibero가 SQL_INTERVAL_DAY_TO_SECOND로 반환하는 문자열 형식입니다.
+    hours, rest = divmod(value.seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    text = f"{value.days} {hours:02}:{minutes:02}:{seconds:02}"
+    if value.microseconds:
+        text += f".{value.microseconds:06}"
+    return text.encode()
+
+
+def _number_bytes(value):
+    return str(value).encode()
+
+
+def cases(dialect, rng, count):
+    """Return (name, processor, values) for every benchmarked case."""
+    integers = _integers(rng, count)
+    decimals = _decimals(rng, count)
+    datetimes = _datetimes(rng, count)
+    timedeltas = _timedeltas(rng, count)
+
+    numeric_binds = [rng.choice((d, float(d), int(d))) for d in decimals]
+
+    return [
+        (
+            "Integer result (NUMBER as Decimal)",
+            pyodbc._TiberoInteger().result_processor(
+                dialect, decimal.Decimal
+            ),
+            _with_nulls(rng, [decimal.Decimal(i) for i in integers]),
+        ),
+        (
+            "Numeric(10, 2) bind",
+            pyodbc._TiberoNumeric(10, 2).bind_processor(dialect),
+            _with_nulls(rng, numeric_binds),
+        ),
+        (
+            "Numeric(asdecimal=False) bind",
+            pyodbc._TiberoNumeric(asdecimal=False).bind_processor(dialect),
+            _with_nulls(rng, decimals),
+        ),
+        (
+            "Numeric(10, 2) result (BINARY_DOUBLE)",
+            pyodbc._TiberoNumeric(10, 2).result_processor(dialect, float),
+            _with_nulls(rng, [float(d) for d in decimals]),
+        ),
+        (
+            "Numeric(asdecimal=False) result (NUMBER)",
+            pyodbc._TiberoNumeric(asdecimal=False).result_processor(
+                dialect, decimal.Decimal
+            ),
+            _with_nulls(rng, decimals),
+        ),
+        (
+            "Date result (DATE as datetime)",
+            pyodbc._PYODBCTiberoDate().result_processor(
+                dialect, datetime.datetime
+            ),
+            _with_nulls(rng, datetimes),
+        ),
+        (
+            "TIMESTAMP WITH TIME ZONE bind",
+            pyodbc._PYODBCTiberoTIMESTAMP(timezone=True).bind_processor(
+                dialect
+            ),
+            _with_nulls(
+                rng,
+                [
+                    d.replace(tzinfo=datetime.timezone.utc)
+                    for d in datetimes
+                ],
+            ),
+        ),
+        (
+            "Interval bind",
+            pyodbc._TiberoInterval().bind_processor(dialect),
+            timedeltas,
+        ),
+        (
+            "output converter INTERVAL DAY TO SECOND",
+            pyodbc._convert_interval_day_to_second,
+            [_interval_bytes(t) for t in timedeltas],
+        ),
+        (
+            "output converter NUMBER (float)",
+            pyodbc._convert_number_to_float,
+            [_number_bytes(d) for d in decimals],
+        ),
+        (
+            "output converter NUMBER (native)",
+            pyodbc._convert_number_to_native,
+            [
+                _number_bytes(rng.choice((i, d)))
+                for i, d in zip(integers, decimals)
+            ],
+        ),
+    ]
+
+
+def _identity(value):
+    return value
+
+
+def _time(processor, values):
+    start = time.perf_counter()
+    for value in values:
+        processor(value)
+    return time.perf_counter() - start
+
+
+def _measure(processor, values, repeat):
+    """Return (ns per value, ratio to the calibration loop) of ``repeat``
+    runs."""
+    # pyodbc는 output converter를 NULL이 아닌 값에만 호출하고, 바인딩과 결과
+    # 처리에서는 SQLAlchemy가 값마다 processor를 호출합니다.
+    # 기준 loop를 case 바로 앞에서 매번 측정해서 CPU 속도나 부하가 바뀌어도
+    # 같은 조건에서 측정한 값끼리 나누고, 중앙값을 사용합니다.
+    best = None
+    ratios = []
+    for _ in range(repeat):
+        calibration = _time(_identity, values)
+        elapsed = _time(processor, values)
+        if best is None or elapsed < best:
+            best = elapsed
+        ratios.append(elapsed / calibration)
+    return best / len(values) * 1e9, statistics.median(ratios)
+
+
+def run(count, repeat, seed):
+    dialect = pyodbc.TiberoDialect_pyodbc()
+    rng = random.Random(seed)
+
+    results = {}
+    for name, processor, values in cases(dialect, rng, count):
+        if processor is None:
+            # 드라이버가 반환한 값을 그대로 사용하는 경우입니다.
+            results[name] = (0.0, 0.0)
+            continue
+        results[name] = _measure(processor, values, repeat)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=9)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--save", action="store_true")
+    options = parser.parse_args()
+
+    results = run(options.values, options.repeat, options.seed)
+
+    baseline = {}
+    if os.path.exists(options.baseline):
+        with open(options.baseline) as f:
+            baseline = json.load(f)["cases"]
+
+    regressions = []
+    for name, (ns, relative) in results.items():
+        line = f"{name:<42} {ns:>8.1f} ns {relative:>6.2f}x"
+        expected = baseline.get(name)
+        if expected is not None and expected["relative"]:
+            change = relative / expected["relative"] - 1
+            line += f"  ({change:+.0%} vs baseline)"
+            if change > options.tolerance:
+                regressions.append(name)
+        elif expected is None:
+            line += "  (no baseline)"
+        print(line)
+
+    if options.save:
+        with open(options.baseline, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "values": options.values,
+                    "seed": options.seed,
+                    "cases": {
+                        name: {"relative": round(relative, 2)}
+                        for name, (_, relative) in results.items()
+                    },
+                },
+                f,
+                indent=2,
+            )
+            f.write("\n")
+        print(f"saved {options.baseline}")
+
+    if options.check and regressions:
+        print(
+            f"slower than baseline by more than {options.tolerance:.0%}: "
+            + ", ".join(regressions)
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
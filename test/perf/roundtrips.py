@@ -0,0 +1,112 @@
+"""Count the round trips the dialect's latency features save, and the time
+they save at a given network latency.
+
+No database is needed; the dialect runs on test/fakeodbc.py, which sleeps
+for ``--latency`` seconds on every round trip::
+
+    python -m test.perf.roundtrips --latency 0.001 --rows 200
+
+"""
+
+import argparse
+import time
+
+from sqlalchemy import Column, Integer, Sequence, String, select
+from sqlalchemy.orm import DeclarativeBase, Session
+
+from sqlalchemy_tibero.orm import enable_flush_batching
+
+from .. import fakeodbc
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "perf_roundtrips"
+    # RETURNING 없이 INSERT해야 sequence 값을 fire_sequence()로 가져옵니다.
+    __table_args__ = ({"implicit_returning": False},)
+
+    id = Column(Integer, Sequence("perf_roundtrips_seq"), primary_key=True)
+    name = Column(String(30))
+    value = Column(Integer)
+
+
+def insert_items(engine, rows):
+    # 행마다 flush하므로 sequence prefetch가 없으면 INSERT마다 nextval 조회가
+    # 필요합니다.
+    with Session(engine) as session:
+        for i in range(rows):
+            session.add(Item(name=f"item {i}", value=i))
+            session.flush()
+        session.commit()
+
+
+def update_items(engine, rows, batching=False):
+    # 행마다 값이 다른 UPDATE는 executemany로 묶이지 않습니다.
+    with Session(engine) as session:
+        if batching:
+            enable_flush_batching(session)
+        for i, item in enumerate(session.scalars(select(Item))):
+            item.name = f"renamed {i}"
+            if i % 2:
+                item.value = -i
+        session.commit()
+
+
+def lookup_items(engine, rows, result_cache=False):
+    with engine.connect() as conn:
+        conn = conn.execution_options(tibero_result_cache=result_cache)
+        for i in range(rows):
+            conn.execute(select(Item).where(Item.id == i % 10 + 1)).all()
+
+
+# (이름, 작업, create_engine() 인자, 작업 인자)
+CASES = [
+    ("insert", insert_items, {}, {}),
+    (
+        "insert, sequence_prefetch_size=50",
+        insert_items,
+        {"sequence_prefetch_size": 50},
+        {},
+    ),
+    ("update", update_items, {}, {}),
+    ("update, flush batching", update_items, {}, {"batching": True}),
+    ("lookup", lookup_items, {}, {}),
+    (
+        "lookup, tibero_result_cache",
+        lookup_items,
+        {"result_cache_size": 1000},
+        {"result_cache": True},
+    ),
+]
+
+
+def run(name, work, engine_args, work_args, rows, latency):
+    engine = fakeodbc.create_engine(latency=latency, **engine_args)
+    Base.metadata.create_all(engine)
+    if work is not insert_items:
+        insert_items(engine, rows)
+
+    dbapi = engine.dialect.dbapi
+    dbapi.reset()
+    start = time.perf_counter()
+    work(engine, rows, **work_args)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<36} {dbapi.round_trips:>6} round trips {elapsed:>8.3f}s")
+    engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.001)
+    parser.add_argument("--rows", type=int, default=200)
+    options = parser.parse_args()
+
+    for name, work, engine_args, work_args in CASES:
+        run(name, work, engine_args, work_args, options.rows, options.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare executemany() of TIMESTAMP values bound natively as datetime
+against the previous behavior of binding them as str().
+
+Requires a Tibero database::
+
+    python -m test.perf.timestamp_executemany \
+        --dburi tibero+pyodbc://@Tibero7 --rows 100000
+
+"""
+
+import argparse
+import datetime
+import time
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    TypeDecorator,
+    create_engine,
+)
+
+
+class StrTimestamp(TypeDecorator):
+    """The bind behavior of _PYODBCTiberoTIMESTAMP before native binding."""
+
+    impl = TIMESTAMP
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            return str(value)
+        return value
+
+
+def _run(engine, type_, rows, fast_executemany):
+    metadata = MetaData()
+    table = Table(
+        "perf_timestamp_bind",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=False),
+        Column("ts", type_),
+    )
+    start = datetime.datetime(2024, 1, 1)
+    params = [
+        {"id": i, "ts": start + datetime.timedelta(seconds=i, microseconds=i)}
+        for i in range(rows)
+    ]
+
+    metadata.drop_all(engine)
+    metadata.create_all(engine)
+    try:
+        with engine.begin() as conn:
+            conn = conn.execution_options(
+                tibero_fast_executemany=fast_executemany
+            )
+            now = time.perf_counter()
+            conn.execute(table.insert(), params)
+            return time.perf_counter() - now
+    finally:
+        metadata.drop_all(engine)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dburi", default="tibero+pyodbc://@Tibero7")
+    parser.add_argument("--rows", type=int, default=100000)
+    options = parser.parse_args()
+
+    engine = create_engine(options.dburi)
+    for fast_executemany in (False, True):
+        for name, type_ in (("str()", StrTimestamp), ("native", TIMESTAMP)):
+            elapsed = _run(engine, type_, options.rows, fast_executemany)
+            print(
+                f"fast_executemany={fast_executemany!s:<5} {name:<7} "
+                f"{options.rows} rows in {elapsed:.3f}s "
+                f"({options.rows / elapsed:,.0f} rows/s)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2296 @@
+import collections
+import datetime
+import decimal
+import io
+import subprocess
+import sys
+import threading
+import time
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    Interval,
+    LargeBinary,
+    MetaData,
+    Numeric,
+    Sequence,
+    String,
+    Text,
+    bindparam,
+    create_engine,
+    event,
+    exc,
+    inspect,
+    pool,
+    select,
+    testing,
+    text,
+)
+from sqlalchemy.engine import cursor as _cursor
+from sqlalchemy.engine import interfaces, url
+from sqlalchemy.testing import (
+    eq_,
+    expect_raises_message,
+    fixtures,
+    is_,
+    is_not,
+    is_true,
+    mock,
+)
+from sqlalchemy.testing.schema import Column, Table
+
+from sqlalchemy_tibero import aioodbc, bulk, columnar, lob, pyodbc
+
+from . import fakeodbc
+
+
+def _context(dialect, cls=pyodbc.TiberoExecutionContext_pyodbc, **attrs):
+    """Return an execution context of ``cls`` that skipped ``__init__()``,
+    with ``attrs`` set over the defaults below."""
+    context = cls.__new__(cls)
+    context.dialect = dialect
+    context.execution_options = {}
+    context.statement = None
+    context.execute_style = interfaces.ExecuteStyle.EXECUTE
+    context._dbapi_connection = mock.Mock()
+    for name, value in attrs.items():
+        setattr(context, name, value)
+    return context
+
+
+def _has_module(name):
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    else:
+        return True
+
+
+class AioodbcDialectTest(fixtures.TestBase):
+    def test_executor_is_bounded_and_shared(self):
+        dialect = aioodbc.TiberoDialectAsync_aioodbc(max_workers=4)
+        u = url.make_url("tibero+aioodbc://@Tibero7")
+
+        _, kw1 = dialect.create_connect_args(u)
+        _, kw2 = dialect.create_connect_args(u)
+
+        is_(kw1["executor"], kw2["executor"])
+        eq_(kw1["executor"]._max_workers, 4)
+        eq_(kw1["dsn"], "dsn=Tibero7;Trusted_Connection=Yes")
+
+    def test_executor_shut_down_on_dispose(self):
+        engine = create_engine(
+            "tibero+aioodbc://@Tibero7", module=mock.Mock(paramstyle="qmark")
+        )
+        dialect = engine.dialect
+        _, kw = dialect.create_connect_args(engine.url)
+
+        engine.dispose()
+
+        is_true(kw["executor"]._shutdown)
+        _, kw2 = dialect.create_connect_args(engine.url)
+        is_not(kw2["executor"], kw["executor"])
+        is_(kw2["executor"]._shutdown, False)
+
+    def test_dbapi_exposes_sql_type_constants(self):
+        pyodbc = mock.Mock(
+            SQL_TYPE_DATE=91, SQL_TYPE_TIMESTAMP=93, paramstyle="qmark"
+        )
+        dbapi = aioodbc.AsyncAdapt_tibero_aioodbc_dbapi(mock.Mock(), pyodbc)
+
+        eq_(dbapi.SQL_TYPE_DATE, 91)
+        eq_(dbapi.SQL_TYPE_TIMESTAMP, 93)
+
+    def test_supports_stream(self):
+        dialect = aioodbc.TiberoDialectAsync_aioodbc()
+        is_true(dialect.is_async)
+        is_true(dialect.supports_server_side_cursors)
+
+    def test_statement_timeout_rejected(self):
+        with expect_raises_message(
+            exc.ArgumentError, "statement_timeout is not supported"
+        ):
+            aioodbc.TiberoDialectAsync_aioodbc(statement_timeout=5)
+
+    def test_tibero_timeout_rejected(self):
+        context = _context(
+            aioodbc.TiberoDialectAsync_aioodbc(),
+            aioodbc.TiberoExecutionContext_aioodbc,
+            execution_options={"tibero_timeout": 5},
+        )
+
+        with expect_raises_message(
+            exc.ArgumentError, "tibero_timeout is not supported"
+        ):
+            context.pre_exec()
+
+
+class FastExecutemanyTest(fixtures.TestBase):
+    def _context(self, fast_executemany, input_sizes=None):
+        return _context(
+            None,
+            execute_style=interfaces.ExecuteStyle.EXECUTEMANY,
+            _tibero_fast_executemany=fast_executemany,
+            _tibero_input_sizes=input_sizes,
+        )
+
+    def test_plain_executemany(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        cursor = mock.Mock()
+        params = [(1, "a"), (2, "b")]
+
+        dialect.do_executemany(
+            cursor, "INSERT", params, self._context(False)
+        )
+
+        eq_(cursor.executemany.mock_calls, [mock.call("INSERT", params)])
+        is_not(cursor.fast_executemany, True)
+
+    def test_batches_capped_by_memory_limit(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            fast_executemany=True, fast_executemany_memory_limit=110
+        )
+        cursor = mock.Mock()
+        params = [(i, "x" * 10) for i in range(5)]
+        # (8 * 2 + 8) + (10 * 2 + 8) = 52 byte per row -> 2 rows per batch
+        context = self._context(True, [(int, None, None), (12, 10, 0)])
+
+        dialect.do_executemany(cursor, "INSERT", params, context)
+
+        is_true(cursor.fast_executemany)
+        eq_(
+            cursor.executemany.mock_calls,
+            [
+                mock.call("INSERT", params[0:2]),
+                mock.call("INSERT", params[2:4]),
+                mock.call("INSERT", params[4:5]),
+            ],
+        )
+
+    def test_input_sizes_from_type(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        cursor = mock.Mock()
+        context = self._context(True)
+
+        dialect.do_set_input_sizes(
+            cursor,
+            [
+                ("a", 12, String(30)),
+                ("b", 2, Numeric(10, 2)),
+                ("c", None, String()),
+                ("d", 93, DateTime()),
+            ],
+            context,
+        )
+
+        eq_(
+            cursor.setinputsizes.mock_calls,
+            [
+                mock.call(
+                    [
+                        (12, 30, 0),
+                        (2, 10, 2),
+                        (None, None, None),
+                        (93, None, None),
+                    ]
+                )
+            ],
+        )
+
+
+class ExecutemanyReturningTest(fixtures.TestBase):
+    def test_flags(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        is_true(dialect.update_executemany_returning)
+        is_true(dialect.delete_executemany_returning)
+
+    def test_one_block_with_result_set_per_parameter_set(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(fast_executemany=True)
+        context = _context(
+            dialect,
+            execute_style=interfaces.ExecuteStyle.EXECUTEMANY,
+            _tibero_fast_executemany=True,
+            _tibero_input_sizes=[(12, 30, 0), (4, None, None), (4, None, 0)],
+            _tibero_returning_rows=[],
+        )
+        result_sets = [[(1, "a")], [], [(3, "c"), (4, "c")]]
+        cursor = mock.Mock(description=[("id",), ("data",)])
+        cursor.fetchall.side_effect = result_sets
+        statement = (
+            "UPDATE t SET data=? WHERE t.x = ? RETURNING t.id, t.data "
+            "INTO ?, ?"
+        )
+        params = [("a", 1, None), ("b", 2, None), ("c", 3, None)]
+
+        dialect.do_executemany(cursor, statement, params, context)
+
+        eq_(cursor.executemany.mock_calls, [])
+        eq_(
+            cursor.execute.mock_calls,
+            [
+                mock.call(
+                    f"BEGIN\n{statement};\n{statement};\n{statement};\nEND;",
+                    ["a", 1, None, "b", 2, None, "c", 3, None],
+                )
+            ],
+        )
+        eq_(
+            cursor.setinputsizes.mock_calls,
+            [mock.call(context._tibero_input_sizes * 3)],
+        )
+        eq_(cursor.nextset.call_count, 3)
+        eq_(context._tibero_returning_rows, [(1, "a"), (3, "c"), (4, "c")])
+        eq_(context._tibero_returning_description, [("id",), ("data",)])
+        eq_(context._rowcount, 3)
+
+    def test_blocks_are_limited(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        context = _context(
+            dialect,
+            execute_style=interfaces.ExecuteStyle.EXECUTEMANY,
+            _tibero_returning_rows=[],
+        )
+        cursor = mock.Mock(description=None)
+        params = [(i, None) for i in range(pyodbc._BATCH_MAX_STATEMENTS + 1)]
+
+        dialect.do_executemany(
+            cursor,
+            "DELETE FROM t WHERE x = ? RETURNING id INTO ?",
+            params,
+            context,
+        )
+
+        eq_(cursor.execute.call_count, 2)
+        eq_(len(cursor.execute.mock_calls[1].args[1]), 2)
+        eq_(context._rowcount, 0)
+
+    def test_post_exec_buffers_rows(self):
+        context = _context(
+            pyodbc.TiberoDialect_pyodbc(),
+            cursor=mock.Mock(description=None),
+            _tibero_returning_rows=[(1, "a"), (3, "c")],
+            _tibero_returning_description=[("id",), ("data",)],
+        )
+
+        context.post_exec()
+
+        strategy = context.cursor_fetch_strategy
+        eq_(list(strategy._rowbuffer), [(1, "a"), (3, "c")])
+        eq_(strategy.alternate_cursor_description, [("id",), ("data",)])
+
+
+class ServerSideCursorTest(fixtures.TablesTest):
+    __only_on__ = "oracle"
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "ss_data",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("data", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.ss_data.insert(),
+            [{"id": i, "data": f"d{i}"} for i in range(1, 101)],
+        )
+
+    def test_dialect_flag(self):
+        is_true(pyodbc.TiberoDialect_pyodbc.supports_server_side_cursors)
+
+    @testing.combinations(
+        ({"stream_results": True, "max_row_buffer": 20}, 20),
+        ({"yield_per": 15}, 15),
+        ({"stream_results": True}, 50),
+        argnames="options, arraysize",
+    )
+    def test_stream_results(self, connection, options, arraysize):
+        ss_data = self.tables.ss_data
+        result = connection.execution_options(**options).execute(
+            select(ss_data.c.id).order_by(ss_data.c.id)
+        )
+
+        is_true(result.context._is_server_side)
+        eq_(result.cursor.arraysize, arraysize)
+        eq_(result.scalars().all(), list(range(1, 101)))
+
+
+class IsolationLevelCacheTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _connection(self, level="READ COMMITTED"):
+        conn = mock.Mock()
+        conn.cursor.return_value.fetchone.return_value = (level,)
+        return conn
+
+    def _statements(self, conn):
+        return [
+            c[1][0]
+            for c in conn.cursor.return_value.mock_calls
+            if c[0] == "execute"
+        ]
+
+    def test_detect_without_ddl(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = self._connection("SERIALIZABLE")
+
+        eq_(dialect.get_isolation_level(conn), "SERIALIZABLE")
+
+        stmts = self._statements(conn)
+        eq_(len(stmts), 2)
+        for stmt in stmts:
+            assert "CREATE" not in stmt.upper()
+            assert "DROP" not in stmt.upper()
+
+    def test_detected_level_is_cached(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = self._connection()
+
+        eq_(dialect.get_isolation_level(conn), "READ COMMITTED")
+        eq_(dialect.get_isolation_level(conn), "READ COMMITTED")
+
+        eq_(len(self._statements(conn)), 2)
+
+    @testing.combinations("SERIALIZABLE", "AUTOCOMMIT", argnames="level")
+    def test_set_level_is_tracked(self, level):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = self._connection()
+
+        dialect.set_isolation_level(conn, level)
+        conn.cursor.reset_mock()
+
+        eq_(dialect.get_isolation_level(conn), level)
+        eq_(self._statements(conn), [])
+
+    def test_state_discarded_on_close(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = self._connection()
+
+        dialect.set_isolation_level(conn, "SERIALIZABLE")
+        dialect.do_close(conn)
+
+        is_(dialect._session_state(conn, create=False), None)
+        conn.close.assert_called_once_with()
+
+
+class SessionStateTest(fixtures.TestBase):
+    def _statements(self, conn):
+        return [
+            c[1][0]
+            for c in conn.cursor.return_value.mock_calls
+            if c[0] == "execute"
+        ]
+
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def test_same_isolation_level_skips_alter_session(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+
+        dialect.set_isolation_level(conn, "SERIALIZABLE")
+        dialect.set_isolation_level(conn, "SERIALIZABLE")
+
+        eq_(
+            self._statements(conn),
+            ["ALTER SESSION SET ISOLATION_LEVEL=SERIALIZABLE"],
+        )
+        eq_(conn.commit.call_count, 1)
+
+    def test_autocommit_round_trip(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+
+        dialect.set_isolation_level(conn, "READ COMMITTED")
+        dialect.set_isolation_level(conn, "AUTOCOMMIT")
+        is_true(conn.autocommit)
+        dialect.set_isolation_level(conn, "READ COMMITTED")
+
+        eq_(conn.autocommit, False)
+        eq_(
+            self._statements(conn),
+            ["ALTER SESSION SET ISOLATION_LEVEL=READ COMMITTED"],
+        )
+
+    def test_alter_session_only_changed_parameters(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+
+        is_true(dialect.alter_session(conn, {"current_schema": "scott"}))
+        is_(
+            dialect.alter_session(
+                conn,
+                {"current_schema": "scott", "NLS_DATE_FORMAT": "'YYYY'"},
+            ),
+            True,
+        )
+        is_(dialect.alter_session(conn, {"CURRENT_SCHEMA": "scott"}), False)
+
+        eq_(
+            self._statements(conn),
+            [
+                "ALTER SESSION SET CURRENT_SCHEMA=scott",
+                "ALTER SESSION SET NLS_DATE_FORMAT='YYYY'",
+            ],
+        )
+
+    def test_on_connect_resets_state_and_sets_nls(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            nls_parameters={"NLS_DATE_FORMAT": "YYYY-MM-DD"}
+        )
+        conn = mock.Mock(autocommit=False)
+        dialect.alter_session(conn, {"CURRENT_SCHEMA": "scott"})
+        conn.cursor.reset_mock()
+
+        dialect.on_connect()(conn)
+
+        eq_(
+            self._statements(conn),
+            ["ALTER SESSION SET NLS_DATE_FORMAT='YYYY-MM-DD'"],
+        )
+        eq_(
+            dialect._session_state(conn),
+            {
+                "autocommit": False,
+                "parameters": {"NLS_DATE_FORMAT": "'YYYY-MM-DD'"},
+            },
+        )
+
+    def test_reused_id_gets_new_state(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+
+        # 닫힌 connection의 id를 새 connection이 재사용한 경우입니다.
+        pyodbc._session_states[id(conn)] = (
+            mock.Mock(),
+            {"parameters": {"CURRENT_SCHEMA": "scott"}},
+        )
+
+        is_(dialect._session_state(conn, create=False), None)
+        is_true(dialect.alter_session(conn, {"CURRENT_SCHEMA": "scott"}))
+
+    def test_pool_proxy_uses_dbapi_connection_state(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+        proxy = mock.Mock(
+            spec=pool.PoolProxiedConnection, dbapi_connection=conn
+        )
+
+        dialect.alter_session(conn, {"CURRENT_SCHEMA": "scott"})
+
+        is_(dialect._session_state(proxy), dialect._session_state(conn))
+
+
+class OutputConverterTest(fixtures.TestBase):
+    @testing.combinations(
+        (b"1 2:3:4.5", datetime.timedelta(1, 7384, 500000)),
+        (b"1 02:03:04.000005", datetime.timedelta(1, 7384, 5)),
+        (b"0 0:0:1.123456789", datetime.timedelta(0, 1, 123456)),
+        (b"0 0:0:7", datetime.timedelta(seconds=7)),
+        argnames="raw, expected",
+    )
+    def test_interval(self, raw, expected):
+        converter, python_type = pyodbc._output_converters[
+            pyodbc._SQL_INTERVAL_DAY_TO_SECOND
+        ]
+        is_(python_type, datetime.timedelta)
+        eq_(converter(raw), expected)
+
+    def test_installed_once_per_connection(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock(autocommit=False)
+
+        dialect.on_connect()(conn)
+
+        eq_(
+            conn.add_output_converter.mock_calls,
+            [
+                mock.call(sqltype, converter)
+                for sqltype, (converter, _) in (
+                    pyodbc._output_converters.items()
+                )
+            ],
+        )
+
+    def test_no_result_processor_for_converted_types(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        is_(
+            Interval().dialect_impl(dialect).result_processor(dialect, str),
+            None,
+        )
+
+
+class ColumnarFetchTest(fixtures.TestBase):
+    def _result(self, description, rows, buffered=()):
+        cursor = mock.Mock(description=description, arraysize=2)
+        remaining = list(rows)
+
+        def fetchmany(size):
+            chunk = remaining[:size]
+            del remaining[:size]
+            return chunk
+
+        cursor.fetchmany.side_effect = fetchmany
+        return mock.Mock(
+            cursor=cursor,
+            cursor_strategy=_cursor.BufferedRowCursorFetchStrategy(
+                cursor, {}, initial_buffer=collections.deque(buffered)
+            ),
+            keys=mock.Mock(
+                return_value=[d[0].lower() for d in description]
+            ),
+        )
+
+    def _description(self):
+        return [
+            ("ID", decimal.Decimal, None, None, 10, 0, False),
+            ("PRICE", decimal.Decimal, None, None, 10, 2, True),
+            ("NAME", str, None, 30, 30, 0, True),
+            ("CREATED", datetime.datetime, None, None, 26, 6, True),
+        ]
+
+    def _rows(self):
+        return [
+            (decimal.Decimal(i), decimal.Decimal("1.5") * i, f"n{i}", None)
+            if i % 2
+            else (
+                decimal.Decimal(i),
+                None,
+                None,
+                datetime.datetime(2024, 1, i + 1),
+            )
+            for i in range(5)
+        ]
+
+    @testing.skip_if(lambda: not _has_module("numpy"), "requires numpy")
+    def test_numpy(self):
+        rows = self._rows()
+        result = self._result(self._description(), rows[1:], rows[:1])
+
+        columns = columnar.fetch_columnar(result)
+
+        eq_(list(columns), ["id", "price", "name", "created"])
+        eq_(str(columns["id"].dtype), "int64")
+        eq_(columns["id"].tolist(), [0, 1, 2, 3, 4])
+        eq_(str(columns["price"].dtype), "float64")
+        eq_(columns["price"].tolist(), [None, 1.5, None, 4.5, None])
+        eq_(columns["name"].tolist(), [None, "n1", None, "n3", None])
+        eq_(
+            columns["name"].mask.tolist(), [True, False, True, False, True]
+        )
+        eq_(str(columns["created"].dtype), "datetime64[us]")
+        eq_(
+            columns["created"].mask.tolist(),
+            [False, True, False, True, False],
+        )
+        # 미리 가져온 첫번째 행을 포함해 arraysize(2)개씩 가져옵니다.
+        eq_(
+            result.cursor.fetchmany.mock_calls,
+            [mock.call(1), mock.call(2), mock.call(2), mock.call(2)],
+        )
+        result._soft_close.assert_called_with()
+
+    @testing.skip_if(lambda: not _has_module("numpy"), "requires numpy")
+    def test_integer_precision(self):
+        description = [
+            ("ID", decimal.Decimal, None, None, 38, 0, False),
+            ("BIG", decimal.Decimal, None, None, 38, 0, True),
+        ]
+        rows = [
+            (decimal.Decimal(2**53 + 1), decimal.Decimal(1)),
+            (decimal.Decimal(2), None),
+            (decimal.Decimal(3), decimal.Decimal(2**70)),
+        ]
+        result = self._result(description, rows)
+
+        columns = columnar.fetch_columnar(result)
+
+        eq_(str(columns["id"].dtype), "int64")
+        eq_(columns["id"].tolist(), [2**53 + 1, 2, 3])
+        # int64 범위를 벗어나는 값이 있으면 python int를 저장합니다.
+        eq_(str(columns["big"].dtype), "object")
+        eq_(columns["big"].tolist(), [1, None, 2**70])
+        eq_(columns["big"].mask.tolist(), [False, True, False])
+
+    def _big_rows(self):
+        # arraysize가 2이므로 int64 범위를 벗어나는 값이 첫번째 묶음에 있습니다.
+        return [
+            (decimal.Decimal(2**70),),
+            (None,),
+            (decimal.Decimal(5),),
+            (decimal.Decimal(-(2**80)),),
+        ]
+
+    @testing.skip_if(lambda: not _has_module("numpy"), "requires numpy")
+    def test_integer_overflow_keeps_converting(self):
+        description = [("BIG", decimal.Decimal, None, None, 38, 0, True)]
+        result = self._result(description, self._big_rows())
+
+        column = columnar.fetch_columnar(result)["big"]
+
+        eq_(column.tolist(), [2**70, None, 5, -(2**80)])
+        eq_(
+            [type(v) for v in column.data.tolist()],
+            [int, int, int, int],
+        )
+
+    @testing.skip_if(lambda: not _has_module("pyarrow"), "requires pyarrow")
+    def test_integer_overflow_arrow(self):
+        description = [("BIG", decimal.Decimal, None, None, 38, 0, True)]
+        result = self._result(description, self._big_rows())
+
+        table = columnar.fetch_columnar(result, use_arrow=True)
+
+        eq_(str(table.schema.field("big").type), "decimal128(38, 0)")
+        eq_(
+            table.column("big").to_pylist(),
+            [
+                decimal.Decimal(2**70),
+                None,
+                decimal.Decimal(5),
+                decimal.Decimal(-(2**80)),
+            ],
+        )
+
+    @testing.combinations(
+        # 계산식의 결과는 scale이 0이라도 소수가 있을 수 있습니다.
+        (38, [1, 2, 3, decimal.Decimal("1.5")], [1.0, 2.0, 3.0, 1.5]),
+        (38, [2**70, 2, 3, decimal.Decimal("1.5")], [2.0**70, 2.0, 3.0, 1.5]),
+        # precision을 알 수 없으면 정수로 취급하지 않습니다.
+        (None, [1, 2, 3, 4], [1.0, 2.0, 3.0, 4.0]),
+        argnames="precision, values, expected",
+    )
+    @testing.skip_if(lambda: not _has_module("numpy"), "requires numpy")
+    def test_fraction_in_scale_zero_column(self, precision, values, expected):
+        description = [
+            ("N", decimal.Decimal, None, None, precision, 0, False)
+        ]
+        rows = [(decimal.Decimal(v),) for v in values]
+        result = self._result(description, rows)
+
+        column = columnar.fetch_columnar(result)["n"]
+
+        eq_(str(column.dtype), "float64")
+        eq_(column.tolist(), expected)
+
+    @testing.skip_if(lambda: not _has_module("pyarrow"), "requires pyarrow")
+    def test_arrow(self):
+        result = self._result(self._description(), self._rows())
+
+        table = columnar.fetch_columnar(result, chunk_size=1, use_arrow=True)
+
+        eq_(table.num_rows, 5)
+        eq_(str(table.schema.field("id").type), "int64")
+        eq_(str(table.schema.field("name").type), "string")
+        eq_(str(table.schema.field("created").type), "timestamp[us]")
+        eq_(table.column("price").to_pylist(), [None, 1.5, None, 4.5, None])
+        eq_(table.column("name").null_count, 3)
+
+    @testing.skip_if(lambda: not _has_module("numpy"), "requires numpy")
+    def test_empty(self):
+        result = self._result(self._description(), [])
+
+        columns = columnar.fetch_columnar(result)
+
+        eq_(columns["id"].shape, (0,))
+        eq_(str(columns["created"].dtype), "datetime64[us]")
+
+
+class BulkInsertTest(fixtures.TestBase):
+    def _table(self):
+        return Table(
+            "bulk_data",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", String(30)),
+        )
+
+    def _rows(self, count, consumed):
+        for i in range(count):
+            consumed.append(i)
+            yield {"id": i, "data": f"d{i}"}
+
+    def test_batches_are_consumed_lazily(self):
+        conn = mock.Mock()
+        consumed = []
+        sizes = []
+
+        def execute(stmt, params, execution_options):
+            # 다음 배치를 보내기 전까지는 generator를 더 읽지 않아야 합니다.
+            eq_(len(consumed), sum(sizes) + len(params))
+            sizes.append(len(params))
+
+        conn.execute.side_effect = execute
+
+        stats = bulk.bulk_insert(
+            conn, self._table(), self._rows(25, consumed), batch_size=10
+        )
+
+        eq_(sizes, [10, 10, 5])
+        eq_((stats.rows, stats.batches, stats.commits), (25, 3, 0))
+        eq_(
+            conn.execute.mock_calls[0][2],
+            {"execution_options": {"tibero_fast_executemany": True}},
+        )
+        eq_(conn.commit.mock_calls, [])
+
+    def test_commit_every_and_progress(self):
+        conn = mock.Mock()
+        reported = []
+
+        stats = bulk.bulk_insert(
+            conn,
+            self._table().insert(),
+            self._rows(25, []),
+            batch_size=5,
+            commit_every=10,
+            progress=lambda stats: reported.append(stats.rows),
+            fast_executemany=False,
+        )
+
+        eq_(reported, [5, 10, 15, 20, 25])
+        eq_(stats.commits, 3)
+        eq_(conn.commit.call_count, 3)
+        eq_(
+            conn.execute.mock_calls[0][2],
+            {"execution_options": {"tibero_fast_executemany": False}},
+        )
+        is_true(stats.rows_per_second > 0)
+
+
+class StatementCacheTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _context(self, dialect, conn, statement, **execution_options):
+        return _context(
+            dialect,
+            unicode_statement=statement,
+            execution_options=execution_options,
+            _dbapi_connection=mock.Mock(dbapi_connection=conn),
+        )
+
+    def _cursor(self, dialect, conn, statement, **execution_options):
+        context = self._context(dialect, conn, statement, **execution_options)
+        return pyodbc.TiberoExecutionContext_pyodbc.create_default_cursor(
+            context
+        )
+
+    def test_disabled_by_default(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+
+        context = self._context(dialect, conn, "SELECT 1 FROM DUAL")
+
+        cursor = pyodbc.TiberoExecutionContext_pyodbc.create_default_cursor(
+            context
+        )
+
+        is_(cursor, context._dbapi_connection.cursor.return_value)
+        eq_(cursor.arraysize, 50)
+
+    def test_cursor_reused_and_reset(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_cache_size=2)
+        conn = mock.Mock()
+
+        cursor = self._cursor(dialect, conn, "SELECT 1 FROM DUAL")
+        cursor.fast_executemany = True
+        cursor.arraysize = 1000
+        cursor.close()
+
+        is_(self._cursor(dialect, conn, "SELECT 1 FROM DUAL"), cursor)
+        eq_(conn.cursor.call_count, 1)
+        eq_(cursor.fast_executemany, False)
+        eq_(cursor.arraysize, 50)
+        conn.cursor.return_value.setinputsizes.assert_called_once_with(None)
+        conn.cursor.return_value.close.assert_not_called()
+
+    def test_least_recently_used_is_evicted(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_cache_size=2)
+        conn = mock.Mock()
+        conn.cursor.side_effect = lambda: mock.Mock()
+
+        cursors = {}
+        for statement in ["a", "b", "a", "c"]:
+            cursors[statement] = self._cursor(dialect, conn, statement)
+            cursors[statement].close()
+
+        eq_(list(dialect._session_state(conn)["cursors"]), ["a", "c"])
+        cursors["b"]._cursor.close.assert_called_once_with()
+        cursors["a"]._cursor.close.assert_not_called()
+
+    def test_in_use_statement_gets_new_cursor(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_cache_size=2)
+        conn = mock.Mock()
+        conn.cursor.side_effect = lambda: mock.Mock()
+
+        c1 = self._cursor(dialect, conn, "a")
+        c2 = self._cursor(dialect, conn, "a")
+        is_not(c1._cursor, c2._cursor)
+
+        c1.close()
+        c2.close()
+        c1._cursor.close.assert_not_called()
+        c2._cursor.close.assert_called_once_with()
+
+    def test_compiled_statement(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_cache_size=2)
+        stmt = select(Table("t", MetaData(), Column("id", Integer)).c.id)
+        compiled = stmt.compile(dialect=dialect)
+        conn = mock.Mock()
+
+        context = pyodbc.TiberoExecutionContext_pyodbc._init_compiled(
+            dialect,
+            mock.Mock(dialect=dialect),
+            mock.Mock(dbapi_connection=conn),
+            {},
+            compiled,
+            [{}],
+            stmt,
+            None,
+        )
+
+        eq_(context.cursor._statement, compiled.string)
+        eq_(list(dialect._session_state(conn)["cursors"]), [])
+
+    def test_execution_option(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_cache_size=2)
+        conn = mock.Mock()
+
+        context = self._context(
+            dialect, conn, "a", tibero_statement_cache_size=0
+        )
+
+        cursor = pyodbc.TiberoExecutionContext_pyodbc.create_default_cursor(
+            context
+        )
+
+        is_(cursor, context._dbapi_connection.cursor.return_value)
+        eq_(conn.cursor.call_count, 0)
+
+
+class LOBStreamingTest(fixtures.TestBase):
+    def _table(self):
+        return Table(
+            "lob_data",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("bin", LargeBinary),
+            Column("txt", Text),
+            Column("data", String(30)),
+        )
+
+    def test_large_values_become_readers(self):
+        t = self._table()
+        conn = mock.Mock()
+        conn.execute.return_value = [
+            (1, b"small", None, "x", "AAA1", 5, "AAA1", 30),
+            (2, None, "abc", "y", "AAA2", None, "AAA2", 3),
+        ]
+
+        rows = list(
+            lob.execute_lob_streaming(
+                conn,
+                select(t.c.id, t.c.bin, t.c.txt, t.c.data),
+                inline_threshold=10,
+            )
+        )
+
+        stmt = conn.execute.mock_calls[0][1][0]
+        eq_(len(stmt.selected_columns), 8)
+        eq_(rows[0][:2], (1, b"small"))
+        reader = rows[0][2]
+        is_true(isinstance(reader, lob.LOBReader))
+        eq_((reader.rowid, reader.length), ("AAA1", 30))
+        eq_(rows[0][3], "x")
+        eq_(rows[1], (2, None, "abc", "y"))
+
+    def test_reader_fetches_in_pieces(self):
+        t = self._table()
+        conn = mock.Mock()
+        data = bytes(range(256)) * 20
+
+        def execute(stmt):
+            # dbms_lob.substr(bin, amount, offset) 칼럼마다 값을 잘라서 반환합니다.
+            pieces = []
+            for fn in stmt.selected_columns:
+                _, amount, offset = fn.clauses
+                amount, offset = amount.value, offset.value
+                pieces.append(data[offset - 1 : offset - 1 + amount])
+            return mock.Mock(one=mock.Mock(return_value=tuple(pieces)))
+
+        conn.execute.side_effect = execute
+        reader = lob.LOBReader(conn, t.c.bin, "AAA1", len(data), 3000)
+
+        eq_(reader.read(2500), data[:2500])
+        eq_(reader.tell(), 2500)
+        reader.seek(5000)
+        eq_(b"".join(reader), data[5000:])
+        eq_(reader.read(), b"")
+        # 2500 -> 1번, 나머지 120 -> 1번
+        eq_(conn.execute.call_count, 2)
+
+    def test_write_lob_appends_chunks(self):
+        t = self._table()
+        conn = mock.Mock(dialect=pyodbc.dialect())
+        conn.execute.return_value.scalars.return_value.all.return_value = [
+            "AAA1"
+        ]
+
+        written = lob.write_lob(
+            conn, t.c.bin, t.c.id == 1, io.BytesIO(b"x" * 25), chunk_size=10
+        )
+
+        eq_(written, 25)
+        calls = [c[0] for c in conn.execute.call_args_list]
+        select_stmt, update_stmt, appends = calls[0][0], calls[1][0], calls[2:]
+        is_true(select_stmt._for_update_arg is not None)
+        assert "empty_blob()" in str(update_stmt)
+        assert "DBMS_LOB.WRITEAPPEND" in str(appends[0][0])
+        assert "lob_locator BLOB" in str(appends[0][0])
+        eq_(
+            [params for _, params in appends],
+            [
+                {"rowid": "AAA1", "amount": 10, "data": b"x" * 10},
+                {"rowid": "AAA1", "amount": 10, "data": b"x" * 10},
+                {"rowid": "AAA1", "amount": 5, "data": b"x" * 5},
+            ],
+        )
+
+    def test_write_lob_requires_single_row(self):
+        t = self._table()
+        conn = mock.Mock(dialect=pyodbc.dialect())
+        conn.execute.return_value.scalars.return_value.all.return_value = []
+
+        with expect_raises_message(
+            exc.InvalidRequestError, "expects exactly one row; got 0"
+        ):
+            lob.write_lob(conn, t.c.txt, t.c.id == 1, ["abc"])
+
+
+class NumberModeTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    @testing.combinations(
+        ("float", b"12", 12.0),
+        ("float", b"-1.5", -1.5),
+        ("native", b"12", 12),
+        ("native", b"-1.5", -1.5),
+        ("native", b"1E+40", 10**40),
+        ("native", b"1e5", 100000),
+        ("native", b"1.5E-5", 1.5e-5),
+        ("native", b"1.00000000000000001", 1.0),
+        # float로 정확히 표현할 수 없는 정수는 int로 반환합니다.
+        ("float", b"9007199254740993", 9007199254740993),
+        ("float", b"-9007199254740993", -9007199254740993),
+        ("float", b"1000000000000000", 1e15),
+        ("float", b"1E+40", 10**40),
+        ("float", b"1e5", 1e5),
+        ("float", b"123456789.1234567891", 123456789.1234567891),
+        argnames="mode, raw, expected",
+    )
+    def test_converter(self, mode, raw, expected):
+        converter, _ = pyodbc._number_converters[mode]
+        value = converter(raw)
+        eq_(value, expected)
+        is_(type(value), type(expected))
+
+    @testing.combinations("decimal", "float", "native", argnames="mode")
+    def test_integer_exact(self, mode):
+        dialect = pyodbc.TiberoDialect_pyodbc(number_mode=mode)
+        converter = dialect._output_converters.get(pyodbc._SQL_NUMERIC)
+        impl = Integer().dialect_impl(dialect)
+        processor = impl.result_processor(dialect, decimal.Decimal)
+
+        for raw in (b"9007199254740993", b"12345678901234567890", b"1E+40"):
+            value = (
+                converter[0](raw)
+                if converter
+                else decimal.Decimal(raw.decode())
+            )
+            if processor is not None:
+                value = processor(value)
+            eq_(value, int(decimal.Decimal(raw.decode())))
+            is_(type(value), int)
+
+    def test_invalid_mode(self):
+        with expect_raises_message(exc.ArgumentError, "number_mode must be"):
+            pyodbc.TiberoDialect_pyodbc(number_mode="int")
+
+    def test_installed_on_connect(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(number_mode="float")
+        conn = mock.Mock(autocommit=False)
+
+        dialect.on_connect()(conn)
+
+        for sqltype in pyodbc._number_sqltypes:
+            assert (
+                mock.call(sqltype, pyodbc._convert_number_to_float)
+                in conn.add_output_converter.mock_calls
+            )
+
+    @testing.combinations(
+        ("decimal", Numeric(asdecimal=True), False),
+        ("decimal", Numeric(asdecimal=False), True),
+        ("decimal", Integer(), True),
+        ("float", Numeric(asdecimal=True), True),
+        ("float", Numeric(asdecimal=False), False),
+        ("float", Integer(), True),
+        ("native", Numeric(asdecimal=True), True),
+        ("native", Numeric(asdecimal=False), True),
+        ("native", Integer(), False),
+        argnames="mode, type_, has_processor",
+    )
+    def test_result_processor(self, mode, type_, has_processor):
+        dialect = pyodbc.TiberoDialect_pyodbc(number_mode=mode)
+        processor = type_.dialect_impl(dialect).result_processor(
+            dialect, decimal.Decimal
+        )
+        eq_(processor is not None, has_processor)
+
+
+class BatchFlushTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _context(
+        self, conn, statement, batchable=True, isupdate=False, sizes=None
+    ):
+        return _context(
+            None,
+            statement=statement,
+            isupdate=isupdate,
+            _dbapi_connection=mock.Mock(dbapi_connection=conn),
+            _tibero_batch_flush=True,
+            _tibero_batchable=batchable,
+            _tibero_input_sizes=sizes,
+        )
+
+    def test_flushed_before_statement_without_parameters(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        conn = mock.Mock()
+        cursor = mock.Mock()
+        calls = mock.Mock()
+        calls.attach_mock(conn.cursor.return_value.execute, "batch")
+        calls.attach_mock(cursor.execute, "execute")
+
+        insert = "INSERT INTO t (a) VALUES (?)"
+        dialect.do_execute(
+            cursor, insert, ["x"], self._context(conn, insert)
+        )
+        lock = "LOCK TABLE t IN EXCLUSIVE MODE"
+        dialect.do_execute_no_params(
+            cursor, lock, self._context(conn, lock, False)
+        )
+
+        eq_(
+            [c[0] for c in calls.mock_calls],
+            ["batch", "execute"],
+        )
+        eq_(calls.mock_calls[1], mock.call.execute(lock))
+
+    def test_collected_until_select(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        conn = mock.Mock()
+        cursor = mock.Mock()
+
+        insert = "INSERT INTO t (a) VALUES (?)"
+        update = "UPDATE t SET a=? WHERE t.id = ?"
+        for statement, params, isupdate, sizes in [
+            (insert, ["x"], False, [(12, 10, 0)]),
+            (update, ["y", 1], True, None),
+        ]:
+            context = self._context(
+                conn, statement, isupdate=isupdate, sizes=sizes
+            )
+            dialect.do_execute(cursor, statement, params, context)
+            eq_(context._rowcount, 1)
+        eq_(cursor.execute.mock_calls, [])
+        eq_(conn.cursor.mock_calls, [])
+
+        select_ = "SELECT a FROM t"
+        dialect.do_execute(
+            cursor, select_, [], self._context(conn, select_, False)
+        )
+
+        block_cursor = conn.cursor.return_value
+        block, params = block_cursor.execute.mock_calls[0][1]
+        eq_(
+            block.splitlines()[:3],
+            ["BEGIN", insert + ";", update + ";"],
+        )
+        assert "IF SQL%ROWCOUNT <> 1 THEN" in block.splitlines()[3]
+        eq_(block.splitlines()[-1], "END;")
+        eq_(params, ["x", "y", 1])
+        block_cursor.setinputsizes.assert_called_once_with(
+            [(12, 10, 0), (None, None, None), (None, None, None)]
+        )
+        eq_(cursor.execute.mock_calls, [mock.call(select_, [])])
+
+    def test_executed_on_commit_discarded_on_rollback(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        conn = mock.Mock()
+        statement = "DELETE FROM t WHERE t.id = ?"
+
+        dialect.do_execute(
+            mock.Mock(), statement, [1], self._context(conn, statement)
+        )
+        dialect.do_rollback(conn)
+        dialect.do_commit(conn)
+        eq_(conn.cursor.mock_calls, [])
+
+        dialect.do_execute(
+            mock.Mock(), statement, [1], self._context(conn, statement)
+        )
+        dialect.do_commit(conn)
+        eq_(
+            conn.cursor.return_value.execute.mock_calls,
+            [mock.call(f"BEGIN\n{statement};\nEND;", [1])],
+        )
+        eq_(conn.commit.call_count, 2)
+
+    def test_flush_toggles_execution_option(self):
+        from sqlalchemy.orm import Session, declarative_base
+
+        from sqlalchemy_tibero import orm
+
+        Base = declarative_base()
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        seen = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            seen.append(
+                (
+                    stmt.split()[0],
+                    conn.get_execution_options().get("tibero_batch_flush"),
+                )
+            )
+
+        with Session(engine) as session:
+            orm.enable_flush_batching(session)
+            session.execute(select(A))
+            session.add(A(id=1))
+            session.flush()
+            session.execute(select(A))
+
+        eq_(seen, [("SELECT", None), ("INSERT", True), ("SELECT", False)])
+
+
+class SequencePrefetchTest(fixtures.TestBase):
+    def _context(self, dialect, rows, info=None):
+        context = _context(
+            dialect,
+            root_connection=mock.Mock(
+                info={} if info is None else info,
+                _is_autocommit_isolation=mock.Mock(return_value=False),
+            ),
+            cursor=mock.Mock(description=[("NEXTVAL", None)]),
+        )
+        context.cursor.fetchall.return_value = [(r,) for r in rows]
+        context.cursor.fetchone.return_value = (rows[0],)
+        return context
+
+    def _statements(self, context):
+        return [
+            c[1][1] for c in context.root_connection._cursor_execute.mock_calls
+        ]
+
+    def test_default_fetches_one_value(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        context = self._context(dialect, [1])
+
+        eq_(context.fire_sequence(Sequence("s"), None), 1)
+        eq_(self._statements(context), ["SELECT s.nextval FROM DUAL"])
+
+    def test_block_fetched_once(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(sequence_prefetch_size=3)
+        context = self._context(dialect, [1, 2, 3])
+
+        eq_(
+            [context.fire_sequence(Sequence("s"), None) for i in range(3)],
+            [1, 2, 3],
+        )
+        eq_(
+            self._statements(context),
+            ["SELECT s.nextval FROM DUAL CONNECT BY LEVEL <= 3"],
+        )
+
+        context.cursor.fetchall.return_value = [(4,), (5,), (6,)]
+        eq_(context.fire_sequence(Sequence("s"), None), 4)
+        eq_(len(self._statements(context)), 2)
+
+    def test_size_per_sequence(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            sequence_prefetch_sizes={"s": 5, "scott.t": 2}
+        )
+        context = self._context(dialect, [1, 2])
+
+        context.fire_sequence(Sequence("t", schema="scott"), None)
+        context.fire_sequence(Sequence("t"), None)
+        context.fire_sequence(Sequence("s"), None)
+
+        eq_(
+            self._statements(context),
+            [
+                "SELECT scott.t.nextval FROM DUAL CONNECT BY LEVEL <= 2",
+                "SELECT t.nextval FROM DUAL",
+                "SELECT s.nextval FROM DUAL CONNECT BY LEVEL <= 5",
+            ],
+        )
+
+    def _proxy(self, info):
+        return mock.Mock(
+            spec=pool.PoolProxiedConnection,
+            info=info,
+            dbapi_connection=mock.Mock(),
+            rollback=mock.Mock(),
+            commit=mock.Mock(),
+        )
+
+    @testing.combinations((True, 2), (False, 1), argnames="discard,fetches")
+    def test_discard_on_rollback(self, discard, fetches):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            sequence_prefetch_size=3,
+            sequence_prefetch_discard_on_rollback=discard,
+        )
+        info = {}
+        context = self._context(dialect, [1, 2, 3], info)
+
+        context.fire_sequence(Sequence("s"), None)
+        dialect.do_rollback(self._proxy(info))
+        context.fire_sequence(Sequence("s"), None)
+
+        eq_(len(self._statements(context)), fetches)
+
+    @testing.combinations("other", "committed", "autocommit", argnames="case")
+    def test_rollback_of_other_transaction_keeps_values(self, case):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            sequence_prefetch_size=3,
+            sequence_prefetch_discard_on_rollback=True,
+        )
+        info = {}
+        context = self._context(dialect, [1, 2, 3], info)
+        if case == "autocommit":
+            context.root_connection._is_autocommit_isolation.return_value = (
+                True
+            )
+
+        context.fire_sequence(Sequence("s"), None)
+        if case == "other":
+            # pool이 다른 connection을 돌려받을 때 하는 rollback입니다.
+            dialect.do_rollback(self._proxy({}))
+        elif case == "committed":
+            dialect.do_commit(self._proxy(info))
+            dialect.do_rollback(self._proxy(info))
+        else:
+            dialect.do_rollback(self._proxy(info))
+        eq_(context.fire_sequence(Sequence("s"), None), 2)
+
+        eq_(len(self._statements(context)), 1)
+
+    def test_rollback_discards_only_used_sequences(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            sequence_prefetch_size=3,
+            sequence_prefetch_discard_on_rollback=True,
+        )
+        other = self._context(dialect, [1, 2, 3])
+        other.fire_sequence(Sequence("t"), None)
+        info = {}
+        context = self._context(dialect, [11, 12, 13], info)
+        context.fire_sequence(Sequence("s"), None)
+
+        dialect.do_rollback(self._proxy(info))
+
+        eq_(other.fire_sequence(Sequence("t"), None), 2)
+        eq_(len(self._statements(other)), 1)
+        context.fire_sequence(Sequence("s"), None)
+        eq_(len(self._statements(context)), 2)
+
+
+class InsertmanyvaluesFormTest(fixtures.TestBase):
+    def _batches(self, stmt, rows, **kw):
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            paramstyle="qmark", use_insertmanyvalues_wo_returning=True, **kw
+        )
+        compiled = stmt.compile(
+            dialect=dialect, for_executemany=True, column_keys=["a", "b"]
+        )
+        return [
+            (batch.replaced_statement, batch.replaced_parameters)
+            for batch in compiled._deliver_insertmanyvalues_batches(
+                compiled.string,
+                [(i, "x") for i in range(rows)],
+                [{"a": i, "b": "x"} for i in range(rows)],
+                None,
+                1000,
+                False,
+                None,
+            )
+        ]
+
+    @testing.fixture
+    def t(self):
+        return Table(
+            "t", MetaData(), Column("a", Integer), Column("b", String(10))
+        )
+
+    @testing.combinations(
+        ("values", "INSERT INTO t (a, b) VALUES (?, ?), (?, ?)"),
+        (
+            "insert_all",
+            (
+                "INSERT ALL INTO t (a, b) VALUES (?, ?) "
+                "INTO t (a, b) VALUES (?, ?) SELECT 1 FROM DUAL"
+            ),
+        ),
+        (
+            "union_all",
+            (
+                "INSERT INTO t (a, b) SELECT ?, ? FROM DUAL "
+                "UNION ALL SELECT ?, ? FROM DUAL"
+            ),
+        ),
+        argnames="form,expected",
+    )
+    def test_form(self, t, form, expected):
+        eq_(
+            self._batches(t.insert(), 2, insertmanyvalues_form=form),
+            [(expected, (0, "x", 1, "x"))],
+        )
+
+    def test_returning_uses_values(self, t):
+        eq_(
+            self._batches(
+                t.insert().returning(t.c.a),
+                2,
+                insertmanyvalues_form="insert_all",
+            )[0][0],
+            "INSERT INTO t (a, b) VALUES (?, ?), (?, ?) RETURNING t.a INTO ?",
+        )
+
+    @testing.combinations(
+        ("values", 66, 5),
+        ("values", 65, 4),
+        ("insert_all", 100, 2),
+        ("union_all", 100, 2),
+        argnames="form,max_length,rows",
+    )
+    def test_batches_limited_by_sql_length(self, t, form, max_length, rows):
+        batches = self._batches(
+            t.insert(),
+            5,
+            insertmanyvalues_form=form,
+            insertmanyvalues_max_sql_length=max_length,
+        )
+
+        eq_(len(batches[0][1]), rows * 2)
+        is_true(all(len(stmt) <= max_length for stmt, _ in batches))
+
+    def test_batches_limited_by_parameters(self, t):
+        batches = self._batches(
+            t.insert(), 5, insertmanyvalues_max_parameters=4
+        )
+
+        eq_([len(params) for _, params in batches], [4, 4, 2])
+
+    def test_invalid_form(self):
+        with expect_raises_message(
+            exc.ArgumentError, "insertmanyvalues_form must be one of"
+        ):
+            pyodbc.TiberoDialect_pyodbc(insertmanyvalues_form="merge")
+
+
+class AdaptiveArraysizeTest(fixtures.TestBase):
+    def _post_exec(self, dialect, description, **execution_options):
+        context = _context(
+            dialect,
+            execution_options=execution_options,
+            cursor=mock.Mock(description=description, arraysize=50),
+        )
+        context.post_exec()
+        context.cursor_fetch_strategy.fetchmany(mock.Mock(), context.cursor)
+        return context.cursor.arraysize
+
+    @testing.combinations(
+        # 56 + 64 * 2 = 184 byte
+        ([("id", int, None, 10, 10, 0, True)] * 2, 5698),
+        # 56 + 64 + (64 + 4000) = 4184 byte
+        (
+            [
+                ("id", int, None, 10, 10, 0, True),
+                ("data", str, None, 4000, 4000, 0, True),
+            ],
+            250,
+        ),
+        # CLOB 칼럼
+        (
+            [
+                ("id", int, None, 10, 10, 0, True),
+                ("doc", str, None, 2147483647, 2147483647, 0, True),
+            ],
+            3,
+        ),
+        argnames="description,arraysize",
+    )
+    def test_sized_by_row_width(self, description, arraysize):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+
+        eq_(self._post_exec(dialect, description), arraysize)
+
+    def test_sized_on_first_fetchmany(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        description = mock.MagicMock()
+        context = _context(
+            dialect, cursor=mock.Mock(description=description, arraysize=50)
+        )
+        context.post_exec()
+
+        strategy = context.cursor_fetch_strategy
+        strategy.fetchone(mock.Mock(), context.cursor)
+        strategy.fetchmany(mock.Mock(), context.cursor, 10)
+        strategy.fetchall(mock.Mock(), context.cursor)
+        eq_(description.__iter__.call_count, 0)
+
+        with mock.patch.object(
+            dialect, "_adaptive_arraysize", return_value=7
+        ) as adaptive:
+            strategy.fetchmany(mock.Mock(), context.cursor)
+            strategy.fetchmany(mock.Mock(), context.cursor)
+
+        eq_(adaptive.mock_calls, [mock.call(description)])
+        eq_(context.cursor.arraysize, 7)
+
+    def test_minimum_one_row(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(arraysize_memory_limit=10)
+        description = [("id", int, None, 10, 10, 0, True)]
+
+        eq_(self._post_exec(dialect, description), 1)
+
+    @testing.combinations(
+        ({"arraysize": 20}, {}),
+        ({"arraysize_memory_limit": 0}, {}),
+        ({}, {"tibero_arraysize": 20}),
+        argnames="dialect_kw,execution_options",
+    )
+    def test_fixed_arraysize(self, dialect_kw, execution_options):
+        dialect = pyodbc.TiberoDialect_pyodbc(**dialect_kw)
+        description = [("id", int, None, 10, 10, 0, True)]
+
+        eq_(self._post_exec(dialect, description, **execution_options), 50)
+
+    def test_execution_option_on_cursor(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(arraysize=30)
+        context = mock.Mock(
+            dialect=dialect,
+            execution_options={"tibero_arraysize": 20},
+            unicode_statement="SELECT 1 FROM DUAL",
+        )
+
+        cursor = pyodbc.TiberoExecutionContext_pyodbc.create_default_cursor(
+            context
+        )
+
+        eq_(cursor.arraysize, 20)
+
+
+class StatementTimeoutTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _context(self, timeout):
+        return _context(
+            None,
+            root_connection=mock.Mock(engine=mock.Mock(hide_parameters=False)),
+            _tibero_timeout=timeout,
+        )
+
+    def test_execution_option_overrides_dialect(self):
+        dialect = pyodbc.TiberoDialect_pyodbc(statement_timeout=30)
+        for options, timeout in [({}, 30), ({"tibero_timeout": 2}, 2)]:
+            context = _context(dialect, execution_options=options)
+            context.pre_exec()
+            eq_(context._tibero_timeout, timeout)
+
+    def test_fast_statement_not_cancelled(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        cursor = mock.Mock()
+
+        dialect.do_execute(cursor, "SELECT 1", (), self._context(5))
+
+        cursor.execute.assert_called_once_with("SELECT 1", ())
+        cursor.cancel.assert_not_called()
+
+    def test_slow_statement_cancelled(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        cancelled = threading.Event()
+        cursor = mock.Mock()
+        cursor.cancel.side_effect = cancelled.set
+
+        def execute(statement, parameters):
+            cancelled.wait(5)
+            raise dialect.loaded_dbapi.OperationalError(
+                "HY008", "Operation canceled"
+            )
+
+        cursor.execute.side_effect = execute
+
+        with expect_raises_message(
+            pyodbc.StatementTimeoutError, "Operation canceled"
+        ) as err:
+            dialect.do_execute(cursor, "SELECT 1", (), self._context(0.05))
+
+        is_true(isinstance(err.error, exc.OperationalError))
+        is_true(cancelled.is_set())
+        eq_(err.error.statement, "SELECT 1")
+
+    def test_statement_without_parameters_cancelled(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        cancelled = threading.Event()
+        cursor = mock.Mock()
+        cursor.cancel.side_effect = cancelled.set
+
+        def execute(statement):
+            cancelled.wait(5)
+            raise fakeodbc.OperationalError("HY008", "Operation canceled")
+
+        cursor.execute.side_effect = execute
+
+        with expect_raises_message(
+            pyodbc.StatementTimeoutError, "Operation canceled"
+        ):
+            dialect.do_execute_no_params(
+                cursor, "SELECT 1", self._context(0.05)
+            )
+
+        is_true(cancelled.is_set())
+
+    def test_other_errors_not_mapped(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        cursor = mock.Mock()
+        cursor.execute.side_effect = fakeodbc.ProgrammingError("42000")
+
+        with expect_raises_message(fakeodbc.ProgrammingError, "42000"):
+            dialect.do_execute(cursor, "SELECT", (), self._context(5))
+
+    def test_failed_cancel_not_reported_as_timeout(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        attempted = threading.Event()
+        cursor = mock.Mock()
+
+        def cancel():
+            attempted.set()
+            raise fakeodbc.OperationalError("HY010", "Function sequence")
+
+        def execute(statement, parameters):
+            attempted.wait(5)
+
+        cursor.cancel.side_effect = cancel
+        cursor.execute.side_effect = execute
+
+        with testing.expect_warnings("Could not cancel statement"):
+            dialect.do_execute(cursor, "SELECT 1", (), self._context(0.05))
+
+        is_true(attempted.is_set())
+
+    def test_unexpected_cancel_error_logged(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        dialect.loaded_dbapi = fakeodbc
+        attempted = threading.Event()
+        cursor = mock.Mock()
+
+        def cancel():
+            attempted.set()
+            raise RuntimeError("cursor is broken")
+
+        def execute(statement, parameters):
+            attempted.wait(5)
+
+        cursor.cancel.side_effect = cancel
+        cursor.execute.side_effect = execute
+
+        with mock.patch.object(pyodbc.log, "exception") as log_exception:
+            dialect.do_execute(cursor, "SELECT 1", (), self._context(0.05))
+
+        log_exception.assert_called_once_with("Could not cancel statement")
+        # watchdog thread는 다음 문장도 계속 감시합니다.
+        self.test_slow_statement_cancelled()
+
+    def test_unwatch_waits_for_cancel(self):
+        watchdog = pyodbc._Watchdog()
+        started = threading.Event()
+        release = threading.Event()
+        cursor = mock.Mock()
+
+        def cancel():
+            started.set()
+            release.wait(5)
+
+        cursor.cancel.side_effect = cancel
+        entry = watchdog.watch(cursor, 0)
+        is_true(started.wait(5))
+
+        # cancel()이 끝난 후에 반환해야 cursor를 다른 문장에 재사용할 수 있습니다.
+        threading.Timer(0.05, release.set).start()
+        is_true(watchdog.unwatch(entry))
+        is_true(release.is_set())
+        is_(entry[2], None)
+
+
+class ResultCacheTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _tables(self):
+        metadata = MetaData()
+        return (
+            Table("a", metadata, Column("id", Integer), schema="scott"),
+            Table("b", metadata, Column("id", Integer)),
+        )
+
+    def _execute(
+        self,
+        dialect,
+        stmt,
+        parameters,
+        rows,
+        info=None,
+        autocommit=False,
+        **options,
+    ):
+        if isinstance(stmt, str):
+            # exec_driver_sql()로 실행한 문장입니다.
+            compiled, statement, is_crud = None, stmt, False
+        else:
+            compiled = stmt.compile(dialect=dialect)
+            statement, is_crud = compiled.string, stmt.is_dml
+        context = _context(
+            dialect,
+            compiled=compiled,
+            statement=statement,
+            parameters=[parameters],
+            execution_options=options,
+            is_crud=is_crud,
+            isddl=False,
+        )
+        # info는 connection record의 info이며 지정하지 않으면 다른 connection에서
+        # 실행한 것과 같습니다.
+        context.root_connection = mock.Mock(
+            info=info if info is not None else {},
+            **{"_is_autocommit_isolation.return_value": autocommit},
+        )
+        context.cursor = mock.Mock(
+            description=[("ID", int, None, 10, 10, 0, True)]
+        )
+        context.cursor.fetchall.return_value = [[r] for r in rows]
+
+        context.pre_exec()
+        dialect.do_execute(context.cursor, context.statement, (), context)
+        context.post_exec()
+        return context
+
+    def _rows(self, context):
+        strategy = context.cursor_fetch_strategy
+        if isinstance(strategy, _cursor.FullyBufferedCursorFetchStrategy):
+            return list(strategy._rowbuffer)
+        return [tuple(row) for row in context.cursor.fetchall()]
+
+    def test_cached_by_statement_and_parameters(self):
+        a, _ = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        stmt = select(a.c.id).where(a.c.id > 0)
+
+        first = self._execute(
+            dialect, stmt, {"id_1": 0}, [1, 2], tibero_result_cache=True
+        )
+        second = self._execute(
+            dialect, stmt, {"id_1": 0}, [3], tibero_result_cache=True
+        )
+        other = self._execute(
+            dialect, stmt, {"id_1": 1}, [2], tibero_result_cache=True
+        )
+
+        eq_(self._rows(first), [(1,), (2,)])
+        eq_(self._rows(second), [(1,), (2,)])
+        eq_(second.cursor.execute.mock_calls, [])
+        eq_(self._rows(other), [(2,)])
+
+    def test_not_cached_without_option(self):
+        a, _ = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        stmt = select(a.c.id)
+
+        self._execute(dialect, stmt, {}, [1], tibero_result_cache=True)
+        context = self._execute(dialect, stmt, {}, [2])
+
+        context.cursor.execute.assert_called_once_with(context.statement, ())
+        context.cursor.fetchall.assert_not_called()
+
+    def test_ttl(self):
+        a, b = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(
+            result_cache_size=10, result_cache_ttl=10
+        )
+        stmt = select(a.c.id)
+
+        with mock.patch("sqlalchemy_tibero.base.time.monotonic") as now:
+            now.return_value = 100
+            self._execute(dialect, stmt, {}, [1], tibero_result_cache=True)
+            self._execute(
+                dialect, select(b.c.id), {}, [1], tibero_result_cache=5
+            )
+            now.return_value = 108
+            eq_(
+                self._rows(
+                    self._execute(
+                        dialect, stmt, {}, [2], tibero_result_cache=True
+                    )
+                ),
+                [(1,)],
+            )
+            eq_(
+                self._rows(
+                    self._execute(
+                        dialect,
+                        select(b.c.id),
+                        {},
+                        [2],
+                        tibero_result_cache=5,
+                    )
+                ),
+                [(2,)],
+            )
+
+    def test_lru_size(self):
+        a, b = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=1)
+
+        self._execute(dialect, select(a.c.id), {}, [1], tibero_result_cache=1)
+        self._execute(dialect, select(b.c.id), {}, [1], tibero_result_cache=1)
+        context = self._execute(
+            dialect, select(a.c.id), {}, [2], tibero_result_cache=1
+        )
+
+        eq_(self._rows(context), [(2,)])
+
+    @testing.combinations(
+        (("scott.a",), [(2,)], [(1,)]),
+        (("A",), [(2,)], [(1,)]),
+        (("b",), [(1,)], [(2,)]),
+        ((), [(2,)], [(2,)]),
+        argnames="names,a_rows,b_rows",
+    )
+    def test_invalidate(self, names, a_rows, b_rows):
+        tables = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        for t in tables:
+            self._execute(
+                dialect, select(t.c.id), {}, [1], tibero_result_cache=True
+            )
+
+        dialect.invalidate_result_cache(*names)
+
+        for t, rows in zip(tables, (a_rows, b_rows)):
+            context = self._execute(
+                dialect, select(t.c.id), {}, [2], tibero_result_cache=True
+            )
+            eq_(self._rows(context), rows)
+
+    def test_disabled_by_default(self):
+        a, _ = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        stmt = select(a.c.id)
+
+        is_(dialect._result_cache, None)
+        self._execute(dialect, stmt, {}, [1], tibero_result_cache=True)
+        context = self._execute(
+            dialect, stmt, {}, [2], tibero_result_cache=True
+        )
+
+        context.cursor.execute.assert_called_once_with(context.statement, ())
+
+    def _proxy(self, info):
+        return mock.Mock(
+            spec=pool.PoolProxiedConnection,
+            info=info,
+            dbapi_connection=mock.Mock(),
+            commit=mock.Mock(),
+            rollback=mock.Mock(),
+        )
+
+    @testing.combinations("do_commit", "do_rollback", argnames="end")
+    def test_invalidated_when_transaction_ends(self, end):
+        a, b = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        info = {}
+        for t in (a, b):
+            self._execute(
+                dialect, select(t.c.id), {}, [1], tibero_result_cache=True
+            )
+
+        self._execute(dialect, a.delete(), {}, [], info=info)
+
+        # commit하기 전에는 다른 connection이 변경을 볼 수 없습니다.
+        context = self._execute(
+            dialect, select(a.c.id), {}, [2], tibero_result_cache=True
+        )
+        eq_(self._rows(context), [(1,)])
+
+        getattr(dialect, end)(self._proxy(info))
+
+        eq_(info, {})
+        for t, rows in ((a, [(2,)]), (b, [(1,)])):
+            context = self._execute(
+                dialect, select(t.c.id), {}, [2], tibero_result_cache=True
+            )
+            eq_(self._rows(context), rows)
+
+    def test_not_used_with_pending_writes(self):
+        a, b = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        info = {}
+        self._execute(
+            dialect, select(b.c.id), {}, [1], tibero_result_cache=True
+        )
+        self._execute(dialect, a.delete(), {}, [], info=info)
+
+        # 변경한 connection의 결과는 저장하지 않고 저장된 결과도 사용하지 않습니다.
+        for t in (a, b):
+            context = self._execute(
+                dialect,
+                select(t.c.id),
+                {},
+                [2],
+                info=info,
+                tibero_result_cache=True,
+            )
+            eq_(self._rows(context), [(2,)])
+
+        context = self._execute(
+            dialect, select(a.c.id), {}, [3], tibero_result_cache=True
+        )
+        eq_(self._rows(context), [(3,)])
+
+    @testing.combinations(
+        (text("DELETE FROM scott.a"),),
+        ("UPDATE b SET id = 2",),
+        ("BEGIN scott.p(); END;",),
+        argnames="stmt",
+    )
+    def test_uncompiled_write_invalidates_all(self, stmt):
+        a, b = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        info = {}
+        for t in (a, b):
+            self._execute(
+                dialect, select(t.c.id), {}, [1], tibero_result_cache=True
+            )
+
+        self._execute(dialect, stmt, {}, [], info=info)
+
+        # 변경한 테이블을 알 수 없으므로 이 connection은 cache를 사용하지 않습니다.
+        context = self._execute(
+            dialect,
+            select(a.c.id),
+            {},
+            [2],
+            info=info,
+            tibero_result_cache=True,
+        )
+        eq_(self._rows(context), [(2,)])
+
+        dialect.do_commit(self._proxy(info))
+
+        eq_(info, {})
+        for t in (a, b):
+            context = self._execute(
+                dialect, select(t.c.id), {}, [3], tibero_result_cache=True
+            )
+            eq_(self._rows(context), [(3,)])
+
+    @testing.combinations(
+        (text("SELECT id FROM scott.a"),),
+        ("WITH x AS (SELECT 1 FROM DUAL) SELECT * FROM x",),
+        argnames="stmt",
+    )
+    def test_uncompiled_read_not_a_write(self, stmt):
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        info = {}
+
+        self._execute(dialect, stmt, {}, [1], info=info)
+
+        eq_(info, {})
+
+    def test_not_stored_after_concurrent_invalidation(self):
+        a, _ = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        stmt = select(a.c.id)
+
+        def execute(statement, parameters):
+            # 다른 connection이 실행 중에 commit한 경우입니다.
+            dialect.invalidate_result_cache(a)
+
+        with mock.patch.object(dialect, "do_execute") as do_execute:
+            do_execute.side_effect = lambda cursor, *args: execute(*args[:2])
+            self._execute(dialect, stmt, {}, [1], tibero_result_cache=True)
+
+        context = self._execute(
+            dialect, stmt, {}, [2], tibero_result_cache=True
+        )
+        eq_(self._rows(context), [(2,)])
+
+    def test_autocommit_invalidates_immediately(self):
+        a, _ = self._tables()
+        dialect = pyodbc.TiberoDialect_pyodbc(result_cache_size=10)
+        info = {}
+        self._execute(
+            dialect, select(a.c.id), {}, [1], tibero_result_cache=True
+        )
+
+        self._execute(dialect, a.delete(), {}, [], info=info, autocommit=True)
+
+        eq_(info, {})
+        context = self._execute(
+            dialect, select(a.c.id), {}, [2], tibero_result_cache=True
+        )
+        eq_(self._rows(context), [(2,)])
+
+
+class StatementMetricsTest(fixtures.TestBase):
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _context(self, dialect, stmt, cache_hit):
+        compiled = stmt.compile(dialect=dialect)
+        return _context(
+            dialect,
+            compiled=compiled,
+            statement=compiled.string,
+            cache_hit=cache_hit,
+        )
+
+    def _table(self):
+        return Table("t", MetaData(), Column("id", Integer))
+
+    def test_disabled_by_default(self):
+        dialect = pyodbc.TiberoDialect_pyodbc()
+        context = self._context(
+            dialect,
+            select(self._table().c.id),
+            interfaces.CacheStats.CACHE_MISS,
+        )
+
+        cursor = context.create_cursor()
+
+        is_(cursor, context._dbapi_connection.cursor.return_value)
+        is_(context._tibero_metrics, None)
+        is_(context.compiled._tibero_compile_time, None)
+
+    def test_counts_rows_bytes_and_round_trips(self):
+        sink = mock.Mock()
+        dialect = pyodbc.TiberoDialect_pyodbc(metrics_sink=sink)
+        context = self._context(
+            dialect,
+            select(self._table().c.id),
+            interfaces.CacheStats.CACHE_MISS,
+        )
+        dbapi_cursor = context._dbapi_connection.cursor.return_value
+        dbapi_cursor.fetchmany.return_value = [(1, "abc"), (2, None)]
+        dbapi_cursor.fetchone.return_value = None
+
+        cursor = context.create_cursor()
+        cursor.execute(context.statement, ())
+        eq_(cursor.fetchmany(10), [(1, "abc"), (2, None)])
+        is_(cursor.fetchone(), None)
+        sink.assert_not_called()
+        cursor.close()
+
+        dbapi_cursor.close.assert_called_once_with()
+        sink.assert_called_once_with(context._tibero_metrics)
+        metrics = context._tibero_metrics
+        eq_(metrics.statement, context.statement)
+        eq_(metrics.executemany, False)
+        eq_(metrics.cache_hit, False)
+        is_true(metrics.compile_time >= 0)
+        eq_(metrics.rows, 2)
+        eq_(metrics.bytes, 8 + 3 + 8)
+        eq_(metrics.round_trips, 3)
+
+    def test_bind_time(self):
+        sink = mock.Mock()
+        dialect = pyodbc.TiberoDialect_pyodbc(metrics_sink=sink)
+        stmt = select(self._table().c.id)
+
+        context = pyodbc.TiberoExecutionContext_pyodbc._init_compiled(
+            dialect,
+            mock.Mock(dialect=dialect),
+            mock.Mock(),
+            {},
+            stmt.compile(dialect=dialect),
+            [{}],
+            stmt,
+            None,
+        )
+
+        is_true(isinstance(context.cursor, pyodbc._MetricsCursor))
+        is_true(context._tibero_metrics.bind_time > 0)
+
+    def test_compile_time_not_reported_on_cache_hit(self):
+        sink = mock.Mock()
+        dialect = pyodbc.TiberoDialect_pyodbc(metrics_sink=sink)
+        context = self._context(
+            dialect,
+            select(self._table().c.id),
+            interfaces.CacheStats.CACHE_HIT,
+        )
+
+        context.create_cursor().close()
+
+        eq_(sink.mock_calls[0].args[0].cache_hit, True)
+        is_(sink.mock_calls[0].args[0].compile_time, None)
+
+    def test_reported_after_result_setup(self):
+        sink = mock.Mock()
+        dialect = pyodbc.TiberoDialect_pyodbc(metrics_sink=sink)
+        context = self._context(
+            dialect,
+            self._table().insert(),
+            interfaces.CacheStats.CACHE_MISS,
+        )
+        context.cursor = context.create_cursor()
+
+        def setup_result_proxy(self):
+            # DML의 결과는 rowcount만 읽고 바로 cursor를 닫습니다.
+            self.cursor.close()
+            sink.assert_not_called()
+            return "result"
+
+        with mock.patch.object(
+            pyodbc.TiberoExecutionContext,
+            "_setup_result_proxy",
+            setup_result_proxy,
+        ):
+            eq_(context._setup_result_proxy(), "result")
+
+        sink.assert_called_once_with(context._tibero_metrics)
+        is_true(context._tibero_metrics.result_time >= 0)
+
+
+class FakeODBCTest(fixtures.TestBase):
+    """Run the dialect end to end on test/fakeodbc.py."""
+
+    def teardown_test(self):
+        pyodbc._session_states.clear()
+
+    def _engine(self, **kw):
+        engine = fakeodbc.create_engine(**kw)
+        self.table.metadata.create_all(engine)
+        return engine
+
+    @property
+    def table(self):
+        return Table(
+            "fake_t",
+            MetaData(),
+            Column("id", Integer, Sequence("fake_t_seq"), primary_key=True),
+            Column("name", String(30)),
+            Column("amount", Numeric(10, 2)),
+            Column("created", DateTime),
+        )
+
+    def test_round_trip_and_reflection(self):
+        engine = self._engine()
+        table = self.table
+        created = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [
+                    {
+                        "name": "a",
+                        "amount": decimal.Decimal("1.25"),
+                        "created": created,
+                    },
+                    {"name": "b", "amount": None, "created": None},
+                ],
+            )
+        with engine.connect() as conn:
+            eq_(
+                conn.execute(select(table).order_by(table.c.id)).all(),
+                [
+                    (1, "a", decimal.Decimal("1.25"), created),
+                    (2, "b", None, None),
+                ],
+            )
+
+        inspector = inspect(engine)
+        is_true(inspector.has_table("fake_t"))
+        eq_(inspector.get_sequence_names(), ["fake_t_seq"])
+        eq_(
+            [c["name"] for c in inspector.get_columns("fake_t")],
+            ["id", "name", "amount", "created"],
+        )
+        eq_(
+            inspector.get_pk_constraint("fake_t")["constrained_columns"],
+            ["id"],
+        )
+
+    def test_executemany_round_trips(self):
+        table = self.table
+        rows = [{"id": i, "name": str(i)} for i in range(10)]
+        for fast_executemany, expected in ((False, 10), (True, 1)):
+            engine = self._engine(fast_executemany=fast_executemany)
+            dbapi = engine.dialect.dbapi
+            with engine.connect() as conn:
+                dbapi.reset()
+                conn.execute(table.insert(), rows)
+                eq_(dbapi.round_trips, expected)
+
+    def test_batch_flush(self):
+        engine = self._engine()
+        table = self.table
+        dbapi = engine.dialect.dbapi
+
+        with engine.connect() as conn:
+            conn.execute(table.insert(), [{"id": 1}, {"id": 2}])
+            conn = conn.execution_options(tibero_batch_flush=True)
+            dbapi.reset()
+            for id_ in (1, 2):
+                conn.execute(
+                    table.update()
+                    .where(table.c.id == id_)
+                    .values(name=f"n{id_}")
+                )
+            eq_(dbapi.round_trips, 0)
+
+            eq_(
+                conn.scalars(select(table.c.name).order_by(table.c.id)).all(),
+                ["n1", "n2"],
+            )
+            # 블록 1번, SELECT 실행과 fetch 각각 1번입니다.
+            eq_(dbapi.round_trips, 3)
+
+            conn.execute(
+                table.update().where(table.c.id == 3).values(name="x")
+            )
+            with expect_raises_message(exc.DBAPIError, "matched 0 row"):
+                engine.dialect.execute_batch(conn)
+
+    def test_executemany_returning(self):
+        engine = self._engine()
+        table = self.table
+        dbapi = engine.dialect.dbapi
+
+        with engine.begin() as conn:
+            conn.execute(
+                table.insert(),
+                [{"id": i, "name": n} for i, n in enumerate("abbcd", 1)],
+            )
+            dbapi.reset()
+            result = conn.execute(
+                table.update()
+                .where(table.c.name == bindparam("old"))
+                .values(name=bindparam("new"))
+                .returning(table.c.id, table.c.name),
+                [
+                    {"old": "d", "new": "x"},
+                    {"old": "z", "new": "y"},
+                    {"old": "b", "new": "z"},
+                    {"old": "a", "new": "w"},
+                ],
+            )
+            # 매칭되는 행이 없는 parameter set을 포함해 순서대로 돌려줍니다.
+            eq_(
+                result.all(),
+                [(5, "x"), (2, "z"), (3, "z"), (1, "w")],
+            )
+            eq_(result.rowcount, 4)
+            # 블록 실행 1번과 결과 집합 4개의 fetch 각각 1번입니다.
+            eq_(dbapi.round_trips, 5)
+
+            result = conn.execute(
+                table.delete()
+                .where(table.c.name == bindparam("old"))
+                .returning(table.c.id),
+                [{"old": "z"}, {"old": "c"}],
+            )
+            eq_(result.scalars().all(), [2, 3, 4])
+            eq_(
+                conn.scalars(select(table.c.id).order_by(table.c.id)).all(),
+                [1, 5],
+            )
+
+    def test_latency(self):
+        engine = self._engine(latency=0.01)
+        dbapi = engine.dialect.dbapi
+
+        with engine.connect() as conn:
+            dbapi.reset()
+            start = time.perf_counter()
+            conn.execute(select(self.table)).all()
+            elapsed = time.perf_counter() - start
+            eq_(dbapi.round_trips, 2)
+
+        is_true(elapsed >= 0.02)
+
+
+class LazyImportTest(fixtures.TestBase):
+    def _modules_after(self, code):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys; {code}; print(' '.join(sorted(sys.modules)))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return set(output.split())
+
+    def test_import_defers_driver_and_dictionary(self):
+        modules = self._modules_after("import sqlalchemy_tibero")
+
+        for name in (
+            "pyodbc",
+            "sqlalchemy_tibero.pyodbc",
+            "sqlalchemy_tibero.aioodbc",
+            "sqlalchemy_tibero.dictionary",
+        ):
+            is_true(name not in modules, name)
+
+    def test_dialect_loaded_on_first_use(self):
+        modules = self._modules_after(
+            "import sqlalchemy_tibero; sqlalchemy_tibero.dialect"
+        )
+
+        is_true("sqlalchemy_tibero.pyodbc" in modules)
+        is_true("pyodbc" not in modules)
+        is_true("sqlalchemy_tibero.dictionary" not in modules)
+
+    def test_base_dialect(self):
+        from sqlalchemy_tibero import base
+
+        is_(base.dialect, pyodbc.TiberoDialect_pyodbc)
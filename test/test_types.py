@@ -1256,11 +1256,12 @@ class SetInputSizesTest(fixtures.TestBase):
     __only_on__ = "oracle+pyodbc"
     __backend__ = True
 
-    # oracle driver는 do_set_input_sizes()를 재정의했습니다. 하지만
-    # tibero는 SQLALchemy에서 제공해주는 PyODBCConnector()의
-    # do_set_input_sizes()를 그대로 사용하기 때문에 테스트할 필요가 없습니다.
-    # 테스트를 남긴 이유는 oracle dialect가 이러한 테스트를 가지고 있음을
-    # 보여주기 위함입니다.
+    # oracle driver는 do_set_input_sizes()를 재정의했습니다. tibero도
+    # fast_executemany를 위해 재정의했지만 oracle 테스트는 cx_Oracle의 타입을
+    # 기준으로 작성되어 있어 그대로 사용할 수 없습니다. tibero의
+    # do_set_input_sizes()는 test/test_dialect.py::FastExecutemanyTest에서
+    # 테스트합니다. 테스트를 남긴 이유는 oracle dialect가 이러한 테스트를 가지고
+    # 있음을 보여주기 위함입니다.
     def _test_setinputsizes(
         self, metadata, datatype, value, sis_value_text, set_nchar_flag
     ):
@@ -1273,3 +1274,69 @@ class SetInputSizesTest(fixtures.TestBase):
     # 보여주기 위함입니다.
     def _test_event_no_native_float(self, metadata):
         pass
+
+
+class ResultProcessorTest(fixtures.TestBase):
+    @testing.combinations(
+        (Integer(), int, None),
+        (Integer(), decimal.Decimal, decimal.Decimal(5)),
+        (Numeric(asdecimal=False), float, None),
+        (Numeric(asdecimal=False), decimal.Decimal, decimal.Decimal(5)),
+        (Numeric(asdecimal=True), decimal.Decimal, None),
+        (Numeric(asdecimal=True), float, 5.0),
+        (Date(), datetime.date, None),
+        (Date(), datetime.datetime, datetime.datetime(2024, 10, 17, 12)),
+        argnames="type_, coltype, value",
+    )
+    def test_processor_from_coltype(self, type_, coltype, value):
+        dialect = pyodbc.dialect()
+        processor = type_.dialect_impl(dialect).result_processor(
+            dialect, coltype
+        )
+
+        if value is None:
+            is_(processor, None)
+        else:
+            assert processor is not None
+            eq_(processor(None), None)
+            eq_(
+                processor(value),
+                {
+                    Integer: 5,
+                    Numeric: 5,
+                    Date: datetime.date(2024, 10, 17),
+                }[type(type_)],
+            )
+
+
+class TimestampBindTest(fixtures.TestBase):
+    class FakeDBAPI:
+        SQL_TYPE_TIMESTAMP = 93
+
+    def test_native_bind(self):
+        dialect = pyodbc.dialect()
+        impl = TIMESTAMP().dialect_impl(dialect)
+
+        is_(impl.bind_processor(dialect), None)
+        eq_(impl.get_dbapi_type(self.FakeDBAPI), (93, 26, 6))
+
+    def test_timezone_bound_as_string(self):
+        dialect = pyodbc.dialect()
+        impl = TIMESTAMP(timezone=True).dialect_impl(dialect)
+        value = datetime.datetime(
+            2024, 10, 17, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+        )
+
+        eq_(
+            impl.bind_processor(dialect)(value),
+            "2024-10-17 12:30:15.123456+00:00",
+        )
+        eq_(impl.get_dbapi_type(self.FakeDBAPI), 93)
+
+
+class LOBBindTest(fixtures.TestBase):
+    @testing.combinations(LargeBinary(), Text(), UnicodeText())
+    def test_no_processor(self, type_):
+        dialect = pyodbc.dialect()
+
+        is_(type_.dialect_impl(dialect).bind_processor(dialect), None)